@@ -0,0 +1,38 @@
+import os
+
+import pygame
+
+from src.plugins.asset_baker import AssetBaker, BakedAssets, VIDEO_EXTENSIONS
+from src.plugins.asset_manifest import AssetManifest
+from src.plugins.audio_cache import AudioCache
+from src.star_config import StarConfig
+
+
+def bake_assets():
+    """
+    Pre-scale all images and transcode all videos referenced in the data files to the engine resolution (see AssetBaker),
+    generate the asset manifest validated at boot (see AssetManifest) and extract the audio of all videos.
+    run it again after assets or the resolution changed, the game falls back to the originals for stale assets.
+    """
+    # no window is needed for baking
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+
+    config = StarConfig("data/star_config.json")
+    baker = AssetBaker("data", config.baked_assets_directory, (config.width, config.height), config.video_fps)
+    baked_manifest = baker.bake()
+    AssetManifest.generate(baker.collect_asset_paths(), config.asset_manifest_path, baked_manifest)
+
+    # the audio is extracted from the video which is actually played
+    baked_assets = BakedAssets(config.baked_assets_directory, (config.width, config.height), config.video_fps)
+    # keyed by the source hashes like the audio cache of the engine
+    audio_cache = AudioCache(baked_assets=baked_assets)
+    for path in baker.collect_asset_paths():
+        if path.lower().endswith(VIDEO_EXTENSIONS) and os.path.isfile(path):
+            audio_cache.extract(baked_assets.resolve(path))
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    bake_assets()
@@ -0,0 +1,168 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import time
+from typing import List
+
+import pygame
+
+from src.games.game_data import GameData
+from src.games.story_game import StoryGame
+from src.mini_games.asteroid_dodge.asteroid_dodge_mini_game import AsteroidDodgeMiniGame
+from src.mini_games.bubble_pop_challenge.bubble_pop_challenge_mini_game import BubblePopChallengeMiniGame
+from src.mini_games.cable_connection.cable_connection_mini_game import CableConnectionMiniGame
+from src.mini_games.magical_orbs_connection.magical_orbs_connection import MagicalOrbsConnectionMiniGame
+from src.plugins.scene_benchmark import Scenario, SceneBenchmark
+from src.scenes.cutscene_scene import CutsceneScene
+from src.star_config import StarConfig
+from src.star_engine import StarEngine
+from src.views.common.info_view import InfoView
+from src.views.decisions.final_decision_view import FinalDecisionView
+from src.views.decisions.story_decision_view import StoryDecisionView
+from src.views.event.event_view import EventView
+from src.views.event.events_active_view import EventsActiveView
+from src.views.inventory.inventory_view import InventoryView
+from src.views.mini_games.mini_game_start_menu import MiniGameStartMenu
+from src.views.object.object_found_view import ObjectFoundView
+from src.views.planet.planet_menu import PlanetMenu
+from src.views.planet.planet_station_menu import PlanetStationMenu
+from src.views.planet.spacestation_menu import SpacestationMenu
+from src.views.quiz.boolean_view import BooleanView
+from src.views.quiz.error_view import ErrorView
+from src.views.quiz.quiz_view import QuizView
+from src.views.quiz.task_view import TaskView
+from src.views.states.game_over_view import GameOverView
+from src.views.story.story_block_view import StoryBlockView
+from src.views.story.story_view import StoryView
+
+
+def create_events_active_view(game: StoryGame) -> EventsActiveView:
+    # the menu is shown as long as it is open in the event manager
+    game.event_manager.is_open = True
+    return EventsActiveView(game, game.engine.config.inventory_background_paths[0],
+                            game.engine.config.event_panel_background_path)
+
+
+def create_inventory_view(game: StoryGame) -> InventoryView:
+    # the menu is shown as long as it is open in the inventory manager
+    game.inventory_manager.is_open = True
+    return InventoryView(game, game.engine.config.inventory_background_paths[0],
+                         game.engine.config.inventory_panel_background_path,
+                         game.engine.config.inventory_empty_slot_path)
+
+
+def create_scenarios(data: GameData, config: StarConfig) -> List[Scenario]:
+    """
+    One scenario per view and mini game, shown with the first matching entries of the game data.
+    """
+    planets = data.planets
+    start_planet = next(planet for planet in planets if planet.is_start_planet)
+    planet = next(planet for planet in planets if
+                  not planet.is_start_planet and not planet.is_end_planet and not planet.is_spacestation)
+    spacestation = next(planet for planet in planets if planet.is_spacestation)
+    story_blocks = [(planet_name, block) for planet_name, story in data.story_segments.items() for block in story.blocks]
+    story_block = next(block for _, block in story_blocks if block.block_type == "story")
+    story_decision = next(block for _, block in story_blocks if block.block_type == "story_decision")
+    final_decision = next(block for _, block in story_blocks if block.block_type == "final_decision")
+    quizzes = [quiz for planet_quizzes in data.planet_quizzes.values() for quiz in planet_quizzes]
+    quiz = next(quiz for quiz in quizzes if quiz.quiz_type == "quiz")
+    task = next(quiz for quiz in quizzes if quiz.quiz_type == "task")
+    boolean = next(quiz for quiz in quizzes if quiz.quiz_type == "boolean")
+    game_object = data.game_objects[0]
+    object_planet = next(planet for planet in planets if planet.name.lower() == game_object.location.lower())
+    mini_game_background = config.mini_game_menu_backgrounds[0]
+
+    return [
+        ("CutsceneScene", lambda game: CutsceneScene(game, start_planet.cutscene_media), False),
+        ("PlanetMenu", lambda game: PlanetMenu(game, planet), False),
+        ("PlanetStationMenu", lambda game: PlanetStationMenu(game, planet), False),
+        ("SpacestationMenu", lambda game: SpacestationMenu(game, spacestation), False),
+        ("StoryBlockView", lambda game: StoryBlockView(game, start_planet, story_block), False),
+        ("StoryView", lambda game: StoryView(game, start_planet, story_block.story_lines[0]), False),
+        ("StoryDecisionView", lambda game: StoryDecisionView(game, story_decision.decision), False),
+        ("FinalDecisionView", lambda game: FinalDecisionView(game, final_decision.decision), False),
+        ("QuizView", lambda game: QuizView(game, quiz), False),
+        ("TaskView", lambda game: TaskView(game, task), False),
+        ("BooleanView", lambda game: BooleanView(game, boolean), False),
+        ("ErrorView", lambda game: ErrorView(game, task), False),
+        ("InfoView", lambda game: InfoView(game, "Tanken", config.planet_menu_fuel_station_image_path,
+                                           config.planet_menu_fuel_station_background_image_paths[0],
+                                           "Die Minerva wird aufgetankt.", "Akzeptieren"), False),
+        ("EventView", lambda game: EventView(game, data.event_cards[0]), False),
+        ("EventsActiveView", create_events_active_view, False),
+        ("InventoryView", create_inventory_view, False),
+        ("ObjectFoundView", lambda game: ObjectFoundView(game, object_planet, game_object), False),
+        ("MiniGameStartMenu", lambda game: MiniGameStartMenu(game, mini_game_background, "Minispiel",
+                                                             "Benchmark", "starten"), False),
+        ("GameOverView", lambda game: GameOverView(game, config.game_over_default_background_paths[0]), False),
+        ("AsteroidDodgeMiniGame", lambda game: AsteroidDodgeMiniGame(game, mini_game_background), True),
+        ("BubblePopChallengeMiniGame", lambda game: BubblePopChallengeMiniGame(game, mini_game_background), True),
+        ("CableConnectionMiniGame", lambda game: CableConnectionMiniGame(game, mini_game_background, 8), True),
+        ("MagicalOrbsConnectionMiniGame",
+         lambda game: MagicalOrbsConnectionMiniGame(game, mini_game_background, 8), True),
+    ]
+
+
+def get_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(output_path: str, frames: int, seed: int, scene_names: List[str]):
+    """
+    Start the engine headless (SDL dummy drivers), run every view and mini game with a scripted input stream
+    (see SceneBenchmark) and write the load times, frame times and allocations as JSON report.
+    run it on the same machine for the commits to compare, the frame rate is the one of star_config.json.
+    """
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+    config = StarConfig("data/star_config.json")
+    config.full_screen = False
+    # the benchmark machine has no game board
+    config.hardware_input = False
+
+    startup_start = time.perf_counter()
+    engine = StarEngine(config)
+    data = GameData(config)
+    game = StoryGame(engine, data)
+    # the game starts with the story of the start planet, the scenarios are shown on the game board instead
+    engine.clear_scenes()
+    startup_time = time.perf_counter() - startup_start
+
+    scenarios = create_scenarios(data, config)
+    if scene_names:
+        scenarios = [scenario for scenario in scenarios if scenario[0] in scene_names]
+    benchmark = SceneBenchmark(game, frames, seed)
+    report = {
+        "commit": get_commit(),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "machine": platform.machine(),
+        "resolution": [engine.width, engine.height],
+        "fps": engine.fps,
+        "frames": frames,
+        "seed": seed,
+        "startup_ms": round(startup_time * 1000, 3),
+        "scenes": benchmark.run(scenarios),
+    }
+
+    with open(output_path, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    print(f"[Benchmark] report written to {output_path}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless benchmark of all views and mini games")
+    parser.add_argument("--output", default="benchmark.json", help="path of the JSON report")
+    parser.add_argument("--frames", type=int, default=120, help="frames per view and mini game")
+    parser.add_argument("--seed", type=int, default=1, help="seed of the scripted input")
+    parser.add_argument("scenes", nargs="*", help="names of the views and mini games to run, all by default")
+    arguments = parser.parse_args()
+    run_benchmark(arguments.output, arguments.frames, arguments.seed, arguments.scenes)
@@ -18,18 +18,24 @@ def main():
     ##### init game engine #####
     engine = StarEngine(config)
 
-    ##### run system check #####
-    if sys.platform.startswith("linux"):
-        is_system_valid = engine.run_system_check()
-        if not is_system_valid:
-            sys.exit()
+    ##### validate assets #####
+    # only missing or undecodable assets stop the boot, changed assets are loaded from the original file
+    if not engine.validate_assets():
+        sys.exit()
 
     ##### intro video #####
-    player = VideoPlayer(None)
+    # the theme is loaded in the background meanwhile (see StarEngine.wait_for_theme)
+    player = VideoPlayer(None, audio_cache=engine.audio_cache)
     player.enable_standalone(config.width, config.height, config.title, config.full_screen)
     player.set_video("assets/videos/intro.mp4")
     player.play()
 
+    ##### run system check #####
+    if sys.platform.startswith("linux"):
+        is_system_valid = engine.run_system_check()
+        if not is_system_valid:
+            sys.exit()
+
     ##### show main menu #####
     result = engine.show_main_menu()
     if result == 0:
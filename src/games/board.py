@@ -0,0 +1,20 @@
+from typing import List, Tuple
+
+
+def get_neighbours(row: int, col: int) -> List[Tuple[int, int]]:
+    """
+    Return the fields adjacent to the given field of the game board.
+    the board is a staggered hex grid, even rows are shifted half a field to the right.
+    :param row: Row of the field.
+    :param col: Column of the field.
+    :return: List of (row, col) tuples, fields outside the board (negative row or column) are left out.
+    """
+    if row % 2 == 0:
+        diagonal_columns = (col, col + 1)
+    else:
+        diagonal_columns = (col - 1, col)
+    neighbours = [(row, col - 1), (row, col + 1)]
+    for neighbour_row in (row - 1, row + 1):
+        for neighbour_col in diagonal_columns:
+            neighbours.append((neighbour_row, neighbour_col))
+    return [(r, c) for r, c in neighbours if r >= 0 and c >= 0]
@@ -1,7 +1,5 @@
-import sys
 from abc import ABC, abstractmethod
 
-import pygame
 from pygame import Surface
 
 from src.games.game_data import GameData
@@ -23,5 +21,4 @@ class Game(ABC):
 
     def stop(self):
         self.is_running = False
-        pygame.quit()
-        sys.exit()
\ No newline at end of file
+        self.engine.quit()
\ No newline at end of file
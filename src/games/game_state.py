@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from typing import Callable, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.models.event_card import EventCard
+    from src.models.game_object import GameObject
+    from src.models.planet import Planet
+
+# names passed to the subscribers, one per observed value
+FUEL = "fuel"
+HULL = "hull"
+POSITION = "position"
+CURRENT_PLANET = "current_planet"
+INVENTORY = "inventory"
+ACTIVE_EVENTS = "active_events"
+
+
+class GameState:
+    """
+    Holds the state of a running story game (fuel, hull, position, inventory and active events)
+    subscribers are called with the name of the changed value (see the constants above) whenever a value actually
+    changes, so the HUD and the debug view only redraw on changes instead of polling the state every frame.
+    """
+
+    def __init__(self, fuel: int, hull: int, player_row: int, player_col: int):
+        """
+        :param fuel: Fuel at the start of the game.
+        :param hull: Hull at the start of the game.
+        :param player_row: Start row of the player.
+        :param player_col: Start column of the player.
+        """
+        self.__fuel: int = fuel
+        self.__hull: int = hull
+        self.__player_row: int = player_row
+        self.__player_col: int = player_col
+        self.__current_planet: Planet | None = None
+        self.__inventory: List[GameObject] = []
+        self.__active_events: List[EventCard] = []
+        self.__subscribers: List[Callable[[str], None]] = []
+
+    def subscribe(self, callback: Callable[[str], None]) -> None:
+        """
+        Call the callback on every change.
+        :param callback: Called with the name of the changed value.
+        """
+        self.__subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[str], None]) -> None:
+        if callback in self.__subscribers:
+            self.__subscribers.remove(callback)
+
+    def notify(self, name: str) -> None:
+        """
+        Call the subscribers, also used after an item of the inventory or an active event was changed in place.
+        :param name: Name of the changed value.
+        """
+        for callback in list(self.__subscribers):
+            callback(name)
+
+    ##### values #####
+    @property
+    def fuel(self) -> int:
+        return self.__fuel
+
+    @fuel.setter
+    def fuel(self, fuel: int):
+        if fuel != self.__fuel:
+            self.__fuel = fuel
+            self.notify(FUEL)
+
+    @property
+    def hull(self) -> int:
+        return self.__hull
+
+    @hull.setter
+    def hull(self, hull: int):
+        if hull != self.__hull:
+            self.__hull = hull
+            self.notify(HULL)
+
+    @property
+    def player_row(self) -> int:
+        return self.__player_row
+
+    @property
+    def player_col(self) -> int:
+        return self.__player_col
+
+    def set_position(self, row: int, col: int) -> None:
+        """
+        Move the player, row and column are changed together so subscribers never see a half updated position.
+        """
+        if (row, col) != (self.__player_row, self.__player_col):
+            self.__player_row = row
+            self.__player_col = col
+            self.notify(POSITION)
+
+    @property
+    def current_planet(self) -> Planet | None:
+        return self.__current_planet
+
+    @current_planet.setter
+    def current_planet(self, planet: Planet | None):
+        if planet is not self.__current_planet:
+            self.__current_planet = planet
+            self.notify(CURRENT_PLANET)
+
+    ##### collections #####
+    @property
+    def inventory(self) -> List[GameObject]:
+        """
+        Items collected by the player, change it with add_item only.
+        """
+        return self.__inventory
+
+    def add_item(self, game_object: GameObject) -> None:
+        self.__inventory.append(game_object)
+        self.notify(INVENTORY)
+
+    @property
+    def active_events(self) -> List[EventCard]:
+        """
+        Events still affecting the player, change it with add_active_event / remove_active_event only.
+        """
+        return self.__active_events
+
+    def add_active_event(self, event: EventCard) -> None:
+        self.__active_events.append(event)
+        self.notify(ACTIVE_EVENTS)
+
+    def remove_active_event(self, event: EventCard) -> None:
+        self.__active_events.remove(event)
+        self.notify(ACTIVE_EVENTS)
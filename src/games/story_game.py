@@ -1,17 +1,19 @@
 import random
 import sys
 import time
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 import pygame
 
 from src.games.game import Game
 from src.games.game_data import GameData
+from src.games.game_state import GameState
 from src.managers.debug_manager import DebugManager
 from src.managers.event.event_manager import EventManager
 from src.managers.hud_manager import HUDManager
 from src.managers.input.input_manager import InputManager
 from src.managers.inventory_manager import InventoryManager
+from src.managers.prefetch_manager import PrefetchManager
 from src.managers.quiz_manager import QuizManager
 from src.managers.statistics_manager import StatisticsManager
 from src.managers.story_manager import StoryManager
@@ -20,6 +22,7 @@ from src.models.event_card import EventCard
 from src.models.planet import Planet
 from src.models.quiz import Quiz
 from src.models.story_line import StoryLine
+from src.scenes.scene import SceneFlow
 from src.star_engine import StarEngine
 
 from src.views.common.info_view import InfoView
@@ -37,14 +40,12 @@ class StoryGame(Game):
         super().__init__(engine, data)
 
         ##### Game Data #####
-        self.fuel: int = self.engine.config.game_settings_start_fuel
-        self.hull: int = self.engine.config.game_settings_start_hull
-
-        # start location
-        self.player_row: int = self.engine.config.player_settings_start_row
-        self.player_col: int = self.engine.config.player_settings_start_col
-        # init planet and planet quizzes
-        self.current_planet: Planet | None = None
+        # fuel, hull, location (start location), current planet, inventory and active events
+        self.state: GameState = GameState(self.engine.config.game_settings_start_fuel,
+                                          self.engine.config.game_settings_start_hull,
+                                          self.engine.config.player_settings_start_row,
+                                          self.engine.config.player_settings_start_col)
+        # init planet quizzes
         self.planet_quizzes_current: Dict[str, List[Quiz]] = {
             pname: list(q_list) for pname, q_list in self.data.planet_quizzes.items()
         }
@@ -55,7 +56,7 @@ class StoryGame(Game):
 
         ##### Input Manager #####
         self.input_manager: InputManager = InputManager(self)
-        if sys.platform.startswith("linux"):
+        if sys.platform.startswith("linux") and self.engine.config.hardware_input:
             # only include the mcp manager on the raspberry pi, otherwise the entire game could not be executed on windows
             # as this manager depends on linux specific libraries (GPIO connection)
             from src.managers.input.mcp_input_manager import MCPInputManager, GAME_BOARD_PIN_DEFINITIONS
@@ -67,8 +68,12 @@ class StoryGame(Game):
             self.switch_input_manager = None
 
         self.last_mcp_time: float = 0.0  # last time MCP/Switch-Events
+        # move detected by the game board while a scene was running, applied afterwards
+        self.pending_move: Tuple[int, int] | None = None
 
         ##### UI Manager #####
+        # the managers build their ui right away
+        self.engine.wait_for_theme()
         self.ui_manager: UIManager = UIManager(self)
         self.hud_manager = HUDManager(self)
 
@@ -90,17 +95,59 @@ class StoryGame(Game):
         ##### Debug Manager #####
         self.debug_manager: DebugManager = DebugManager(self)
 
+        ##### Prefetch Manager #####
+        self.prefetch_manager: PrefetchManager = PrefetchManager(self)
+
         ##### windows #####
         default_backgrounds = self.engine.config.game_settings_default_backgrounds
         chosen_image: str = random.choice(default_backgrounds)
-        img = pygame.image.load(chosen_image).convert()
-        self.default_bg_full: pygame.Surface | None = pygame.transform.scale(img,
-                                                                             (self.engine.width, self.engine.height))
+        self.default_bg_full: pygame.Surface | None = self.engine.asset_cache.get_scaled_image(
+            chosen_image, (self.engine.width, self.engine.height))
 
         self.move_player(self.engine.config.player_settings_start_row, self.engine.config.player_settings_start_col)
 
+    ##### game state #####
+    @property
+    def fuel(self) -> int:
+        return self.state.fuel
+
+    @fuel.setter
+    def fuel(self, fuel: int):
+        self.state.fuel = fuel
+
+    @property
+    def hull(self) -> int:
+        return self.state.hull
+
+    @hull.setter
+    def hull(self, hull: int):
+        self.state.hull = hull
+
+    @property
+    def player_row(self) -> int:
+        return self.state.player_row
+
+    @property
+    def player_col(self) -> int:
+        return self.state.player_col
+
+    @property
+    def current_planet(self) -> Planet | None:
+        return self.state.current_planet
+
+    @current_planet.setter
+    def current_planet(self, planet: Planet | None):
+        self.state.current_planet = planet
+
     def handle_events(self):
+        if self.pending_move is not None:
+            pending_row, pending_col = self.pending_move
+            self.pending_move = None
+            self.move_player(pending_row, pending_col)
         self.input_manager.process_events()
+        self.poll_hardware()
+
+    def poll_hardware(self):
         current_time = time.time()
         if current_time - self.last_mcp_time >= 2.0:
             if self.mcp_input_manager:
@@ -109,13 +156,32 @@ class StoryGame(Game):
                 self.switch_input_manager.process_events()
             self.last_mcp_time = current_time  # reset timer
 
+    def handle_scene_event(self, event: pygame.event.Event):
+        """
+        Input handled for every scene, before the scene handles the event (see StarEngine.run)
+        """
+        if event.type == pygame.QUIT:
+            self.stop()
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_d:
+            self.debug_manager.toggle_debug_mode()
+        else:
+            self.engine.scene_profiler.handle_event(event)
+
+    def update_background(self):
+        """
+        Work that continues while a scene is shown (see StarEngine.run)
+        """
+        self.poll_hardware()
+        self.update_managers()
+
     def update(self, delta_time: float):
         self.ui_manager.gui_manager.update(delta_time)
         self.update_managers()
 
     def update_managers(self):
-        self.hud_manager.update()
+        # the hud and the game state part of the debug view are updated on changes of the game state
         self.debug_manager.update()
+        self.prefetch_manager.update()
 
     def draw(self):
         self.window.blit(self.default_bg_full, (0, 0))
@@ -144,20 +210,27 @@ class StoryGame(Game):
         return False
 
     def move_player(self, new_row: int, new_column: int):
+        if self.engine.active_scene is not None:
+            # e.g. the game board was used during a cutscene, move once the scene is finished
+            self.pending_move = (new_row, new_column)
+            return
+        # moves detected by the game board aren't pygame events, leave the idle frame rate
+        self.engine.frame_governor.notify_activity()
+        self.engine.run_flow(self.run_move(new_row, new_column))
+
+    def run_move(self, new_row: int, new_column: int) -> SceneFlow:
         # change player location
-        self.player_row = new_row
-        self.player_col = new_column
+        self.state.set_position(new_row, new_column)
         # movement cost
         self.fuel -= 1
-        # update hud (update fuel change)
-        self.update_managers()
 
         if self.__is_game_over():
-            return self.run_game_over()
+            yield from self.run_game_over()
+            return
 
-        self.run_position_actions()
+        yield from self.run_position_actions()
 
-    def run_position_actions(self):
+    def run_position_actions(self) -> SceneFlow:
 
         ##### apply active event effects #####
         self.event_manager.run_active_events()
@@ -170,19 +243,17 @@ class StoryGame(Game):
             # check if the planet coordinates matches the player ones
             if planet.row == self.player_row and planet.col == self.player_col:
                 self.current_planet = planet
-                ##### update debug view with current_planet set #####
-                self.update_managers()
                 # if not planet.visited:
                 # self.run_planet_actions(planet)
                 # self.trigger_planet_event(planet)
                 break
 
         if not self.current_planet is None:
-            self.run_planet_actions(self.current_planet)
+            yield from self.run_planet_actions(self.current_planet)
             return
         else:
             ##### general field - show default quiz #####
-            self.run_general_field_actions()
+            yield from self.run_general_field_actions()
 
         ##### event #####
 
@@ -191,21 +262,21 @@ class StoryGame(Game):
         if len(forced_events) > 0:
             for forced_event in forced_events:
                 if forced_event.category == "game_over":
-                    self.event_manager.run_event(forced_event)
-                    self.run_game_over()
+                    yield from self.event_manager.run_event(forced_event)
+                    yield from self.run_game_over()
                     break
 
-                self.event_manager.run_event(forced_event)
+                yield from self.event_manager.run_event(forced_event)
 
-        self.event_manager.trigger_event_if_possible()
+        yield from self.event_manager.trigger_event_if_possible()
 
         ##### check if event results in game over #####
         if self.__is_game_over():
-            return self.run_game_over()
+            yield from self.run_game_over()
 
-    def run_general_field_actions(self):
+    def run_general_field_actions(self) -> SceneFlow:
         ##### display quiz or task #####
-        self.quiz_manager.run_general_field_action()
+        yield from self.quiz_manager.run_general_field_action()
 
         ##### update event system #####
         is_last_quiz_correct = self.quiz_manager.is_last_quiz_correct
@@ -214,11 +285,11 @@ class StoryGame(Game):
         else:
             self.event_manager.increase_error_count()
 
-    def run_planet_actions(self, planet: Planet):
+    def run_planet_actions(self, planet: Planet) -> SceneFlow:
         ##### show story content on start planet #####
         if planet.is_start_planet:
-            self.ui_manager.display_cutscene(planet.cutscene_media)
-            self.story_manager.show_planet_story(planet, self.data.story_segments[planet.name])
+            yield from self.ui_manager.display_cutscene(planet.cutscene_media)
+            yield from self.story_manager.show_planet_story(planet, self.data.story_segments[planet.name])
             return
         if planet.is_end_planet:
             ##### player hasn't all items, show error message #####
@@ -227,42 +298,43 @@ class StoryGame(Game):
                     self.engine.config.planet_menu_states_zion_not_allowed_text,
                     "", "Lyra")
                 error_view = StoryView(self, planet, story_line)
-                error_view.run()
+                yield error_view
                 return
 
         if planet.is_spacestation:
-            self.story_manager.show_spacestation_menu(planet)
+            yield from self.story_manager.show_spacestation_menu(planet)
             return
 
         ##### show planet menu and await user input #####
-        selected_planet_menu_option = self.story_manager.show_planet_menu(planet)
+        selected_planet_menu_option = yield from self.story_manager.show_planet_menu(planet)
 
         ##### visit station clicked #####
         if selected_planet_menu_option == 1:
             fuel_station_background_path = self.get_background_fuel_station_image_path()
-            selected_station_option = self.story_manager.show_planet_station_menu(planet, fuel_station_background_path)
+            selected_station_option = yield from self.story_manager.show_planet_station_menu(
+                planet, fuel_station_background_path)
 
             ##### solve quiz clicked #####
             if selected_station_option == 1:
                 print("aufgabe lösen")
-                self.run_station_quiz_fuel_action(planet, fuel_station_background_path)
+                yield from self.run_station_quiz_fuel_action(planet, fuel_station_background_path)
 
             ##### free refuel clicked #####
             if selected_station_option == 2:
                 print("kostenlos tanken")
-                self.run_station_free_fuel_action(planet, fuel_station_background_path)
+                yield from self.run_station_free_fuel_action(planet, fuel_station_background_path)
 
         ##### visit planet clicked #####
         if selected_planet_menu_option == 2:
             # show cutscene
-            self.ui_manager.display_cutscene(planet.cutscene_media)
+            yield from self.ui_manager.display_cutscene(planet.cutscene_media)
 
             if planet.visited:
                 story_line = StoryLine(
                     self.engine.config.planet_menu_visited,
                     "", "Victor")
                 error_view = StoryView(self, planet, story_line)
-                error_view.run()
+                yield error_view
             else:
                 if planet.depend_on is not None:
                     depend_planet = next(
@@ -274,18 +346,18 @@ class StoryGame(Game):
                         error_view = InfoView(self, "Falsch abgebogen", self.engine.config.portrait_victor,
                                               depend_planet.background_image,
                                               "Moment mal – wir sind hier zu früh. Wir müssen zuerst woanders hin, bevor wir hier weitermachen können.")
-                        error_view.run()
+                        yield error_view
                         return
 
                 # show the planet stories
-                self.story_manager.show_planet_story(planet, self.data.story_segments[planet.name])
+                yield from self.story_manager.show_planet_story(planet, self.data.story_segments[planet.name])
                 planet.visited = True
 
             print("Planet besuchen")
 
-    def run_station_quiz_fuel_action(self, planet: Planet, fuel_station_background_path: str):
+    def run_station_quiz_fuel_action(self, planet: Planet, fuel_station_background_path: str) -> SceneFlow:
         ##### display quiz or task #####
-        self.run_general_field_actions()
+        yield from self.run_general_field_actions()
 
         is_correct = self.quiz_manager.is_last_quiz_correct
         if is_correct:
@@ -300,20 +372,20 @@ class StoryGame(Game):
         view = InfoView(self, "Resultat", self.engine.config.portrait_milo,
                         fuel_station_background_path, description,
                         "Akzeptieren")
-        view.run()
+        yield view
 
-    def run_station_free_fuel_action(self, planet: Planet, fuel_station_background_path: str):
+    def run_station_free_fuel_action(self, planet: Planet, fuel_station_background_path: str) -> SceneFlow:
         ##### display a message and add the fuel #####
         description = f"Die Minerva wird aufgetankt, mit <b>+{self.engine.config.planet_menu_fuel_free_amount} Treibstoff</b> ist sie wieder einsatzbereit."
 
         view = InfoView(self, "Tanken", self.engine.config.planet_menu_fuel_station_image_path,
                         fuel_station_background_path, description,
                         "Akzeptieren")
-        view.run()
+        yield view
         self.fuel += self.engine.config.planet_menu_fuel_free_amount
         self.hull += self.engine.config.planet_menu_fuel_free_amount
 
-    def run_game_over(self):
+    def run_game_over(self) -> SceneFlow:
         print("[Game Over]")
         self.hud_manager.kill_children()
 
@@ -325,7 +397,7 @@ class StoryGame(Game):
             backgrounds = self.engine.config.game_over_default_background_paths
             background_image = random.choice(backgrounds)
         game_over_view = GameOverView(self, background_image)
-        game_over_view.run()
+        yield game_over_view
 
     def has_all_items(self) -> bool:
         items = self.inventory_manager.get_items()
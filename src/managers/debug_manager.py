@@ -10,6 +10,7 @@ from typing import List, Optional, Tuple, TYPE_CHECKING
 from src.components.ui.ui_window import UIWindow
 from src.enums.color import Color
 from src.managers.manager import Manager
+from src.plugins.frame_profiler import FrameProfiler, PHASES
 
 if TYPE_CHECKING:
     from src.games.story_game import StoryGame
@@ -18,6 +19,10 @@ if TYPE_CHECKING:
 class DebugManager(Manager):
     """
     Implements a debug view
+    the player marker and the game state information are updated when the game state changes (see GameState),
+    the other windows are refreshed every debug_refresh_ms.
+    the solar system background, the hex grid and the planet markers are composed into one cached map image,
+    which is only composed again if the grid configuration or a planet position changed.
     """
 
     def __init__(self, game: StoryGame):
@@ -27,6 +32,8 @@ class DebugManager(Manager):
         super().__init__()
         self.game = game
         self.debug_mode = False
+        self.refresh_ms: int = self.game.engine.config.debug_refresh_ms
+        self.__last_refresh: int = -self.refresh_ms
 
         ##### Hexagon grid configuration #####
         self.hex_rows = 13
@@ -44,6 +51,9 @@ class DebugManager(Manager):
         self.event_info_window.hide()
         self.quiz_info_window.hide()
         self.stats_info_window.hide()
+        self.profiler_window.hide()
+
+        self.game.state.subscribe(self.__on_state_changed)
 
     def __init(self):
         ##### Create the Debug Information Window #####
@@ -84,6 +94,19 @@ class DebugManager(Manager):
         self.stats_info_labels: List[UILabel] = []
         self.__create_stats_info_ui()
 
+        ##### Frame Profiler Window #####
+        self.profiler_window: UIWindow = UIWindow(
+            rect=pygame.Rect(1200, 250, 400, 470),
+            manager=self.game.ui_manager.gui_manager,
+            window_display_title="Frame Profiler"
+        )
+        self.profiler_labels: List[UILabel] = []
+        # frame time histogram, 2 ms per bar
+        self.histogram_bin_ms = 2
+        self.histogram_bin_count = 24
+        self.histogram_size = (360, 150)
+        self.__create_profiler_ui()
+
         ##### Create the Solar System Window #####
         self.solar_system_window: UIWindow = UIWindow(
             rect=pygame.Rect(50, 50, 800, 600),
@@ -91,34 +114,31 @@ class DebugManager(Manager):
             window_display_title="Solar System"
         )
 
-        # Load the solar system background image
-        raw_solar_system_image: pygame.Surface = self.__load_image(
-            "assets/images/debug/solar_system_v2.png", fallback_size=(800, 600)
+        # Load the solar system background image, scaled so that it fits within the target size without stretching
+        fitted_solar_system_image: pygame.Surface = self.__load_image(
+            self.game.engine.config.debug_solar_system_image_path, target_size=(800, 600)
         )
-        # Scale the solar system image so that it fits within the target size without stretching
-        self.solar_system_background: pygame.Surface = self.__scale_image_preserving_aspect_ratio(
-            raw_solar_system_image, target_size=(800, 600)
-        )
-        # Create a UI element for the solar system background
-        self.solar_system_background_ui = UIImage(
-            relative_rect=pygame.Rect(0, 0, 800, 600),
-            image_surface=self.solar_system_background,
-            manager=self.game.ui_manager.gui_manager,
-            container=self.solar_system_window
+        # Center the solar system image within the target size
+        self.solar_system_background: pygame.Surface = self.__center_image(
+            fitted_solar_system_image, target_size=(800, 600)
         )
 
-        ##### Create the Hexagon Grid UI Elements #####
-        self.hexagon_ui_elements: List[UIImage] = []
-        self.__create_hex_grid_ui_elements()
-
-        ##### Prepare UI elements for Planets and the Player #####
+        ##### Prepare the map with the Hexagon Grid and the Planets #####
         # Create a surface for the green planet circle (30-pixel diameter)
         self.planet_circle_diameter = 30
         self.planet_circle_surface: pygame.Surface = self.__create_circle_surface(
             diameter=self.planet_circle_diameter, color=Color.DEBUG_PLANET.value
         )
-        # This list will hold UI elements for planets (created dynamically in update)
-        self.planet_ui_elements: List[UIImage] = []
+        # Create a UI element for the solar system map (background, hex grid and planets)
+        self.solar_system_background_ui = UIImage(
+            relative_rect=pygame.Rect(0, 0, 800, 600),
+            image_surface=self.solar_system_background,
+            manager=self.game.ui_manager.gui_manager,
+            container=self.solar_system_window
+        )
+        # grid configuration and planet positions the map image was composed for
+        self.__map_key: Tuple | None = None
+        self.__update_solar_system_map()
 
         # Create a surface for the red player circle (24-pixel diameter)
         self.player_circle_diameter = 24
@@ -144,49 +164,81 @@ class DebugManager(Manager):
             self.event_info_window.show()
             self.quiz_info_window.show()
             self.stats_info_window.show()
+            self.profiler_window.show()
             self.solar_system_window.show()
+            # changes while hidden were skipped
+            self.__update_game_state_info()
+            self.__last_refresh = -self.refresh_ms
         else:
             self.debug_info_window.hide()
             self.event_info_window.hide()
             self.quiz_info_window.hide()
             self.stats_info_window.hide()
+            self.profiler_window.hide()
             self.solar_system_window.hide()
 
         print(f"[DEBUG] Debug mode: {self.debug_mode}")
 
     def update(self):
         """
-        Update the debug UI elements to reflect the current game state.
+        Update the debug UI elements which aren't part of the game state (planets, manager information).
         This method is being called each frame in the main game loop.
 
         """
         if not self.debug_mode:
             return
 
-        ##### Update Planet UI Elements #####
-        # Remove previous planet UI elements.
-        for planet_ui in self.planet_ui_elements:
-            planet_ui.kill()  # Remove from the UI manager
-        self.planet_ui_elements.clear()
-
-        # Create a new UI element for each planet in the game.
-        for planet in self.game.data.planets:
-            # Compute the center position for the hex cell corresponding to the planet's row and column.
-            center_x, center_y = self.__calculate_hex_center(planet.row, planet.col)
-            planet_rect = pygame.Rect(
-                int(center_x - self.planet_circle_diameter / 2),
-                int(center_y - self.planet_circle_diameter / 2),
-                self.planet_circle_diameter,
-                self.planet_circle_diameter
-            )
-            planet_ui = UIImage(
-                relative_rect=planet_rect,
-                image_surface=self.planet_circle_surface,
-                manager=self.game.ui_manager.gui_manager,
-                container=self.solar_system_window
-            )
-            self.planet_ui_elements.append(planet_ui)
+        # the information changes with the game flow, a low refresh rate is sufficient
+        current_time = pygame.time.get_ticks()
+        if current_time - self.__last_refresh < self.refresh_ms:
+            return
+        self.__last_refresh = current_time
 
+        ##### Update the Solar System Map #####
+        self.__update_solar_system_map()
+
+        ##### Update Event Information Window #####
+        event_info_lines = [
+            f"Global Event Prob.: {self.game.event_manager.event_probability}",
+            f"Positive Prob.: {self.game.event_manager.event_positive_probability}",
+            f"Error Count: {self.game.event_manager.error_count}",
+            f"Positive Events: {len(self.game.event_manager.positive_events)}",
+            f"Negative Events: {len(self.game.event_manager.negative_events)}"
+        ]
+        self.__set_label_texts(self.event_info_labels, event_info_lines)
+
+        ##### Update Quiz Information Window #####
+        quiz_info_lines = [
+            f"Tolerance: {self.game.quiz_manager.tolerance}",
+        ]
+        self.__set_label_texts(self.quiz_info_labels, quiz_info_lines)
+
+        ##### Update Stats Information Window #####
+        stats_info_lines = [
+            f"Quiz total error count:  {self.game.statistics_manager.quiz_incorrect_count}",
+            f"Task total error count:  {self.game.statistics_manager.task_incorrect_count}",
+            f"Quiz total success count:  {self.game.statistics_manager.quiz_correct_count}",
+            f"Task total success count:  {self.game.statistics_manager.task_correct_count}",
+            self.__get_frame_rate_info(),
+        ]
+        self.__set_label_texts(self.stats_info_labels, stats_info_lines)
+
+        ##### Update Frame Profiler Window #####
+        self.__update_profiler_info()
+
+    def __on_state_changed(self, name: str):
+        """
+        Update the game state information if the debug view is shown.
+
+        :param name: Name of the changed value (see GameState).
+        """
+        if self.debug_mode:
+            self.__update_game_state_info()
+
+    def __update_game_state_info(self):
+        """
+        Update the player position and the Debug Information window.
+        """
         ##### Update Player UI Element Position #####
         player_center_x, player_center_y = self.__calculate_hex_center(
             self.game.player_row, self.game.player_col
@@ -214,48 +266,75 @@ class DebugManager(Manager):
         debug_text_lines = general_info + event_info + game_stats_info
 
         # Update each UILabel in the Debug Information window.
-        for index, label in enumerate(self.debug_info_labels):
-            if index < len(debug_text_lines):
-                label.set_text(debug_text_lines[index])
-            else:
-                label.set_text("")
+        self.__set_label_texts(self.debug_info_labels, debug_text_lines)
 
-        ##### Update Event Information Window #####
-        event_info_lines = [
-            f"Global Event Prob.: {self.game.event_manager.event_probability}",
-            f"Positive Prob.: {self.game.event_manager.event_positive_probability}",
-            f"Error Count: {self.game.event_manager.error_count}",
-            f"Positive Events: {len(self.game.event_manager.positive_events)}",
-            f"Negative Events: {len(self.game.event_manager.negative_events)}"
-        ]
-        for index, label in enumerate(self.event_info_labels):
-            if index < len(event_info_lines):
-                label.set_text(event_info_lines[index])
-            else:
-                label.set_text("")
+    @staticmethod
+    def __set_label_texts(labels: List[UILabel], lines: List[str]):
+        """
+        Show the lines in the labels, only labels whose text changed are updated.
 
-        ##### Update Quiz Information Window #####
-        quiz_info_lines = [
-            f"Tolerance: {self.game.quiz_manager.tolerance}",
-        ]
-        for index, label in enumerate(self.quiz_info_labels):
-            if index < len(quiz_info_lines):
-                label.set_text(quiz_info_lines[index])
-            else:
-                label.set_text("")
+        :param labels: The labels of a window.
+        :param lines: One text per label, the remaining labels are cleared.
+        """
+        for index, label in enumerate(labels):
+            text = lines[index] if index < len(lines) else ""
+            if label.text != text:
+                label.set_text(text)
 
-        ##### Update Stats Information Window #####
-        stats_info_lines = [
-            f"Quiz total error count:  {self.game.statistics_manager.quiz_incorrect_count}",
-            f"Task total error count:  {self.game.statistics_manager.task_incorrect_count}",
-            f"Quiz total success count:  {self.game.statistics_manager.quiz_correct_count}",
-            f"Task total success count:  {self.game.statistics_manager.task_correct_count}",
-        ]
-        for index, label in enumerate(self.stats_info_labels):
-            if index < len(stats_info_lines):
-                label.set_text(stats_info_lines[index])
-            else:
-                label.set_text("")
+    def __update_profiler_info(self):
+        """
+        Show the p50 / p95 / p99 of the frame time and of each phase and the frame time histogram
+        of the frames recorded by the frame profiler.
+        """
+        frame_profiler = self.game.engine.frame_profiler
+        if not frame_profiler.enabled:
+            self.__set_label_texts(self.profiler_labels, ["disabled, see frame_profiler in star_config.json"])
+            return
+
+        frame_times = frame_profiler.get_frame_times()
+        profiler_lines = [f"{len(frame_times)} frames, p50 / p95 / p99 in ms",
+                          self.__get_percentile_info("frame", frame_times)]
+        for phase in PHASES:
+            profiler_lines.append(self.__get_percentile_info(phase, frame_profiler.get_phase_times(phase)))
+        profiler_lines.append(f"0 - {self.histogram_bin_ms * self.histogram_bin_count} ms, "
+                              f"line: {self.game.engine.fps} fps")
+        self.__set_label_texts(self.profiler_labels, profiler_lines)
+
+        self.profiler_histogram_ui.set_image(self.__create_histogram_surface(
+            FrameProfiler.get_histogram(frame_times, self.histogram_bin_ms, self.histogram_bin_count)))
+
+    @staticmethod
+    def __get_percentile_info(name: str, times: List[float]) -> str:
+        p50, p95, p99 = FrameProfiler.get_percentiles(times)
+        return f"{name}: {p50:.1f} / {p95:.1f} / {p99:.1f}"
+
+    def __create_histogram_surface(self, histogram: List[int]) -> pygame.Surface:
+        """
+        Draw the histogram as bars scaled to the largest bin, with a line at the frame time of the target frame rate.
+
+        :param histogram: Number of frames per bin (see FrameProfiler.get_histogram).
+        :return: A pygame.Surface of the histogram size.
+        """
+        width, height = self.histogram_size
+        histogram_surface = pygame.Surface(self.histogram_size, pygame.SRCALPHA)
+        bar_width = width // len(histogram)
+        highest_count = max(max(histogram), 1)
+        for index, count in enumerate(histogram):
+            bar_height = int(count / highest_count * height)
+            pygame.draw.rect(histogram_surface, Color.DEBUG_PLANET.value,
+                             pygame.Rect(index * bar_width, height - bar_height, bar_width - 1, bar_height))
+        target_x = int(1000 / self.game.engine.fps / self.histogram_bin_ms * bar_width)
+        pygame.draw.line(histogram_surface, Color.DEBUG_PLAYER.value, (target_x, 0), (target_x, height), 2)
+        return histogram_surface
+
+    def __get_frame_rate_info(self) -> str:
+        """
+        Return the current frame rate and the time spent at the active and the idle frame rate (see FrameGovernor).
+        """
+        frame_governor = self.game.engine.frame_governor
+        return (f"Frame rate: {frame_governor.current_fps} fps "
+                f"({frame_governor.active_fps} fps: {frame_governor.active_time:.0f}s, "
+                f"{frame_governor.idle_fps} fps: {frame_governor.idle_time:.0f}s)")
 
     def __create_debug_info_ui(self):
         """
@@ -340,17 +419,50 @@ class DebugManager(Manager):
             )
             self.stats_info_labels.append(label)
 
-    def __create_hex_grid_ui_elements(self):
+    def __create_profiler_ui(self) -> None:
         """
-        Create UI elements for the hexagon grid.
-        Each hexagon is drawn on a generated surface and then displayed via an UIImage.
-        The hex grid is placed on top of the solar system background.
+        Create the UILabel elements and the histogram image inside the Frame Profiler window.
         """
-        # Remove any existing hexagon UI elements.
-        for hexagon_ui in self.hexagon_ui_elements:
-            hexagon_ui.kill()
-        self.hexagon_ui_elements.clear()
+        self.profiler_labels.clear()
+        label_width = 350
+        label_height = 25
+        padding = 5
+        starting_y = 10
+
+        # Create 8 labels in a single column: header, frame, one per phase, histogram legend
+        for index in range(8):
+            y_position = starting_y + index * (label_height + padding)
+            label = UILabel(
+                relative_rect=pygame.Rect(0, y_position, label_width, label_height),
+                text="",
+                manager=self.game.ui_manager.gui_manager,
+                container=self.profiler_window
+            )
+            self.profiler_labels.append(label)
 
+        self.profiler_histogram_ui: UIImage = UIImage(
+            relative_rect=pygame.Rect(pygame.Vector2(10, starting_y + 8 * (label_height + padding)),
+                                      self.histogram_size),
+            image_surface=pygame.Surface(self.histogram_size, pygame.SRCALPHA),
+            manager=self.game.ui_manager.gui_manager,
+            container=self.profiler_window
+        )
+
+    def __update_solar_system_map(self):
+        """
+        Compose the solar system background, the hexagon grid and the planet markers into the map image,
+        if the grid configuration or a planet position changed since the map was composed.
+        """
+        planet_positions = tuple((planet.row, planet.col) for planet in self.game.data.planets)
+        map_key = (self.hex_rows, self.hex_columns, self.hexagon_radius,
+                   self.hexagon_offset_x, self.hexagon_offset_y, planet_positions)
+        if map_key == self.__map_key:
+            return
+        self.__map_key = map_key
+
+        map_surface = self.solar_system_background.copy()
+
+        ##### Hexagon Grid #####
         # The hexagon's diameter is twice its radius.
         hexagon_diameter = self.hexagon_radius * 2
         # Create a hexagon surface with a transparent background and a white border.
@@ -359,24 +471,23 @@ class DebugManager(Manager):
             border_color=Color.WHITE.value,
             fill_color=None  # No fill; just a border overlay
         )
-
         # Loop over each row and column in the grid.
         for grid_row in range(self.hex_rows):
             for grid_column in range(self.hex_columns):
                 center_x, center_y = self.__calculate_hex_center(grid_row, grid_column)
-                hexagon_rect = pygame.Rect(
-                    int(center_x - self.hexagon_radius),
-                    int(center_y - self.hexagon_radius),
-                    hexagon_diameter,
-                    hexagon_diameter
-                )
-                hexagon_ui = UIImage(
-                    relative_rect=hexagon_rect,
-                    image_surface=hexagon_surface,
-                    manager=self.game.ui_manager.gui_manager,
-                    container=self.solar_system_window
-                )
-                self.hexagon_ui_elements.append(hexagon_ui)
+                map_surface.blit(hexagon_surface, (int(center_x - self.hexagon_radius),
+                                                   int(center_y - self.hexagon_radius)))
+
+        ##### Planets #####
+        for row, col in planet_positions:
+            # planets outside the grid aren't shown
+            if not (0 <= row < self.hex_rows and 0 <= col < self.hex_columns):
+                continue
+            center_x, center_y = self.__calculate_hex_center(row, col)
+            map_surface.blit(self.planet_circle_surface, (int(center_x - self.planet_circle_diameter / 2),
+                                                          int(center_y - self.planet_circle_diameter / 2)))
+
+        self.solar_system_background_ui.set_image(map_surface)
 
     def __calculate_hex_center(self, grid_row: int, grid_column: int) -> Tuple[float, float]:
         """
@@ -443,53 +554,43 @@ class DebugManager(Manager):
         pygame.draw.polygon(hexagon_surface, border_color, hexagon_points, width=2)
         return hexagon_surface
 
-    def __load_image(self, path: str, fallback_size: Tuple[int, int]) -> pygame.Surface:
+    def __load_image(self, path: str, target_size: Tuple[int, int]) -> pygame.Surface:
         """
-        Attempt to load an image from the specified path.
+        Attempt to load an image from the specified path, scaled to fit within the target size
+        while preserving its aspect ratio. The scaled image is cached by the engine's asset cache.
         If loading fails, return a fallback surface filled with black.
 
         :param path: The file path to the image asset.
-        :param fallback_size: The size of the fallback surface.
+        :param target_size: The (width, height) the image must fit in, also the size of the fallback surface.
         :return: A pygame.Surface with the loaded image or fallback.
         """
         try:
-            image = pygame.image.load(path).convert_alpha()
+            image = self.game.engine.asset_cache.get_fitted_image(path, target_size, alpha=True)
             return image
         except Exception as error:
             print(f"[DEBUG] Could not load image at '{path}': {error}")
-            fallback_surface = pygame.Surface(fallback_size, pygame.SRCALPHA)
+            fallback_surface = pygame.Surface(target_size, pygame.SRCALPHA)
             fallback_surface.fill(Color.BLACK.value)
             return fallback_surface
 
-    def __scale_image_preserving_aspect_ratio(
-            self, image: pygame.Surface, target_size: Tuple[int, int]
-    ) -> pygame.Surface:
+    def __center_image(self, image: pygame.Surface, target_size: Tuple[int, int]) -> pygame.Surface:
         """
-        Scale an image to fit within the target size while preserving its aspect ratio.
-        The scaled image is then centered on a surface of the target size.
+        Center an image on a transparent surface of the target size.
 
-        :param image: The original pygame.Surface to scale.
+        :param image: The pygame.Surface to center, it must fit within the target size.
         :param target_size: The (width, height) of the target area.
-        :return: A new pygame.Surface with the scaled image centered.
+        :return: A new pygame.Surface with the image centered.
         """
         target_width, target_height = target_size
         image_width, image_height = image.get_size()
 
-        # Calculate scale factor to fit image inside target_size while preserving aspect ratio.
-        scale_factor = min(target_width / image_width, target_height / image_height)
-        new_width = int(image_width * scale_factor)
-        new_height = int(image_height * scale_factor)
-
-        # Smoothly scale the image to the new dimensions.
-        scaled_image = pygame.transform.smoothscale(image, (new_width, new_height))
-
         # Create a new surface with the target size and a transparent background.
         final_surface = pygame.Surface(target_size, pygame.SRCALPHA)
         final_surface.fill((0, 0, 0, 0))
 
-        # Center the scaled image on the final surface.
-        position_x = (target_width - new_width) // 2
-        position_y = (target_height - new_height) // 2
-        final_surface.blit(scaled_image, (position_x, position_y))
+        # Center the image on the final surface.
+        position_x = (target_width - image_width) // 2
+        position_y = (target_height - image_height) // 2
+        final_surface.blit(image, (position_x, position_y))
 
         return final_surface
@@ -3,12 +3,15 @@ from __future__ import annotations
 import copy
 import random
 
+from src.games import game_state
 from src.managers.event.mini_game_manager import MiniGameManager
 from src.managers.manager import Manager
 from src.mini_games.cable_connection.cable_connection_mini_game import CableConnectionMiniGame
 from src.models.event_card import EventCard
 from typing import List, TYPE_CHECKING
 
+from src.scenes.scene import SceneFlow
+
 from src.views.event.event_view import EventView
 from src.views.event.events_active_view import EventsActiveView
 
@@ -33,7 +36,6 @@ class EventManager(Manager):
         # Split events into positive and negative lists
         self.negative_events = [card for card in event_cards if card.type == "negative"]
         self.positive_events = [card for card in event_cards if card.type == "positive"]
-        self.active_events: List[EventCard] = []
 
         # Adjustable probabilities for positive/negative events in star_config.json
         self.event_probability = self.game.engine.config.event_probability
@@ -106,12 +108,12 @@ class EventManager(Manager):
 
         return False
 
-    def trigger_event_if_possible(self) -> bool:
+    def trigger_event_if_possible(self) -> SceneFlow:
         """
         Check if an event should be triggered based on the configured probability.
         If triggered, apply event effects, display the event overlay, and then run the quiz.
 
-        :return: True if an event was triggered, otherwise False.
+        :return: Flow returning True if an event was triggered, otherwise False.
         """
         # Update probabilities in case error_count has changed
         self.__update_event_probabilities()
@@ -119,7 +121,7 @@ class EventManager(Manager):
         # Check against global event probability from the configuration
         if random.random() < self.event_probability:
             # an event should be triggered, check if a mini-game should be played
-            if self.mini_game_manager.play_mini_game_if_possible():
+            if (yield from self.mini_game_manager.play_mini_game_if_possible()):
                 return True
             else:
                 ##### run a random event #####
@@ -139,7 +141,7 @@ class EventManager(Manager):
                 # Select a random event from the list
                 event_card: EventCard = random.choice(filtered_events)
 
-                self.run_event(event_card)
+                yield from self.run_event(event_card)
 
                 # remove the event card if it's only once allowed
                 if event_card.once:
@@ -151,7 +153,7 @@ class EventManager(Manager):
                 return True
         return False
 
-    def run_event(self, event_card: EventCard):
+    def run_event(self, event_card: EventCard) -> SceneFlow:
         print(f"[EventManager] Event triggered: {event_card.name}")
         print(f"[EventManager] Fuel change: {event_card.fuel_change}, Hull change: {event_card.hull_change}")
 
@@ -160,7 +162,7 @@ class EventManager(Manager):
 
         # Display the event view
         event_view = EventView(self.game, event_card)
-        event_view.run()
+        yield event_view
 
         # apply effects
         self.apply_effects(event_card)
@@ -171,18 +173,20 @@ class EventManager(Manager):
 
     def run_active_events(self):
         """Runs active events, applies effects, and removes expired events."""
-        for index in reversed(range(len(self.get_active_events()))):
-            event = self.active_events[index]
+        for event in list(self.get_active_events()):
             self.apply_effects(event)
             event.duration -= 1
             print(f"[EventManager] active event {event.name} triggered, "
                   f"effects: Fuel Change: {event.fuel_change}, Hull change: {event.hull_change} "
                   f"new duration: {event.duration}")
             if event.duration <= 0:
-                self.active_events.pop(index)  # Sicheres Entfernen
+                self.game.state.remove_active_event(event)
+        if self.get_active_events():
+            # the remaining durations changed in place
+            self.game.state.notify(game_state.ACTIVE_EVENTS)
 
-    def get_active_events(self):
-        return self.active_events
+    def get_active_events(self) -> List[EventCard]:
+        return self.game.state.active_events
 
     def get_active_events_fuel_change(self):
         active_events = self.get_active_events()
@@ -193,7 +197,7 @@ class EventManager(Manager):
 
     def add_active_event(self, event: EventCard):
         copied_event = copy.deepcopy(event)
-        self.active_events.append(copied_event)
+        self.game.state.add_active_event(copied_event)
 
     def open_active_events_menu(self):
         print(f"[EventManager] Open events active menu")
@@ -203,7 +207,7 @@ class EventManager(Manager):
             self.events_active_view = EventsActiveView(self.game, self.__get_background_image_path(),
                                                        self.game.engine.config.event_panel_background_path)
 
-            self.events_active_view.run()
+            self.game.engine.push_scene(self.events_active_view)
 
     def close_active_events_menu(self):
         self.is_open = False
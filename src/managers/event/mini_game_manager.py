@@ -7,6 +7,7 @@ from src.mini_games.cable_connection.cable_connection_mini_game import CableConn
 from typing import List, TYPE_CHECKING
 
 from src.mini_games.magical_orbs_connection.magical_orbs_connection import MagicalOrbsConnectionMiniGame
+from src.scenes.scene import SceneFlow
 from src.views.mini_games.mini_game_start_menu import MiniGameStartMenu
 
 if TYPE_CHECKING:
@@ -21,7 +22,7 @@ class MiniGameManager(Manager):
         self.mini_game_probability: float = self.game.engine.config.mini_game_probability
         self.menu_backgrounds: List[str] = self.game.engine.config.mini_game_menu_backgrounds
 
-    def play_mini_game_if_possible(self):
+    def play_mini_game_if_possible(self) -> SceneFlow:
         if not self.__should_game_be_played():
             # Don't play a mini-game this round.
             return False
@@ -33,10 +34,10 @@ class MiniGameManager(Manager):
             self.__play_magical_orbs_connection_mini_game
         ]
         mini_game_choice = random.choice(mini_game_options)
-        result = mini_game_choice()
+        result = yield from mini_game_choice()
         return result
 
-    def __play_cable_connection_mini_game(self) -> bool:
+    def __play_cable_connection_mini_game(self) -> SceneFlow:
         background = self.__get_background_image_path()
 
         title_text = "Minispiel"
@@ -44,7 +45,7 @@ class MiniGameManager(Manager):
         button_text = "starten"
 
         mini_game_start_menu = MiniGameStartMenu(self.game, background, title_text, description_text, button_text)
-        mini_game_start_menu.run()
+        yield mini_game_start_menu
 
         num_pairs = random.choice([4, 6, 8])
         mini_game = CableConnectionMiniGame(self.game, background, num_pairs)
@@ -53,7 +54,7 @@ class MiniGameManager(Manager):
         result = mini_game.get_result()
         return result
 
-    def __play_magical_orbs_connection_mini_game(self) -> bool:
+    def __play_magical_orbs_connection_mini_game(self) -> SceneFlow:
         background = self.__get_background_image_path()
 
         title_text = "Minispiel"
@@ -61,7 +62,7 @@ class MiniGameManager(Manager):
         button_text = "starten"
 
         mini_game_start_menu = MiniGameStartMenu(self.game, background, title_text, description_text, button_text)
-        mini_game_start_menu.run()
+        yield mini_game_start_menu
 
         num_pairs = random.choice([6, 8, 10])
         mini_game = MagicalOrbsConnectionMiniGame(self.game, background, num_pairs)
@@ -70,14 +71,14 @@ class MiniGameManager(Manager):
         result = mini_game.get_result()
         return result
 
-    def __play_bubble_pop_challenge_mini_game(self):
+    def __play_bubble_pop_challenge_mini_game(self) -> SceneFlow:
         background = self.__get_background_image_path()
         title_text = "Minispiel"
         description_text = "Agatha behauptet steif und fest, dass ihre Reflexe unschlagbar sind – doch nach dem letzten Training tuscheln die anderen bereits hinter ihrem Rücken. Das kann sie natürlich nicht auf sich sitzen lassen! Also wird sie ihnen zeigen, wie schnell sie reagieren kann. Blasen tauchen überall auf, und sie bringt sie einer nach der anderen zum Platzen. Am Ende wird keiner mehr an ihrer Treffsicherheit zweifeln."
         button_text = "starten"
 
         mini_game_start_menu = MiniGameStartMenu(self.game, background, title_text, description_text, button_text)
-        mini_game_start_menu.run()
+        yield mini_game_start_menu
 
         mini_game = BubblePopChallengeMiniGame(self.game, background)
         mini_game.run()
@@ -85,7 +86,7 @@ class MiniGameManager(Manager):
         result = mini_game.get_result()
         return result
 
-    def __play_asteroid_dodge_mini_game(self) -> bool:
+    def __play_asteroid_dodge_mini_game(self) -> SceneFlow:
         background = self.__get_background_image_path()
         # todo define mini game title and description
         title_text = "Minispiel"
@@ -93,7 +94,7 @@ class MiniGameManager(Manager):
         button_text = "starten"
 
         mini_game_start_menu = MiniGameStartMenu(self.game, background, title_text, description_text, button_text)
-        mini_game_start_menu.run()
+        yield mini_game_start_menu
 
         mini_game_start_menu = AsteroidDodgeMiniGame(self.game, background)
         mini_game_start_menu.run()
@@ -8,6 +8,7 @@ from src.components.ui.ui_panel import UIPanel
 from src.components.ui.ui_label import UILabel
 from src.components.ui.ui_button import UIButton  # for other buttons
 from src.enums.color import Color
+from src.games import game_state
 from src.managers.manager import Manager
 
 if TYPE_CHECKING:
@@ -19,6 +20,7 @@ class HUDManager(Manager):
     The HUDManager creates and manages the Heads-Up Display (HUD) overlay.
     It uses pygame_gui elements to display the top bar (with fuel and hull),
     a sidebar with an inventory image, and a corner decoration.
+    The labels are updated when the game state changes (see GameState.subscribe).
     """
 
     def __init__(self, game: StoryGame):
@@ -40,6 +42,7 @@ class HUDManager(Manager):
 
         # Initialize HUD elements.
         self.__init_hud_elements()
+        self.game.state.subscribe(self.__on_state_changed)
 
     def __init_hud_elements(self):
         """
@@ -60,7 +63,7 @@ class HUDManager(Manager):
         # Top bar background image
         self.topbar_background: UIImage = UIImage(
             relative_rect=pygame.Rect(0, 0, self.screen_width, self.topbar_height),
-            image_surface=self.__load_image("assets/interface/hud/topbar_background.png",
+            image_surface=self.__load_image(self.game.engine.config.hud_topbar_background_path,
                                             fallback_size=(self.screen_width, self.topbar_height)),
             manager=self.ui_manager,
             container=self.topbar_panel,
@@ -70,7 +73,7 @@ class HUDManager(Manager):
         # Fuel icon (shifted further right)
         self.fuel_icon: UIImage = UIImage(
             relative_rect=pygame.Rect(150, 5, 40, 40),
-            image_surface=self.__load_image("assets/icons/fuel_icon.png", fallback_size=(40, 40)),
+            image_surface=self.__load_image(self.game.engine.config.hud_fuel_icon_path, fallback_size=(40, 40)),
             manager=self.ui_manager,
             container=self.topbar_panel,
             object_id="hud_fuel_icon"
@@ -86,7 +89,7 @@ class HUDManager(Manager):
         # Hull icon (shifted further right)
         self.hull_icon: UIImage = UIImage(
             relative_rect=pygame.Rect(320, 5, 40, 40),
-            image_surface=self.__load_image("assets/icons/hull_icon.png", fallback_size=(40, 40)),
+            image_surface=self.__load_image(self.game.engine.config.hud_hull_icon_path, fallback_size=(40, 40)),
             manager=self.ui_manager,
             container=self.topbar_panel,
             object_id="hud_hull_icon"
@@ -102,7 +105,7 @@ class HUDManager(Manager):
         self.position_label: UILabel = UILabel(
             relative_rect=pygame.Rect(-150, 10, 200, 30),
             manager=self.ui_manager,
-            text="",
+            text=self.__get_position_text(),
             container=self.topbar_panel,
             anchors={"top": "top", "right": "right"},
             object_id="hud_hull_label"
@@ -120,7 +123,7 @@ class HUDManager(Manager):
         # Sidebar background image
         self.sidebar_background: UIImage = UIImage(
             relative_rect=pygame.Rect(0, 0, 60, self.screen_height - self.topbar_height),
-            image_surface=self.__load_image("assets/interface/hud/sidebar_background.png",
+            image_surface=self.__load_image(self.game.engine.config.hud_sidebar_background_path,
                                             fallback_size=(80, self.screen_height - self.topbar_height)),
             manager=self.ui_manager,
             container=self.sidebar_panel,
@@ -155,7 +158,7 @@ class HUDManager(Manager):
         # Place the decoration in the top-right corner. We set it with a high starting height so it renders on top.
         self.corner_decoration: UIImage = UIImage(
             relative_rect=pygame.Rect(0, 0, 70, 70),
-            image_surface=self.__load_image("assets/interface/hud/corner_decoration.png", fallback_size=(70, 70)),
+            image_surface=self.__load_image(self.game.engine.config.hud_corner_decoration_path, fallback_size=(70, 70)),
             manager=self.ui_manager,
             starting_height=10,  # ensures this element is drawn above others
             object_id="hud_corner_decoration"
@@ -178,19 +181,26 @@ class HUDManager(Manager):
             # open events menu
             self.game.event_manager.open_active_events_menu()
 
-    def update(self):
+    def __on_state_changed(self, name: str):
         """
-        Update the HUD with the current game data.
-        This method should be called in the main game loop.
+        Update the label showing the changed value of the game state.
+
+        :param name: Name of the changed value (see GameState).
         """
         # active_events_fuel_change_amount = self.game.event_manager.get_active_events_fuel_change()
         # active_events_fuel_change = f"Events: <br>"
         # if active_events_fuel_change_amount > 0:
         #    active_events_fuel_change += f"{active_events_fuel_change}"
 
-        self.fuel_label.set_text(f"{self.game.fuel}")
-        self.hull_label.set_text(f"{self.game.hull}")
-        self.position_label.set_text(f"R{self.game.player_row + 1} S{self.game.player_col + 1}")
+        if name == game_state.FUEL:
+            self.fuel_label.set_text(f"{self.game.fuel}")
+        elif name == game_state.HULL:
+            self.hull_label.set_text(f"{self.game.hull}")
+        elif name == game_state.POSITION:
+            self.position_label.set_text(self.__get_position_text())
+
+    def __get_position_text(self) -> str:
+        return f"R{self.game.player_row + 1} S{self.game.player_col + 1}"
 
     def __load_image(self, path: str, fallback_size: Tuple[int, int]) -> pygame.Surface:
         """
@@ -202,7 +212,7 @@ class HUDManager(Manager):
         :return: A pygame.Surface containing the loaded (or fallback) image.
         """
         try:
-            image = pygame.image.load(path).convert_alpha()
+            image = self.game.engine.asset_cache.get_image(path, alpha=True)
             return image
         except Exception as error:
             print(f"[HUDManager] Could not load image at '{path}': {error}")
@@ -211,6 +221,7 @@ class HUDManager(Manager):
             return fallback_surface
 
     def kill_children(self):
+        self.game.state.unsubscribe(self.__on_state_changed)
         self.topbar_panel.kill()
         self.sidebar_panel.kill()
         self.corner_decoration.kill()
@@ -46,5 +46,7 @@ class InputManager(Manager):
         elif event.key == pygame.K_d:
             self.game.debug_manager.toggle_debug_mode()
             pass
+        elif self.game.engine.scene_profiler.handle_event(event):
+            return
         if self.game.ui_manager.gui_manager.get_focus_set() is None:
             self.game.handle_movement(event)
@@ -5,6 +5,7 @@ import sys
 from smbus2 import SMBus
 from colorama import Fore, Style, init
 
+from src.games.board import get_neighbours
 from src.managers.manager import Manager
 
 if TYPE_CHECKING:
@@ -297,12 +298,7 @@ class MCPInputManager(Manager):
         """
         Returns a list of valid neighboring positions for the hexagonal game board.
         """
-        potential_moves = [
-            (current_row, current_col - 1), (current_row, current_col + 1),  # Left & Right
-            (current_row - 1, current_col - (current_row % 2)), (current_row - 1, current_col + (1 - current_row % 2)),  # Upper left & upper right
-            (current_row + 1, current_col - (current_row % 2)), (current_row + 1, current_col + (1 - current_row % 2))   # Lower left & lower right
-        ]
-        return [(row, col) for row, col in potential_moves if row >= 0 and col >= 0]
+        return get_neighbours(current_row, current_col)
 
     def process_events(self) -> None:
         """
@@ -18,21 +18,19 @@ class InventoryManager(Manager):
         self.is_open: bool = False
         self.background_paths = self.game.engine.config.inventory_background_paths
         self.inventory_view: InventoryView | None = None
-        self.game_objects: List[GameObject] = []
 
     def add_item(self, game_object: GameObject | None) -> None:
         """
         Adds a GameObject to the inventory.
         """
         print(f"[InventoryManager] item {game_object.name} added")
-        self.game_objects.append(game_object)
-        pass
+        self.game.state.add_item(game_object)
 
-    def get_items(self):
+    def get_items(self) -> List[GameObject]:
         """
         Returns a list of all GameObjects in the inventory.
         """
-        return self.game_objects
+        return self.game.state.inventory
 
     def open_inventory(self):
         """
@@ -44,7 +42,7 @@ class InventoryManager(Manager):
             self.inventory_view = InventoryView(self.game, self.__get_background_image_path(),
                                                 self.game.engine.config.inventory_panel_background_path,
                                                 self.game.engine.config.inventory_empty_slot_path)
-            self.inventory_view.run()
+            self.game.engine.push_scene(self.inventory_view)
 
     def close_inventory(self):
         """
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Tuple
+
+from src.games.board import get_neighbours
+from src.managers.manager import Manager
+from src.models.planet import Planet
+from src.plugins.asset_baker import VIDEO_EXTENSIONS
+from src.plugins.video_clip_pool import VideoClipPool
+
+if TYPE_CHECKING:
+    from src.games.story_game import StoryGame
+
+
+class PrefetchManager(Manager):
+    """
+    Prefetches the assets of the fields around the player, while the player is still deciding where to move.
+    planets get their background, planet image and still image cutscene prefetched (fuel planets also the
+    fuel station backgrounds), plain fields the quiz and event backgrounds (the views choose one randomly).
+    the images are decoded by the asset cache thread pool and converted a few per frame in update.
+    the video cutscenes of the current and the adjacent planets are kept opened in the video clip pool.
+    """
+
+    def __init__(self, game: StoryGame):
+        """
+        :param game: The StoryGame instance providing the player position and the planets.
+        """
+        super().__init__()
+        self.game: StoryGame = game
+        self.prefetched_position: Tuple[int, int] | None = None
+        self.video_clip_pool: VideoClipPool = VideoClipPool(game.engine.audio_cache)
+
+    def update(self):
+        """
+        Schedule the prefetch if the player moved and convert finished decodes.
+        This method should be called in the main game loop.
+        """
+        position = (self.game.player_row, self.game.player_col)
+        if position != self.prefetched_position:
+            self.prefetched_position = position
+            self.__prefetch_neighbours(*position)
+        self.game.engine.asset_cache.process_prefetched()
+
+    ##### private methods #####
+    def __prefetch_neighbours(self, row: int, col: int):
+        planets = {(planet.row, planet.col): planet for planet in self.game.data.planets}
+        has_plain_field = False
+        video_paths: List[str] = []
+        current_planet = planets.get((row, col))
+        if current_planet is not None:
+            # the wormhole cutscene is played from the menu of the current planet
+            video_paths += self.__get_video_paths(current_planet)
+        for position in get_neighbours(row, col):
+            planet = planets.get(position)
+            if planet is None:
+                has_plain_field = True
+            else:
+                self.__prefetch_planet(planet)
+                video_paths += self.__get_video_paths(planet)
+        self.video_clip_pool.retain([self.game.engine.asset_cache.resolve_path(path) for path in video_paths])
+
+        if has_plain_field:
+            asset_cache = self.game.engine.asset_cache
+            for path in self.game.engine.config.quiz_backgrounds:
+                asset_cache.prefetch(path)
+            for path in self.game.engine.config.event_window_background_paths:
+                asset_cache.prefetch(path, (self.game.engine.width, self.game.engine.height))
+
+    def __prefetch_planet(self, planet: Planet):
+        asset_cache = self.game.engine.asset_cache
+        if planet.background_image:
+            asset_cache.prefetch(planet.background_image)
+        if planet.planet_image:
+            asset_cache.prefetch(planet.planet_image)
+        if planet.cutscene_media and not planet.cutscene_media.lower().endswith(VIDEO_EXTENSIONS):
+            asset_cache.prefetch(planet.cutscene_media, self.game.window.get_size())
+        if planet.is_fuel_planet:
+            for path in self.game.engine.config.planet_menu_fuel_station_background_image_paths:
+                asset_cache.prefetch(path)
+
+    @staticmethod
+    def __get_video_paths(planet: Planet) -> List[str]:
+        return [media for media in (planet.cutscene_media, planet.wormhole_cutscene_media)
+                if media and media.lower().endswith(VIDEO_EXTENSIONS)]
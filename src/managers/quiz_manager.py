@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Optional
 
 from src.managers.manager import Manager
 from src.models.quiz import Quiz
+from src.scenes.scene import SceneFlow
 from src.views.common.info_view import InfoView
 from src.views.quiz.boolean_view import BooleanView
 from src.views.quiz.error_view import ErrorView
@@ -31,16 +32,16 @@ class QuizManager(Manager):
         self.is_last_quiz_correct: bool = False
         self.last_quiz_type: str | None = None
 
-    def run_general_field_action(self):
+    def run_general_field_action(self) -> SceneFlow:
         quiz = self.get_random_quiz_for_planet("default")
         print("[QuizManager] selected quiz_type: ", quiz.quiz_type)
 
         if quiz.quiz_type == "quiz":
-            self.run_quiz(quiz)
+            yield from self.run_quiz(quiz)
         if quiz.quiz_type == "task":
-            self.run_task(quiz)
+            yield from self.run_task(quiz)
         if quiz.quiz_type == "boolean":
-            self.run_boolean(quiz)
+            yield from self.run_boolean(quiz)
 
         ##### update statistics #####
         self.game.statistics_manager.record_quiz_task_result(quiz, self.is_last_quiz_correct)
@@ -49,28 +50,28 @@ class QuizManager(Manager):
 
         # display error view (Nachhilfeunterricht)
         if not self.is_last_quiz_correct and quiz.quiz_type == "task":
-            self.run_error(quiz)
+            yield from self.run_error(quiz)
         # display general error message
         elif not self.is_last_quiz_correct:
-            self.run_error_text(quiz)
+            yield from self.run_error_text(quiz)
 
-    def run_quiz(self, quiz: Quiz):
+    def run_quiz(self, quiz: Quiz) -> SceneFlow:
         view = QuizView(self.game, quiz)
-        view.run()
+        yield view
 
-    def run_task(self, quiz: Quiz):
+    def run_task(self, quiz: Quiz) -> SceneFlow:
         view = TaskView(self.game, quiz)
-        view.run()
+        yield view
 
-    def run_boolean(self, quiz: Quiz):
+    def run_boolean(self, quiz: Quiz) -> SceneFlow:
         view = BooleanView(self.game, quiz)
-        view.run()
+        yield view
 
-    def run_error(self, quiz: Quiz):
+    def run_error(self, quiz: Quiz) -> SceneFlow:
         view = ErrorView(self.game, quiz)
-        view.run()
+        yield view
 
-    def run_error_text(self, quiz: Quiz):
+    def run_error_text(self, quiz: Quiz) -> SceneFlow:
         portrait_path = self.game.engine.config.portrait_milo
         if quiz.person.lower() == "milo":
             portrait_path = self.game.engine.config.portrait_milo
@@ -84,7 +85,7 @@ class QuizManager(Manager):
         view = InfoView(self.game, "Hoppla!", portrait_path,
                         self.get_background_image_path(), quiz.solution,
                         "Weiter")
-        view.run()
+        yield view
 
     def process_submit(self, quiz: Quiz, user_input: str | bool):
         is_correct = self.__is_user_input_correct(quiz, user_input)
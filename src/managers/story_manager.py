@@ -7,6 +7,7 @@ from src.managers.manager import Manager
 from src.models.game_object import GameObject
 from src.models.planet import Planet
 from src.models.story import Story
+from src.scenes.scene import SceneFlow
 from src.views.decisions.final_decision_view import FinalDecisionView
 from src.views.decisions.story_decision_view import StoryDecisionView
 from src.views.object.object_found_view import ObjectFoundView
@@ -26,22 +27,22 @@ class StoryManager(Manager):
         super().__init__()
         self.game: StoryGame = game
 
-    def show_planet_menu(self, planet: Planet):
+    def show_planet_menu(self, planet: Planet) -> SceneFlow:
         planet_menu = PlanetMenu(self.game, planet)
-        return planet_menu.run()
+        return (yield planet_menu)
 
-    def show_planet_station_menu(self, planet: Planet, fuel_station_background_path: str):
+    def show_planet_station_menu(self, planet: Planet, fuel_station_background_path: str) -> SceneFlow:
         station = copy.deepcopy(planet)
         station.planet_image = "assets/images/fuel_station/fuel_station_icon.png"
         station.background_image = fuel_station_background_path
         station.description = "Tankstellen befinden sich bei jedem Planeten. Es besteht die Möglichkeit gratis zu tanken. (+5) Oder eine Aufgabe zu lösen und den Tank damit mehr zu füllen. (+10)"
         planet_station_menu = PlanetStationMenu(self.game, station)
 
-        return planet_station_menu.run()
+        return (yield planet_station_menu)
 
-    def show_spacestation_menu(self, spacestation: Planet):
+    def show_spacestation_menu(self, spacestation: Planet) -> SceneFlow:
         spacestation_menu = SpacestationMenu(self.game, spacestation)
-        button_clicked = spacestation_menu.run()
+        button_clicked = yield spacestation_menu
 
         ##### #####
 
@@ -49,21 +50,20 @@ class StoryManager(Manager):
         if button_clicked == 2:
             print("Wurmloch betreten")
             if spacestation.wormhole_cutscene_media is not None:
-                self.game.ui_manager.display_cutscene(spacestation.wormhole_cutscene_media)
+                yield from self.game.ui_manager.display_cutscene(spacestation.wormhole_cutscene_media)
 
             # subtract wormhole cost, add + 1 as the movement costs 1 fuel
             fuel_cost = self.game.engine.config.game_settings_wormhole_cost
             self.game.fuel = self.game.fuel - fuel_cost + 1
-            self.game.hud_manager.update()
 
             if spacestation.row == 1:
                 ##### first spacestation jump to second one #####
-                self.game.move_player(11, 4)
+                yield from self.game.run_move(11, 4)
             else:
                 ##### second spacestation jump to first one #####
-                self.game.move_player(1, 7)
+                yield from self.game.run_move(1, 7)
 
-    def show_planet_story(self, planet: Planet, story: Story):
+    def show_planet_story(self, planet: Planet, story: Story) -> SceneFlow:
         # iterate over the story and or quiz / task / boolean blocks
 
         current_quiz_count = 0
@@ -80,11 +80,11 @@ class StoryManager(Manager):
                     None
                 )
                 story_block_view = StoryBlockView(self.game, planet, story_option_10)
-                story_block_view.run()
+                yield story_block_view
 
                 game_over_view = GameOverView(self.game,
                                               self.game.engine.config.game_over_terraform_backgrounds_paths[0])
-                game_over_view.run()
+                yield game_over_view
                 self.game.stop()
 
                 pass
@@ -99,10 +99,10 @@ class StoryManager(Manager):
                     None
                 )
                 story_block_view = StoryBlockView(self.game, planet, story_option_20)
-                story_block_view.run()
+                yield story_block_view
 
                 decision = FinalDecisionView(self.game, block.decision)
-                decision.run()
+                yield decision
 
                 story_option_21 = next(
                     (block for block in story.blocks if
@@ -110,11 +110,11 @@ class StoryManager(Manager):
                     None
                 )
                 story_block_view = StoryBlockView(self.game, planet, story_option_21)
-                story_block_view.run()
+                yield story_block_view
 
                 game_over_view = GameOverView(self.game,
                                               self.game.engine.config.game_over_reject_background_paths[0])
-                game_over_view.run()
+                yield game_over_view
                 self.game.stop()
 
                 # test
@@ -123,7 +123,7 @@ class StoryManager(Manager):
 
             if block.block_type == "story":
                 story_block_view = StoryBlockView(self.game, planet, block)
-                story_block_view.run()
+                yield story_block_view
             # for story_line in block.story_lines:
             #     story_view = StoryView(self.game, planet, story_line)
             #    story_view.run()
@@ -138,11 +138,11 @@ class StoryManager(Manager):
                 while is_correct is False:
                     match block.block_type:
                         case "quiz":
-                            self.game.quiz_manager.run_quiz(block.quiz)
+                            yield from self.game.quiz_manager.run_quiz(block.quiz)
                         case "task":
-                            self.game.quiz_manager.run_task(block.quiz)
+                            yield from self.game.quiz_manager.run_task(block.quiz)
                         case "boolean":
-                            self.game.quiz_manager.run_boolean(block.quiz)
+                            yield from self.game.quiz_manager.run_boolean(block.quiz)
                     ##### update statistics #####
                     is_correct = self.game.quiz_manager.is_last_quiz_correct
                     self.game.statistics_manager.record_quiz_task_result(block.quiz, is_correct)
@@ -152,45 +152,44 @@ class StoryManager(Manager):
                         print(f"[Story Quiz] failed attempt: {attempts}")
                         # if user failed X attempts, it's game over -> defined in star_config
                         if attempts == self.game.engine.config.game_over_story_quiz_max_attempts:
-                            return self.game.run_game_over()
+                            yield from self.game.run_game_over()
+                            return
                         # show consequence story line
                         consequence_view = StoryView(self.game, planet, block.quiz.story_consequence)
-                        consequence_view.run()
+                        yield consequence_view
 
                         attempts += 1
 
                 if total_quiz_count == current_quiz_count:
                     print(f"[Story Quiz] object gained")
-                    self.show_object_found(planet)
+                    yield from self.show_object_found(planet)
 
             if block.block_type == "story_decision":
                 decision = StoryDecisionView(self.game, block.decision)
-                decision.run()
-                option = decision.selected_option
+                option = yield decision
                 final_decision = option
 
             if block.block_type == "final_decision":
                 # todo game finished screen improvement
                 decision = FinalDecisionView(self.game, block.decision)
-                decision.run()
-                option = decision.selected_option
+                option = yield decision
                 print("decision option selected:", option)
                 if option == 1:
                     reject_view = GameOverView(self.game,
                                                self.game.engine.config.game_over_reject_background_paths[0])
-                    reject_view.run()
+                    yield reject_view
                     self.game.stop()
                 if option == 2:
                     terra_forming_view = GameOverView(self.game,
                                                       self.game.engine.config.game_over_terraform_backgrounds_paths[0])
-                    terra_forming_view.run()
+                    yield terra_forming_view
                     self.game.stop()
 
-    def show_object_found(self, planet: Planet):
+    def show_object_found(self, planet: Planet) -> SceneFlow:
         game_object: GameObject = next(
             (game_object for game_object in self.game.data.game_objects if
              game_object.location.lower() == planet.name.lower()), None)
         if game_object is not None:
             self.game.inventory_manager.add_item(game_object)
             object_found_view = ObjectFoundView(self.game, planet, game_object)
-            object_found_view.run()
+            yield object_found_view
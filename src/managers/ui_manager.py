@@ -2,12 +2,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-import pygame
 import pygame_gui
 
-from src.enums.color import Color
 from src.managers.manager import Manager
-from src.plugins.video_player import VideoPlayer
+from src.scenes.cutscene_scene import CutsceneScene
+from src.scenes.scene import SceneFlow
 
 if TYPE_CHECKING:
     from src.games.story_game import StoryGame
@@ -26,42 +25,10 @@ class UIManager(Manager):
         self.game: StoryGame = game
         self.gui_manager: pygame_gui.UIManager = self.game.engine.pygame_gui_ui_manager
 
-    def display_cutscene(self, media_path: str) -> None:
+    def display_cutscene(self, media_path: str) -> SceneFlow:
         """
-        Display a cutscene image or video and wait for user input to continue.
+        Display a cutscene image or video and wait for user input (or the end of the video) to continue.
+        the cutscene runs as a scene inside the engine loop, so the game board is still polled.
         :param media_path: Path to the cutscene media (image or video).
         """
-        if media_path.lower().endswith(('.mp4', '.avi', '.mov', '.mkv')):
-            player = VideoPlayer(self.game.window)
-            player.set_video(media_path)
-            player.play()
-        else:
-            waiting = True
-            clock = pygame.time.Clock()
-
-            try:
-                image = pygame.image.load(media_path).convert()
-                image = pygame.transform.scale(image, self.game.window.get_size())
-            except Exception as e:
-                print(f"[UIManager] Cutscene could not be loaded {media_path}: {e}")
-                image = pygame.Surface(self.game.window.get_size())
-                image.fill(Color.BLACK.value)
-
-            while waiting and self.game.is_running:
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        self.game.stop()
-                        return
-                    elif event.type == pygame.KEYDOWN:
-                        if event.key == pygame.K_ESCAPE:
-                            self.game.stop()
-                            return
-                        else:
-                            waiting = False
-                    elif event.type == pygame.MOUSEBUTTONDOWN:
-                        waiting = False
-
-                self.game.draw()
-                self.game.window.blit(image, (0, 0))
-                pygame.display.flip()
-                clock.tick(60)
+        yield CutsceneScene(self.game, media_path)
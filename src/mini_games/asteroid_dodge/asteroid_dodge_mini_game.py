@@ -27,7 +27,7 @@ class AsteroidDodgeMiniGame(MiniGame):
         """
         super().__init__(game, background_path)
         # Load the background image
-        self.background_image: pygame.Surface = pygame.image.load(background_path).convert()
+        self.background_image: pygame.Surface = self.game.engine.asset_cache.get_image(background_path)
         # Game duration and timer variables
         self.duration: float = duration
         self.elapsed_time: float = 0.0
@@ -175,10 +175,9 @@ class AsteroidDodgeMiniGame(MiniGame):
         # Draw each asteroid as a red ellipse.
         for asteroid in self.asteroids:
             pygame.draw.ellipse(self.game.window, (255, 0, 0), asteroid)
-        # Display the remaining time.
-        font = pygame.font.SysFont(None, 36)
+        # Display the remaining time, the text is only rendered when the seconds change.
         time_left = max(0, int(self.duration - self.elapsed_time))
-        time_text = font.render(f"Zeit übrig: {time_left}", True, (255, 255, 255))
+        time_text = self.game.engine.font_cache.render_text(f"Zeit übrig: {time_left}", None, 36, (255, 255, 255))
         self.game.window.blit(time_text, (150, 50))
 
     def spawn_asteroid(self) -> None:
@@ -210,17 +209,9 @@ class AsteroidDodgeMiniGame(MiniGame):
         """
         self._build_ui()
         self.start()
-        clock: pygame.time.Clock = pygame.time.Clock()
         self.is_running = True
 
-        while self.is_running:
-            delta_time: float = clock.tick(self.game.engine.fps) / 1000.0
-            for event in pygame.event.get():
-                self.handle_event(event)
-            self.game.ui_manager.gui_manager.update(delta_time)
-            self.update(delta_time)
-            self.draw()
-            pygame.display.update()
+        self._run_loop()
 
         self.kill()
 
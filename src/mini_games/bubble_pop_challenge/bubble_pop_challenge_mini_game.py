@@ -46,7 +46,7 @@ class BubblePopChallengeMiniGame(MiniGame):
         config = data.get("BubblePopChallengeMiniGame", {})
         sky_background_paths: List[str] = config.get("backgrounds", [])
         chosen_bg: str = random.choice(sky_background_paths) if sky_background_paths else background
-        self.background_image: pygame.Surface = pygame.image.load(chosen_bg).convert()
+        self.background_image: pygame.Surface = self.game.engine.asset_cache.get_image(chosen_bg)
 
         # UI elements.
         self.title: Optional[UILabel] = None
@@ -238,17 +238,9 @@ class BubblePopChallengeMiniGame(MiniGame):
     def run(self) -> None:
         """Main game loop."""
         self._build_ui()
-        clock: pygame.time.Clock = pygame.time.Clock()
         self.is_running = True
 
-        while self.is_running:
-            time_elapsed: float = clock.tick(self.game.engine.fps) / 1000.0
-            for event in pygame.event.get():
-                self.handle_event(event)
-            self.game.ui_manager.gui_manager.update(time_elapsed)
-            self.update(time_elapsed)
-            self.draw()
-            pygame.display.update()
+        self._run_loop()
 
         self.kill()
 
@@ -63,9 +63,9 @@ class CableConnectionMiniGame(MiniGame):
         door_image_paths: List[str] = config.get("backgrounds")
         panel_image_paths: List[str] = config.get("panel_images")
         chosen_door_image: str = random.choice(door_image_paths)
-        self.background_image: pygame.Surface = pygame.image.load(chosen_door_image).convert()
+        self.background_image: pygame.Surface = self.game.engine.asset_cache.get_image(chosen_door_image)
         chosen_panel_image: str = random.choice(panel_image_paths)
-        self.panel_image_surface: pygame.Surface = pygame.image.load(chosen_panel_image).convert()
+        self.panel_image_surface: pygame.Surface = self.game.engine.asset_cache.get_image(chosen_panel_image)
 
         # UI elements
         self.title: Optional[UILabel] = None
@@ -357,16 +357,10 @@ class CableConnectionMiniGame(MiniGame):
         """Main loop for the mini-game."""
         self._build_ui()
         self._build_endpoints()
-        clock: pygame.time.Clock = pygame.time.Clock()
         self.is_running = True
 
-        while self.is_running:
-            time_elapsed: float = clock.tick(self.game.engine.fps) / 1000.0
-            for event in pygame.event.get():
-                self.handle_event(event)
-            self.game.ui_manager.gui_manager.update(time_elapsed)
-            self.draw()
-            pygame.display.update()
+        # the cables are only moved by dragging, the physics space isn't stepped
+        self._run_loop(call_update=False)
 
         self.kill()
 
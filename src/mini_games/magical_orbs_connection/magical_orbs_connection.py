@@ -64,9 +64,9 @@ class MagicalOrbsConnectionMiniGame(MiniGame):
         sky_background_paths: List[str] = config.get("backgrounds", [])
         panel_image_paths: List[str] = config.get("panel_images", [])
         chosen_sky_background: str = random.choice(sky_background_paths) if sky_background_paths else background
-        self.background_image: pygame.Surface = pygame.image.load(chosen_sky_background).convert()
+        self.background_image: pygame.Surface = self.game.engine.asset_cache.get_image(chosen_sky_background)
         chosen_panel_image: str = random.choice(panel_image_paths) if panel_image_paths else background
-        self.panel_image_surface: pygame.Surface = pygame.image.load(chosen_panel_image).convert()
+        self.panel_image_surface: pygame.Surface = self.game.engine.asset_cache.get_image(chosen_panel_image)
 
         # UI elements.
         self.title: Optional[UILabel] = None
@@ -372,17 +372,9 @@ class MagicalOrbsConnectionMiniGame(MiniGame):
         """Main game loop."""
         self._build_ui()
         self._build_stars()
-        clock: pygame.time.Clock = pygame.time.Clock()
         self.is_running = True
 
-        while self.is_running:
-            time_elapsed: float = clock.tick(self.game.engine.fps) / 1000.0
-            for event in pygame.event.get():
-                self.handle_event(event)
-            self.game.ui_manager.gui_manager.update(time_elapsed)
-            self.update(time_elapsed)
-            self.draw()
-            pygame.display.update()
+        self._run_loop()
 
         self.kill()
 
@@ -75,3 +75,33 @@ class MiniGame(ABC):
         run the mini-game.
         """
         raise NotImplementedError("run not implemented")
+
+    def _run_loop(self, call_update: bool = True) -> None:
+        """
+        Run frames (events, update, draw, present) until is_running is cleared, the phases are recorded by the
+        frame profiler of the engine. the mini-game is reported to the scene profiler as the active scene,
+        the key of the scene profiler is taken out of the events.
+        :param call_update: False to only update the ui, for mini-games driven by their events alone.
+        """
+        clock: pygame.time.Clock = pygame.time.Clock()
+        frame_profiler = self.game.engine.frame_profiler
+        scene_profiler = self.game.engine.scene_profiler
+        scene_profiler.set_scene(self)
+        while self.is_running:
+            self.game.engine.begin_frame()
+            delta_time: float = clock.tick(self.game.engine.fps) / 1000.0
+            frame_profiler.mark("wait")
+            for event in pygame.event.get():
+                if not scene_profiler.handle_event(event):
+                    self.handle_event(event)
+            frame_profiler.mark("events")
+            self.game.ui_manager.gui_manager.update(delta_time)
+            if call_update:
+                self.update(delta_time)
+            frame_profiler.mark("update")
+            self.draw()
+            frame_profiler.mark("draw")
+            pygame.display.update()
+            frame_profiler.mark("present")
+            frame_profiler.end_frame()
+        scene_profiler.end_scene(self)
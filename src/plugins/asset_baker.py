@@ -0,0 +1,311 @@
+import json
+import os
+import subprocess
+from typing import Any, Dict, List, Set, Tuple
+
+import pygame
+from imageio_ffmpeg import get_ffmpeg_exe
+from pygame import Surface
+
+from src.plugins.asset_pack import AssetPackWriter, get_pixel_format, hash_file
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp", ".bmp")
+VIDEO_EXTENSIONS = (".mp4", ".avi", ".mov", ".mkv")
+MANIFEST_FILE_NAME = "manifest.json"
+PACK_FILE_NAME = "assets.pack"
+MANIFEST_VERSION = 3
+# generated files in the data directory, they don't contain asset references
+IGNORED_DATA_FILES = ("asset_manifest.json",)
+
+
+def normalize_asset_path(path: str) -> str:
+    """
+    Normalize an asset path so that the json references and the manifest keys match on every OS.
+    :param path: Path to the asset, relative to the project root.
+    :return: The normalized path with forward slashes.
+    """
+    return os.path.normpath(path).replace(os.sep, "/")
+
+
+class AssetBaker:
+    """
+    Offline bake step (see bake.py)
+    collects every image referenced in the data files, downscales it to the smallest size still covering the
+    engine resolution (full screen backgrounds are drawn unscaled and must fill the window)
+    and writes it as RLE compressed TGA, which loads a lot faster than a PNG on the raspberry pi.
+    the manifest maps each source path to the content hash of the source file,
+    the baked files are named by that hash so identical images are only baked once.
+    the size and pixel format of the source image is recorded as well (see AssetManifest.generate).
+    all baked images are additionally written into a single asset pack (see AssetPack).
+    videos are transcoded to the engine resolution and the configured video frame rate,
+    so the VideoPlayer neither has to decode more pixels and frames than it shows nor scale them.
+    """
+
+    def __init__(self, data_directory: str, output_directory: str, resolution: Tuple[int, int], video_fps: int):
+        """
+        :param data_directory: Directory containing the json data files (star_config.json included).
+        :param output_directory: Directory the baked images and the manifest are written to.
+        :param resolution: Engine resolution (width, height), images are only scaled down to cover it.
+        :param video_fps: Frame rate the videos are transcoded to.
+        """
+        self.data_directory: str = data_directory
+        self.output_directory: str = output_directory
+        self.resolution: Tuple[int, int] = resolution
+        self.video_fps: int = video_fps
+
+    def collect_asset_paths(self) -> List[str]:
+        """
+        Collect all asset paths referenced in the json files of the data directory.
+        :return: Sorted list of normalized asset paths.
+        """
+        paths: Set[str] = set()
+        for file_name in sorted(os.listdir(self.data_directory)):
+            if not file_name.endswith(".json") or file_name in IGNORED_DATA_FILES:
+                continue
+            with open(os.path.join(self.data_directory, file_name), "r", encoding="utf-8") as file:
+                self.__collect_strings(json.load(file), paths)
+        return sorted({normalize_asset_path(path) for path in paths})
+
+    def collect_image_paths(self) -> List[str]:
+        """
+        Collect all image paths referenced in the json files of the data directory.
+        :return: Sorted list of normalized image paths.
+        """
+        return [path for path in self.collect_asset_paths() if path.lower().endswith(IMAGE_EXTENSIONS)]
+
+    def bake(self) -> Dict[str, Any]:
+        """
+        Bake all referenced images and videos and write the manifest and the asset pack.
+        assets whose content hash is already baked for the current settings are skipped.
+        :return: The written manifest.
+        """
+        images_directory = os.path.join(self.output_directory, "images")
+        videos_directory = os.path.join(self.output_directory, "videos")
+        os.makedirs(images_directory, exist_ok=True)
+        os.makedirs(videos_directory, exist_ok=True)
+
+        previous_images = self.__load_previous_images()
+        manifest: Dict[str, Any] = {
+            "version": MANIFEST_VERSION,
+            "resolution": list(self.resolution),
+            "video_fps": self.video_fps,
+            "sources": {},
+            "images": {},
+            "videos": {},
+        }
+        baked_count = 0
+        for path in self.collect_asset_paths():
+            is_image = path.lower().endswith(IMAGE_EXTENSIONS)
+            if not is_image and not path.lower().endswith(VIDEO_EXTENSIONS):
+                continue
+            if not os.path.isfile(path):
+                print(f"[AssetBaker] missing asset {path}, skipped")
+                continue
+
+            content_hash = hash_file(path)
+            stat = os.stat(path)
+            manifest["sources"][path] = {
+                "hash": content_hash,
+                "bytes": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+            }
+            if content_hash in manifest["images"] or content_hash in manifest["videos"]:
+                continue
+
+            if is_image:
+                # the resolution and the manifest version are part of the name, a resolution or
+                # scaling change must not reuse old files
+                baked_path = normalize_asset_path(os.path.join(
+                    images_directory,
+                    f"{content_hash}_{self.resolution[0]}x{self.resolution[1]}_v{MANIFEST_VERSION}.tga"))
+                previous_image = previous_images.get(content_hash, {})
+                if os.path.isfile(baked_path) and "source_size" in previous_image:
+                    image_entry = {**previous_image, "file": baked_path}
+                else:
+                    image_entry = self.__bake_image(path, baked_path)
+                    baked_count += 1
+                manifest["images"][content_hash] = image_entry
+            else:
+                baked_path = normalize_asset_path(os.path.join(
+                    videos_directory,
+                    f"{content_hash}_{self.resolution[0]}x{self.resolution[1]}_{self.video_fps}.mp4"))
+                if not os.path.isfile(baked_path):
+                    if not self.__transcode_video(path, baked_path):
+                        continue
+                    baked_count += 1
+                manifest["videos"][content_hash] = {"file": baked_path}
+
+        self.__remove_orphans(images_directory, manifest["images"])
+        self.__remove_orphans(videos_directory, manifest["videos"])
+        with open(os.path.join(self.output_directory, MANIFEST_FILE_NAME), "w", encoding="utf-8") as file:
+            json.dump(manifest, file, indent=2)
+
+        print(f"[AssetBaker] {len(manifest['sources'])} assets referenced, {baked_count} baked, "
+              f"{len(manifest['images'])} images and {len(manifest['videos'])} videos in {self.output_directory}")
+
+        ##### asset pack #####
+        pack_writer = AssetPackWriter(self.resolution)
+        for content_hash, image in manifest["images"].items():
+            sources = {path: source for path, source in manifest["sources"].items() if source["hash"] == content_hash}
+            pack_writer.add(sources, image["file"])
+        pack_bytes = pack_writer.write(os.path.join(self.output_directory, PACK_FILE_NAME))
+        print(f"[AssetBaker] asset pack written ({pack_bytes // (1024 * 1024)} MB)")
+        return manifest
+
+    ##### private methods #####
+    def __bake_image(self, path: str, baked_path: str) -> Dict[str, Any]:
+        image = pygame.image.load(path)
+        source_size = image.get_size()
+        source_format = get_pixel_format(image)
+        size = self.__get_covering_size(source_size)
+        if size != source_size:
+            image = pygame.transform.smoothscale(self.__to_32_bit(image), size)
+        # pygame writes TGA files RLE compressed
+        pygame.image.save(image, baked_path)
+        return {"file": baked_path, "size": list(size), "source_size": list(source_size), "format": source_format}
+
+    def __load_previous_images(self) -> Dict[str, Any]:
+        # baked images of the last bake by content hash, their files are reused if they still exist
+        manifest_path = os.path.join(self.output_directory, MANIFEST_FILE_NAME)
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as file:
+                manifest = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        if manifest.get("version") != MANIFEST_VERSION:
+            return {}
+        return manifest.get("images", {})
+
+    def __get_covering_size(self, size: Tuple[int, int]) -> Tuple[int, int]:
+        # the smaller side fits the resolution, the other one may overhang (like the unbaked image would)
+        scale_factor = max(self.resolution[0] / size[0], self.resolution[1] / size[1])
+        if scale_factor >= 1:
+            # never upscale
+            return size
+        return max(1, round(size[0] * scale_factor)), max(1, round(size[1] * scale_factor))
+
+    @staticmethod
+    def __to_32_bit(image: Surface) -> Surface:
+        # smoothscale only accepts 24 and 32 bit surfaces, palette images are converted first
+        if image.get_bitsize() in (24, 32):
+            return image
+        return image.convert(32, pygame.SRCALPHA)
+
+    def __transcode_video(self, path: str, baked_path: str) -> bool:
+        # scaled to the full resolution like the VideoPlayer does, the audio track is kept as it is
+        temp_path = f"{baked_path}.part.mp4"
+        command = [
+            get_ffmpeg_exe(), "-y", "-loglevel", "error", "-i", path,
+            "-vf", f"scale={self.resolution[0]}:{self.resolution[1]},fps={self.video_fps}",
+            "-c:v", "libx264", "-preset", "medium", "-crf", "20", "-pix_fmt", "yuv420p",
+            "-c:a", "copy", temp_path,
+        ]
+        result = subprocess.run(command, capture_output=True, text=True)
+        if result.returncode != 0:
+            print(f"[AssetBaker] transcoding {path} failed: {result.stderr.strip()}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
+        os.replace(temp_path, baked_path)
+        print(f"[AssetBaker] {path} transcoded")
+        return True
+
+    @staticmethod
+    def __remove_orphans(directory: str, baked_assets: Dict[str, Any]) -> None:
+        baked_files = {os.path.basename(asset["file"]) for asset in baked_assets.values()}
+        for file_name in os.listdir(directory):
+            if file_name not in baked_files:
+                os.remove(os.path.join(directory, file_name))
+
+    def __collect_strings(self, value: Any, paths: Set[str]) -> None:
+        if isinstance(value, dict):
+            for item in value.values():
+                self.__collect_strings(item, paths)
+        elif isinstance(value, list):
+            for item in value:
+                self.__collect_strings(item, paths)
+        elif isinstance(value, str) and value.startswith("assets/"):
+            paths.add(value)
+
+
+class BakedAssets:
+    """
+    Runtime side of the bake step, resolves asset paths to their baked counterpart.
+    a baked file is only used if the manifest matches the engine resolution and video frame rate
+    and the source file is unchanged (same size and modification time), otherwise the original is used.
+    """
+
+    def __init__(self, output_directory: str, resolution: Tuple[int, int], video_fps: int):
+        """
+        :param output_directory: Directory containing the baked assets and the manifest.
+        :param resolution: Current engine resolution (width, height).
+        :param video_fps: Current video frame rate.
+        """
+        self.__sources: Dict[str, Any] = {}
+        self.__baked_files: Dict[str, Any] = {}
+        # content hash of the source by baked file path
+        self.__baked_file_hashes: Dict[str, str] = {}
+
+        manifest_path = os.path.join(output_directory, MANIFEST_FILE_NAME)
+        if not os.path.isfile(manifest_path):
+            return
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as file:
+                manifest = json.load(file)
+        except (OSError, ValueError) as e:
+            print(f"[BakedAssets] could not read {manifest_path}: {e}")
+            return
+
+        if (manifest.get("version") != MANIFEST_VERSION
+                or tuple(manifest.get("resolution", ())) != tuple(resolution)
+                or manifest.get("video_fps") != video_fps):
+            print(f"[BakedAssets] {manifest_path} was baked with other settings, run bake.py again")
+            return
+
+        self.__sources = manifest.get("sources", {})
+        self.__baked_files = {**manifest.get("images", {}), **manifest.get("videos", {})}
+        self.__baked_file_hashes = {baked_file["file"]: content_hash
+                                    for content_hash, baked_file in self.__baked_files.items()}
+        print(f"[BakedAssets] {len(manifest.get('images', {}))} baked images and "
+              f"{len(manifest.get('videos', {}))} baked videos available")
+
+    def get_content_hash(self, path: str) -> str | None:
+        """
+        Return the content hash of the source recorded by the bake, without reading the file.
+        :param path: Path to an original asset or to a baked file.
+        :return: The hash of the (original) source or None if it isn't baked or changed since the bake.
+        """
+        normalized_path = normalize_asset_path(path)
+        content_hash = self.__baked_file_hashes.get(normalized_path)
+        if content_hash is not None:
+            return content_hash
+        source = self.__sources.get(normalized_path)
+        if source is None or not self.__is_unchanged(path, source):
+            return None
+        return source["hash"]
+
+    def resolve(self, path: str) -> str:
+        """
+        Return the path of the baked image or video, or the original path if there is no up-to-date baked file.
+        :param path: Path to the original asset.
+        :return: Path to load the asset from.
+        """
+        source = self.__sources.get(normalize_asset_path(path))
+        if source is None:
+            return path
+        baked_file = self.__baked_files.get(source["hash"])
+        if baked_file is None or not self.__is_unchanged(path, source):
+            return path
+        if not os.path.isfile(baked_file["file"]):
+            return path
+        return baked_file["file"]
+
+    ##### private methods #####
+    @staticmethod
+    def __is_unchanged(path: str, source: Dict[str, Any]) -> bool:
+        # same size and modification time as when it was baked
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        return stat.st_size == source["bytes"] and stat.st_mtime_ns == source["mtime_ns"]
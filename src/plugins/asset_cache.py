@@ -0,0 +1,257 @@
+import os
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Tuple
+
+import pygame
+from pygame import Surface
+
+from src.plugins.asset_baker import BakedAssets
+from src.plugins.asset_pack import AssetPack
+
+
+# (normalized path, alpha, target size or None for the unscaled image, smooth scaling)
+AssetKey = Tuple[str, bool, Tuple[int, int] | None, bool]
+
+
+class AssetCache:
+    """
+    Central image cache owned by the StarEngine
+    decoded images are stored in display format, keyed by path and format (opaque / alpha)
+    scaled variants are stored as a second layer, keyed additionally by target size and scaling method
+    if the configured byte budget is exceeded, the least recently used surfaces are evicted
+    images are read from the asset pack, otherwise decoded from the baked files (see bake.py) if they are up to date
+    images can be prefetched, they are decoded in a thread pool and converted on the main thread
+    the returned surfaces are shared between all views, they must never be drawn onto
+    """
+
+    def __init__(self, budget_bytes: int, baked_assets: BakedAssets | None = None,
+                 asset_pack: AssetPack | None = None, prefetch_workers: int = 2):
+        """
+        :param budget_bytes: maximum amount of memory (in bytes) the cached surfaces may use
+        :param baked_assets: resolves asset paths to their baked counterpart, None to always load the originals
+        :param asset_pack: memory mapped pack without stale entries, checked before the baked files and the originals
+        :param prefetch_workers: number of threads decoding prefetched images
+        """
+        self.budget_bytes: int = budget_bytes
+        self.baked_assets: BakedAssets | None = baked_assets
+        self.asset_pack: AssetPack | None = asset_pack
+        self.used_bytes: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.__surfaces: OrderedDict[AssetKey, Surface] = OrderedDict()
+        # source dimensions of every decoded image, used to compute aspect preserving sizes
+        self.__image_sizes: Dict[str, Tuple[int, int]] = {}
+        ##### prefetching #####
+        self.__executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=prefetch_workers,
+                                                                 thread_name_prefix="AssetPrefetch")
+        # decoded (not yet converted) images by normalized path
+        self.__pending_decodes: Dict[str, Future[Surface]] = {}
+        # requested surfaces waiting for their decode, insertion ordered
+        self.__prefetch_requests: Dict[AssetKey, str] = {}
+
+    def get_image(self, path: str, alpha: bool = False) -> Surface:
+        """
+        Return the image converted to the display format, decode it only if it isn't cached yet.
+        :param path: Path to the image asset.
+        :param alpha: True to keep the per pixel alpha (convert_alpha), False for an opaque surface (convert).
+        :return: The shared, converted surface.
+        """
+        key = (os.path.normpath(path), alpha, None, False)
+        surface = self.__get_cached(key)
+        if surface is not None:
+            return surface
+
+        surface = self.__decode(path, alpha)
+        self.__store(key, surface)
+        return surface
+
+    def get_scaled_image(self, path: str, size: Tuple[int, int], alpha: bool = False,
+                         smooth: bool = False) -> Surface:
+        """
+        Return the image scaled to the given size, the scaling runs only once per asset and size.
+        :param path: Path to the image asset.
+        :param size: Target size (width, height).
+        :param alpha: True to keep the per pixel alpha (convert_alpha), False for an opaque surface (convert).
+        :param smooth: True to use pygame.transform.smoothscale, False for the fast pygame.transform.scale.
+        :return: The shared, scaled surface.
+        """
+        return self.__get_scaled_image(path, (int(size[0]), int(size[1])), alpha, smooth, None)
+
+    def get_fitted_image(self, path: str, max_size: Tuple[int, int], alpha: bool = False,
+                         smooth: bool = True) -> Surface:
+        """
+        Return the image scaled to fit into max_size while preserving its aspect ratio.
+        :param path: Path to the image asset.
+        :param max_size: Maximum size (width, height).
+        :param alpha: True to keep the per pixel alpha (convert_alpha), False for an opaque surface (convert).
+        :param smooth: True to use pygame.transform.smoothscale, False for the fast pygame.transform.scale.
+        :return: The shared, scaled surface.
+        """
+        image = None
+        source_size = self.__image_sizes.get(os.path.normpath(path))
+        if source_size is None:
+            image = self.__decode(path, alpha)
+            source_size = image.get_size()
+        scale_factor = min(max_size[0] / source_size[0], max_size[1] / source_size[1])
+        size = (int(source_size[0] * scale_factor), int(source_size[1] * scale_factor))
+        return self.__get_scaled_image(path, size, alpha, smooth, image)
+
+    def prefetch(self, path: str, size: Tuple[int, int] | None = None, alpha: bool = False,
+                 smooth: bool = False) -> None:
+        """
+        Decode the image in the background, so a later get_image / get_scaled_image call doesn't have to.
+        the decoded image is converted (and scaled) by process_prefetched or as soon as it is requested.
+        :param path: Path to the image asset.
+        :param size: Target size (width, height) as passed to get_scaled_image, None for get_image.
+        :param alpha: True to keep the per pixel alpha (convert_alpha), False for an opaque surface (convert).
+        :param smooth: True to use pygame.transform.smoothscale, False for the fast pygame.transform.scale.
+        """
+        normalized_path = os.path.normpath(path)
+        if size is None:
+            key = (normalized_path, alpha, None, False)
+        else:
+            key = (normalized_path, alpha, (int(size[0]), int(size[1])), smooth)
+        if self.__is_resident(key) or key in self.__prefetch_requests:
+            return
+        if normalized_path not in self.__pending_decodes:
+            if not os.path.isfile(path):
+                return
+            self.__pending_decodes[normalized_path] = self.__executor.submit(self.__load, path)
+        self.__prefetch_requests[key] = path
+
+    def process_prefetched(self, max_count: int = 2) -> int:
+        """
+        Convert prefetched images whose decode has finished, call it once per frame on the main thread.
+        :param max_count: Maximum number of surfaces converted per call, keeps the frame time low.
+        :return: Number of converted surfaces.
+        """
+        processed_count = 0
+        for key, path in list(self.__prefetch_requests.items()):
+            if processed_count >= max_count:
+                break
+            future = self.__pending_decodes.get(key[0])
+            if future is not None and not future.done():
+                continue
+
+            del self.__prefetch_requests[key]
+            if self.__is_resident(key):
+                continue
+            try:
+                if key[2] is None:
+                    self.get_image(path, key[1])
+                else:
+                    self.__get_scaled_image(path, key[2], key[1], key[3], None)
+            except Exception as e:
+                print(f"[AssetCache] prefetch of {path} failed: {e}")
+            processed_count += 1
+
+        ##### drop decodes that aren't requested anymore #####
+        requested_paths = {key[0] for key in self.__prefetch_requests}
+        for normalized_path in list(self.__pending_decodes):
+            if normalized_path not in requested_paths and self.__pending_decodes[normalized_path].done():
+                del self.__pending_decodes[normalized_path]
+        return processed_count
+
+    def resolve_path(self, path: str) -> str:
+        """
+        Return the path of the baked counterpart of an asset (e.g. a transcoded video) if it is up-to-date.
+        :param path: Path to the original asset.
+        :return: Path to load the asset from.
+        """
+        if self.baked_assets is None:
+            return path
+        return self.baked_assets.resolve(path)
+
+    def clear(self) -> None:
+        """
+        Remove all cached surfaces.
+        """
+        self.__surfaces.clear()
+        self.used_bytes = 0
+
+    def __get_scaled_image(self, path: str, size: Tuple[int, int], alpha: bool, smooth: bool,
+                           image: Surface | None) -> Surface:
+        key = (os.path.normpath(path), alpha, size, smooth)
+        surface = self.__get_cached(key)
+        if surface is not None:
+            return surface
+
+        # reuse the unscaled image if it is resident, but don't keep it around just for scaling
+        unscaled_key = (key[0], alpha, None, False)
+        if image is None:
+            image = self.__surfaces.get(unscaled_key)
+        if image is None:
+            image = self.__decode(path, alpha)
+        if image.get_size() == size:
+            # nothing to scale, keep it as the unscaled image
+            if unscaled_key not in self.__surfaces:
+                self.__store(unscaled_key, image)
+            return image
+        if smooth:
+            surface = pygame.transform.smoothscale(image, size)
+        else:
+            surface = pygame.transform.scale(image, size)
+        self.__store(key, surface)
+        return surface
+
+    def __decode(self, path: str, alpha: bool) -> Surface:
+        normalized_path = os.path.normpath(path)
+        future = self.__pending_decodes.get(normalized_path)
+        if future is not None:
+            # already decoding in the background, wait for it instead of decoding twice
+            try:
+                image = future.result()
+            except Exception:
+                image = self.__load(path)
+        else:
+            image = self.__load(path)
+        self.__image_sizes[normalized_path] = image.get_size()
+        return image.convert_alpha() if alpha else image.convert()
+
+    def __load(self, path: str) -> Surface:
+        # runs on the prefetch threads as well, must not touch the cache
+        if self.asset_pack is not None:
+            # stale entries were removed when the pack was opened
+            image = self.asset_pack.load(path)
+            if image is not None:
+                return image
+        if self.baked_assets is None:
+            return pygame.image.load(path)
+        return pygame.image.load(self.baked_assets.resolve(path))
+
+    def __is_resident(self, key: AssetKey) -> bool:
+        if key in self.__surfaces:
+            return True
+        # scaled requests matching the source size are stored as the unscaled image
+        unscaled_image = self.__surfaces.get((key[0], key[1], None, False))
+        return unscaled_image is not None and unscaled_image.get_size() == key[2]
+
+    def __get_cached(self, key: AssetKey) -> Surface | None:
+        surface = self.__surfaces.get(key)
+        if surface is None:
+            self.misses += 1
+            return None
+        # mark as most recently used
+        self.__surfaces.move_to_end(key)
+        self.hits += 1
+        return surface
+
+    def __store(self, key: AssetKey, surface: Surface) -> None:
+        surface_bytes = self.__get_surface_bytes(surface)
+        if surface_bytes > self.budget_bytes:
+            # a single surface larger than the whole budget is never cached
+            print(f"[AssetCache] {key[0]} exceeds the cache budget, not cached")
+            return
+
+        self.__surfaces[key] = surface
+        self.used_bytes += surface_bytes
+
+        ##### evict least recently used surfaces #####
+        while self.used_bytes > self.budget_bytes:
+            _, evicted_surface = self.__surfaces.popitem(last=False)
+            self.used_bytes -= self.__get_surface_bytes(evicted_surface)
+
+    @staticmethod
+    def __get_surface_bytes(surface: Surface) -> int:
+        return surface.get_pitch() * surface.get_height()
@@ -0,0 +1,168 @@
+import json
+import os
+import struct
+import time
+from typing import Any, Dict, List, Tuple
+
+import pygame
+
+from src.plugins.asset_baker import IMAGE_EXTENSIONS, normalize_asset_path
+from src.plugins.asset_pack import get_pixel_format, hash_file
+
+ASSET_MANIFEST_VERSION = 1
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# file signatures checked at boot, (offset, expected bytes) by file extension
+FILE_SIGNATURES: Dict[str, Tuple[int, bytes]] = {
+    ".png": (0, PNG_SIGNATURE),
+    ".jpg": (0, b"\xff\xd8"),
+    ".jpeg": (0, b"\xff\xd8"),
+    ".webp": (8, b"WEBP"),
+    ".mp4": (4, b"ftyp"),
+}
+
+
+class AssetManifest:
+    """
+    List of every asset referenced by the data files, with size, hash and for images dimensions and pixel format.
+    generated by bake.py, validated at boot without decoding a single image:
+    each asset is only checked by stat and a read of its file header.
+    missing assets and invalid file headers are problems, assets changed since the last bake are only reported,
+    they are loaded from the original file.
+    """
+
+    def __init__(self, entries: Dict[str, Dict[str, Any]]):
+        """
+        :param entries: Manifest entries by asset path.
+        """
+        self.entries: Dict[str, Dict[str, Any]] = entries
+
+    @staticmethod
+    def generate(asset_paths: List[str], manifest_path: str,
+                 baked_manifest: Dict[str, Any] | None = None) -> "AssetManifest":
+        """
+        Create the manifest for the given assets and write it, missing assets are reported and skipped.
+        :param asset_paths: Paths of all referenced assets.
+        :param manifest_path: Path of the manifest file.
+        :param baked_manifest: Manifest written by AssetBaker.bake, its hashes and image sizes are reused
+        for unchanged sources, so they are neither hashed nor decoded again.
+        :return: The generated manifest.
+        """
+        sources: Dict[str, Any] = baked_manifest.get("sources", {}) if baked_manifest is not None else {}
+        baked_images: Dict[str, Any] = baked_manifest.get("images", {}) if baked_manifest is not None else {}
+        entries: Dict[str, Dict[str, Any]] = {}
+        for path in sorted(asset_paths):
+            if not os.path.isfile(path):
+                print(f"[AssetManifest] missing asset {path}, not added")
+                continue
+
+            stat = os.stat(path)
+            source = sources.get(normalize_asset_path(path))
+            if source is not None and (source["bytes"], source["mtime_ns"]) == (stat.st_size, stat.st_mtime_ns):
+                content_hash = source["hash"]
+            else:
+                content_hash = hash_file(path)
+            entry: Dict[str, Any] = {"bytes": stat.st_size, "hash": content_hash}
+            if path.lower().endswith(IMAGE_EXTENSIONS):
+                baked_image = baked_images.get(content_hash, {})
+                if "source_size" in baked_image:
+                    entry["width"], entry["height"] = baked_image["source_size"]
+                    entry["format"] = baked_image["format"]
+                else:
+                    image = pygame.image.load(path)
+                    entry["width"], entry["height"] = image.get_size()
+                    entry["format"] = get_pixel_format(image)
+            entries[path] = entry
+
+        with open(manifest_path, "w", encoding="utf-8") as file:
+            json.dump({"version": ASSET_MANIFEST_VERSION, "assets": entries}, file, indent=2)
+        print(f"[AssetManifest] {len(entries)} assets written to {manifest_path}")
+        return AssetManifest(entries)
+
+    @staticmethod
+    def load(manifest_path: str) -> "AssetManifest | None":
+        """
+        Load the manifest written by generate.
+        :param manifest_path: Path of the manifest file.
+        :return: The manifest or None if it doesn't exist or is invalid.
+        """
+        if not os.path.isfile(manifest_path):
+            return None
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError) as e:
+            print(f"[AssetManifest] could not read {manifest_path}: {e}")
+            return None
+        if data.get("version") != ASSET_MANIFEST_VERSION:
+            print(f"[AssetManifest] {manifest_path} has an unknown version, run bake.py again")
+            return None
+        return AssetManifest(data.get("assets", {}))
+
+    def validate(self) -> List[str]:
+        """
+        Check that every asset exists and has a valid file header, assets whose size or dimensions differ
+        from the manifest are reported as changed.
+        :return: List of problems (missing or undecodable assets), empty if all assets can be loaded.
+        """
+        start_time = time.perf_counter()
+        problems: List[str] = []
+        changed_count = 0
+        for path, entry in self.entries.items():
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                problems.append(f"{path} is missing")
+                continue
+            header = self.__read_header(path)
+            if not self.__has_valid_signature(path, header):
+                problems.append(f"{path} has an invalid file header")
+                continue
+            change = self.__get_change(entry, size, header)
+            if change is not None:
+                print(f"[AssetManifest] warning: {path} changed since the last bake ({change}), "
+                      f"the original is loaded, run bake.py again")
+                changed_count += 1
+
+        print(f"[AssetManifest] {len(self.entries)} assets validated in "
+              f"{(time.perf_counter() - start_time) * 1000:.0f} ms, {len(problems)} problems, "
+              f"{changed_count} changed")
+        return problems
+
+    def get_decoded_bytes(self, resolution: Tuple[int, int]) -> int:
+        """
+        Memory needed to keep every image of the manifest decoded at once (32 bit display format).
+        images larger than the resolution are counted with their baked size (covering the resolution).
+        :param resolution: Engine resolution (width, height).
+        :return: Size in bytes.
+        """
+        total_bytes = 0
+        for entry in self.entries.values():
+            if "width" not in entry:
+                continue
+            scale_factor = min(1.0, max(resolution[0] / entry["width"], resolution[1] / entry["height"]))
+            total_bytes += round(entry["width"] * scale_factor) * round(entry["height"] * scale_factor) * 4
+        return total_bytes
+
+    @staticmethod
+    def __read_header(path: str) -> bytes:
+        with open(path, "rb") as file:
+            return file.read(24)
+
+    @staticmethod
+    def __has_valid_signature(path: str, header: bytes) -> bool:
+        signature = FILE_SIGNATURES.get(os.path.splitext(path)[1].lower())
+        if signature is None:
+            return True
+        offset, expected_bytes = signature
+        return header[offset:offset + len(expected_bytes)] == expected_bytes
+
+    @staticmethod
+    def __get_change(entry: Dict[str, Any], size: int, header: bytes) -> str | None:
+        if header.startswith(PNG_SIGNATURE):
+            # the IHDR chunk is always first, width and height follow its type
+            width, height = struct.unpack(">II", header[16:24])
+            if (width, height) != (entry.get("width"), entry.get("height")):
+                return f"{width}x{height} instead of {entry.get('width')}x{entry.get('height')}"
+        if size != entry["bytes"]:
+            return f"{size} bytes instead of {entry['bytes']}"
+        return None
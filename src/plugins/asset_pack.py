@@ -0,0 +1,184 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+from typing import Any, Dict, List, Tuple
+
+import pygame
+from pygame import Surface
+
+PACK_MAGIC = b"ZAPK"
+PACK_VERSION = 2
+# magic, version, index length
+PACK_HEADER = struct.Struct("<4sII")
+# pixel data offsets are aligned to this many bytes
+PACK_ALIGNMENT = 16
+
+
+def hash_file(path: str) -> str:
+    """
+    Hash the content of a file, read in chunks so large videos don't have to fit into memory.
+    :param path: Path of the file.
+    :return: SHA1 hex digest of the content.
+    """
+    sha1 = hashlib.sha1()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            sha1.update(chunk)
+    return sha1.hexdigest()
+
+
+def get_pixel_format(surface: Surface) -> str:
+    """
+    Return the raw pixel format an image is stored with in the pack.
+    :param surface: The (unconverted) image.
+    :return: "RGBA" for images with per pixel alpha, otherwise "RGB".
+    """
+    return "RGBA" if surface.get_flags() & pygame.SRCALPHA else "RGB"
+
+
+def get_aligned_length(length: int) -> int:
+    """
+    Round a length up to the pack alignment.
+    """
+    return (length + PACK_ALIGNMENT - 1) // PACK_ALIGNMENT * PACK_ALIGNMENT
+
+
+class AssetPackWriter:
+    """
+    Writes an asset pack, a single file containing the raw pixels of many images (see AssetPack).
+    layout: header (magic, version, index length), json index, aligned raw pixel data
+    the index records the source file of every name as well, so stale entries are found when the pack is opened
+    """
+
+    def __init__(self, resolution: Tuple[int, int]):
+        """
+        :param resolution: Engine resolution (width, height) the images were baked for.
+        """
+        self.resolution: Tuple[int, int] = resolution
+        # (sources by name, path of the image file to read the pixels from)
+        self.__images: List[Tuple[Dict[str, Dict[str, Any]], str]] = []
+
+    def add(self, sources: Dict[str, Dict[str, Any]], image_path: str) -> None:
+        """
+        Add an image to the pack.
+        :param sources: Asset paths the image is found under, with the size ("bytes"), modification time
+        ("mtime_ns") and content hash ("hash") of the source file, identical images are stored only once.
+        :param image_path: Path of the image file the pixels are read from.
+        """
+        self.__images.append((sources, image_path))
+
+    def write(self, pack_path: str) -> int:
+        """
+        Write the pack file.
+        :param pack_path: Path of the pack file.
+        :return: Size of the pack file in bytes.
+        """
+        ##### build the index, offsets are relative to the start of the pixel data #####
+        entries: Dict[str, Dict[str, Any]] = {}
+        offset = 0
+        for sources, image_path in self.__images:
+            image = pygame.image.load(image_path)
+            pixel_format = get_pixel_format(image)
+            length = image.get_width() * image.get_height() * len(pixel_format)
+            entry = {"offset": offset, "length": length, "width": image.get_width(),
+                     "height": image.get_height(), "format": pixel_format}
+            for name, source in sources.items():
+                entries[name] = {**entry, "source": source}
+            offset += get_aligned_length(length)
+
+        index = json.dumps({"resolution": list(self.resolution), "entries": entries}).encode("utf-8")
+        data_start = get_aligned_length(PACK_HEADER.size + len(index))
+
+        with open(pack_path, "wb") as file:
+            file.write(PACK_HEADER.pack(PACK_MAGIC, PACK_VERSION, len(index)))
+            file.write(index)
+            file.write(b"\0" * (data_start - file.tell()))
+            for _, image_path in self.__images:
+                image = pygame.image.load(image_path)
+                pixels = pygame.image.tobytes(image, get_pixel_format(image))
+                file.write(pixels)
+                file.write(b"\0" * (get_aligned_length(len(pixels)) - len(pixels)))
+            return file.tell()
+
+
+class AssetPack:
+    """
+    Read only access to an asset pack (written by bake.py)
+    the file is opened once and memory mapped, images are created straight from the mapping,
+    without a filesystem lookup or a file read per image
+    the source files are checked once when the pack is opened (see remove_stale_entries),
+    the originals don't have to be shipped with the pack
+    """
+
+    def __init__(self, pack_path: str):
+        """
+        :param pack_path: Path of the pack file.
+        :raises ValueError: if the file is not a valid asset pack.
+        """
+        self.pack_path: str = pack_path
+        self.__file = open(pack_path, "rb")
+        self.__mapping = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, index_length = PACK_HEADER.unpack_from(self.__mapping, 0)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            self.close()
+            raise ValueError(f"{pack_path} is not an asset pack (version {PACK_VERSION})")
+        index = json.loads(self.__mapping[PACK_HEADER.size:PACK_HEADER.size + index_length].decode("utf-8"))
+        self.resolution: Tuple[int, int] = tuple(index["resolution"])
+        self.__entries: Dict[str, Dict[str, Any]] = index["entries"]
+        self.__data_start: int = get_aligned_length(PACK_HEADER.size + index_length)
+
+    def __contains__(self, path: str) -> bool:
+        return self.__normalize(path) in self.__entries
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def remove_stale_entries(self) -> int:
+        """
+        Remove the entries whose source file changed since the bake, they are loaded from the originals.
+        a source with another size is stale, one with another modification time only if its content hash differs.
+        entries without a source file are kept, the pack is all there is for them.
+        :return: Number of removed entries.
+        """
+        stale_names = []
+        for name, entry in self.__entries.items():
+            source = entry["source"]
+            try:
+                stat = os.stat(name)
+            except OSError:
+                continue
+            if stat.st_size != source["bytes"]:
+                stale_names.append(name)
+            elif stat.st_mtime_ns != source["mtime_ns"] and hash_file(name) != source["hash"]:
+                stale_names.append(name)
+        for name in stale_names:
+            del self.__entries[name]
+        return len(stale_names)
+
+    def load(self, path: str) -> Surface | None:
+        """
+        Create the image from the mapped pixel data.
+        the returned surface references the mapping, convert it before keeping it around.
+        :param path: Asset path of the image.
+        :return: The unconverted image or None if the pack doesn't contain it.
+        """
+        entry = self.__entries.get(self.__normalize(path))
+        if entry is None:
+            return None
+        start = self.__data_start + entry["offset"]
+        pixels = memoryview(self.__mapping)[start:start + entry["length"]]
+        return pygame.image.frombuffer(pixels, (entry["width"], entry["height"]), entry["format"])
+
+    def close(self) -> None:
+        """
+        Release the mapping, all surfaces created by load must be gone by then.
+        """
+        self.__mapping.close()
+        self.__file.close()
+
+    @staticmethod
+    def __normalize(path: str) -> str:
+        return os.path.normpath(path).replace(os.sep, "/")
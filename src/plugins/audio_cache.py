@@ -0,0 +1,75 @@
+import os
+from typing import Dict, Tuple
+
+from moviepy import VideoFileClip
+
+from src.plugins.asset_baker import BakedAssets
+from src.plugins.asset_pack import hash_file
+
+
+class AudioCache:
+    """
+    Extracted audio tracks of the videos, stored as OGG (streamable by pygame.mixer.music)
+    the files are named by the content hash of the video, so every video is extracted only once
+    and a changed video never plays a stale track. baked videos (and their originals) are named by the
+    source hash recorded by bake.py, so they are never hashed while playing. other videos are hashed
+    once per file version (path, size and modification time).
+    """
+
+    # content hashes by (normalized path, size, modification time)
+    __content_hashes: Dict[Tuple[str, int, int], str] = {}
+
+    def __init__(self, cache_directory: str = "temp/audio_cache", baked_assets: BakedAssets | None = None):
+        """
+        :param cache_directory: Directory the extracted audio files are stored in.
+        :param baked_assets: Provides the content hashes recorded by the bake, None to hash every video.
+        """
+        self.cache_directory: str = cache_directory
+        self.baked_assets: BakedAssets | None = baked_assets
+        os.makedirs(self.cache_directory, exist_ok=True)
+
+    def get_audio_path(self, video_path: str, clip: VideoFileClip) -> str | None:
+        """
+        Return the path of the extracted audio, extract it first if it isn't cached yet.
+        :param video_path: Path of the video file.
+        :param clip: The opened video clip.
+        :return: Path of the OGG file or None if the video has no audio.
+        """
+        if clip.audio is None:
+            return None
+
+        audio_path = os.path.join(self.cache_directory, f"{self.__get_content_hash(video_path)}.ogg")
+        if os.path.isfile(audio_path):
+            return audio_path
+
+        # write to a temporary file first, an interrupted extraction must not leave a broken cache entry
+        temp_audio_path = f"{audio_path}.part.ogg"
+        clip.audio.write_audiofile(temp_audio_path, fps=44100, codec="libvorbis", logger=None)
+        os.replace(temp_audio_path, audio_path)
+        print(f"[AudioCache] audio of {video_path} extracted")
+        return audio_path
+
+    def extract(self, video_path: str) -> str | None:
+        """
+        Extract the audio of a video ahead of time (used by bake.py).
+        :param video_path: Path of the video file.
+        :return: Path of the OGG file or None if the video has no audio.
+        """
+        clip = VideoFileClip(video_path)
+        try:
+            return self.get_audio_path(video_path, clip)
+        finally:
+            clip.close()
+
+    def __get_content_hash(self, path: str) -> str:
+        if self.baked_assets is not None:
+            content_hash = self.baked_assets.get_content_hash(path)
+            if content_hash is not None:
+                return content_hash
+        stat = os.stat(path)
+        key = (os.path.normpath(path), stat.st_size, stat.st_mtime_ns)
+        content_hash = AudioCache.__content_hashes.get(key)
+        if content_hash is None:
+            content_hash = hash_file(path)
+            AudioCache.__content_hashes[key] = content_hash
+        return content_hash
@@ -0,0 +1,84 @@
+import os
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+import pygame
+from pygame import Surface
+from pygame.font import Font
+
+# face (None for the pygame default font, a font file or a system font name), size
+FontKey = Tuple[str | None, int]
+# text, face, size, antialias, colour
+TextKey = Tuple[str, str | None, int, bool, Tuple[int, ...]]
+
+
+class FontCache:
+    """
+    Font registry and rendered text cache owned by the StarEngine
+    every font (face and size) is loaded once and kept, the system font lookup of pygame.font.SysFont
+    and the parsing of the font files only happen on the first request
+    rendered texts are cached by text, font and colour, if more than max_texts are cached the least recently
+    used texts are evicted, so labels which change rarely (e.g. a countdown) are rendered once per change
+    and not every frame. the returned surfaces are shared, they must never be drawn onto
+    """
+
+    def __init__(self, max_texts: int = 256):
+        """
+        :param max_texts: maximum number of rendered texts kept in the cache
+        """
+        self.max_texts: int = max_texts
+        self.hits: int = 0
+        self.misses: int = 0
+        self.__fonts: Dict[FontKey, Font] = {}
+        self.__texts: OrderedDict[TextKey, Surface] = OrderedDict()
+
+    def get_font(self, face: str | None, size: int) -> Font:
+        """
+        Return the font, load it only if it wasn't requested before.
+        :param face: None for the pygame default font, the path of a font file or the name of a system font.
+        :param size: Font size in pixels.
+        :return: The shared font.
+        """
+        key = (face, size)
+        font = self.__fonts.get(key)
+        if font is None:
+            if face is None or os.path.isfile(face):
+                font = pygame.font.Font(face, size)
+            else:
+                font = pygame.font.SysFont(face, size)
+            self.__fonts[key] = font
+        return font
+
+    def render_text(self, text: str, face: str | None, size: int, color: Tuple[int, ...],
+                    antialias: bool = True) -> Surface:
+        """
+        Return the rendered text, render it only if it isn't cached yet.
+        :param text: The text to render.
+        :param face: Font face, see get_font.
+        :param size: Font size in pixels.
+        :param color: Text colour (RGB or RGBA).
+        :param antialias: True for smooth edges.
+        :return: The shared surface with the rendered text.
+        """
+        key = (text, face, size, antialias, tuple(color))
+        surface = self.__texts.get(key)
+        if surface is not None:
+            # mark as most recently used
+            self.__texts.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self.get_font(face, size).render(text, antialias, color)
+        self.__texts[key] = surface
+
+        ##### evict least recently used texts #####
+        while len(self.__texts) > self.max_texts:
+            self.__texts.popitem(last=False)
+        return surface
+
+    def clear_texts(self) -> None:
+        """
+        Drop all rendered texts, the fonts are kept.
+        """
+        self.__texts.clear()
@@ -0,0 +1,74 @@
+import pygame
+from pygame.time import Clock
+
+
+class FrameGovernor:
+    """
+    Limits the frame rate of the game loops and drops to a low idle rate while nothing happens
+    the loops run at the active rate until there was no input, hardware event or animation for idle_after_ms,
+    then at the idle rate. while idle, the governor blocks until the next event or the end of the idle frame,
+    so the first input after a pause is handled right away and the loop returns to the active rate.
+    """
+
+    def __init__(self, clock: Clock, active_fps: int, idle_fps: int, idle_after_ms: int):
+        """
+        :param clock: Clock of the engine.
+        :param active_fps: Frame rate while there is activity.
+        :param idle_fps: Frame rate while idle, the active rate is kept if it isn't lower.
+        :param idle_after_ms: Time without activity after which the idle rate is used.
+        """
+        self.clock: Clock = clock
+        self.active_fps: int = active_fps
+        self.idle_fps: int = min(idle_fps, active_fps) if idle_fps > 0 else active_fps
+        self.idle_after_ms: int = idle_after_ms
+        # rate the last frame was limited to
+        self.current_fps: int = active_fps
+        # time spent at the active and the idle rate in seconds
+        self.active_time: float = 0.0
+        self.idle_time: float = 0.0
+        self.__last_activity: int = pygame.time.get_ticks()
+        self.__last_tick: int = pygame.time.get_ticks()
+
+    def notify_activity(self) -> None:
+        """
+        Return to the active rate, e.g. for hardware events or while something is animated.
+        """
+        self.__last_activity = pygame.time.get_ticks()
+
+    def is_idle(self) -> bool:
+        """
+        :return: True if there was no activity for idle_after_ms.
+        """
+        return pygame.time.get_ticks() - self.__last_activity >= self.idle_after_ms
+
+    def tick(self) -> float:
+        """
+        Wait until the next frame is due, call it once per frame before the events are processed.
+        :return: Time since the last frame in seconds.
+        """
+        if pygame.event.peek():
+            # pending input (or any other event) counts as activity
+            self.notify_activity()
+
+        if self.is_idle():
+            self.current_fps = self.idle_fps
+            remaining_ms = 1000 // self.idle_fps - (pygame.time.get_ticks() - self.__last_tick)
+            if remaining_ms > 0:
+                # the queue is empty (checked above), the process sleeps until an event arrives
+                event = pygame.event.wait(remaining_ms)
+                if event.type != pygame.NOEVENT:
+                    # put the event back in front of the events queued meanwhile, the loop handles them in order
+                    queued_events = pygame.event.get()
+                    pygame.event.post(event)
+                    for queued_event in queued_events:
+                        pygame.event.post(queued_event)
+                    self.notify_activity()
+            delta_time = self.clock.tick() / 1000.0
+            self.idle_time += delta_time
+        else:
+            self.current_fps = self.active_fps
+            delta_time = self.clock.tick(self.active_fps) / 1000.0
+            self.active_time += delta_time
+
+        self.__last_tick = pygame.time.get_ticks()
+        return delta_time
@@ -0,0 +1,122 @@
+import csv
+import os
+import time
+from collections import deque
+from typing import Deque, Dict, List, Tuple
+
+# phases of a frame in the order they are measured
+PHASES = ("wait", "events", "update", "draw", "present")
+
+
+class FrameProfiler:
+    """
+    Records how long each phase of a frame takes (waiting for the frame, events, update, draw, present)
+    the game loops call begin_frame, then mark after each phase, the time since the previous mark is added
+    to that phase. the last frames are kept in a ring buffer, so percentiles and the frame time histogram
+    always describe the recent frames (see DebugManager) and can be exported as CSV.
+    a disabled profiler ignores all calls, so the loops don't need to check whether profiling is enabled.
+    """
+
+    def __init__(self, capacity: int = 600, enabled: bool = True):
+        """
+        :param capacity: Number of frames kept in the ring buffer.
+        :param enabled: False to ignore all calls.
+        """
+        self.capacity: int = capacity
+        self.enabled: bool = enabled
+        # one row per frame: start time in seconds, phase times in milliseconds (see PHASES)
+        self.__frames: Deque[Tuple[float, ...]] = deque(maxlen=capacity)
+        self.__phase_times: Dict[str, float] = {}
+        self.__frame_start: float | None = None
+        self.__last_mark: float = 0.0
+
+    def begin_frame(self) -> None:
+        """
+        Start measuring a frame, a frame which wasn't ended yet is ended first
+        (e.g. the engine frame in which a mini game started its own loop).
+        """
+        if not self.enabled:
+            return
+        if self.__frame_start is not None:
+            self.end_frame()
+        self.__frame_start = self.__last_mark = time.perf_counter()
+        self.__phase_times = {}
+
+    def mark(self, phase: str) -> None:
+        """
+        End a phase of the current frame.
+        :param phase: One of PHASES, a phase can be marked more than once per frame.
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.__phase_times[phase] = self.__phase_times.get(phase, 0.0) + (now - self.__last_mark) * 1000
+        self.__last_mark = now
+
+    def end_frame(self) -> None:
+        """
+        Store the current frame, phases which weren't marked took no time.
+        """
+        if self.__frame_start is None:
+            return
+        self.__frames.append((self.__frame_start,) + tuple(self.__phase_times.get(phase, 0.0) for phase in PHASES))
+        self.__frame_start = None
+
+    def __len__(self) -> int:
+        return len(self.__frames)
+
+    def get_frame_times(self) -> List[float]:
+        """
+        :return: Total time of each recorded frame in milliseconds, including the wait for the frame.
+        """
+        return [sum(frame[1:]) for frame in self.__frames]
+
+    def get_phase_times(self, phase: str) -> List[float]:
+        """
+        :param phase: One of PHASES.
+        :return: Time of the phase in each recorded frame in milliseconds.
+        """
+        index = PHASES.index(phase) + 1
+        return [frame[index] for frame in self.__frames]
+
+    @staticmethod
+    def get_percentiles(times: List[float], percentiles: Tuple[int, ...] = (50, 95, 99)) -> List[float]:
+        """
+        :param times: Times, e.g. from get_frame_times.
+        :param percentiles: Percentiles to return.
+        :return: The time below which the given percentage of the times lie (nearest rank), 0 for no times.
+        """
+        if not times:
+            return [0.0 for _ in percentiles]
+        sorted_times = sorted(times)
+        return [sorted_times[min(len(sorted_times) - 1, max(0, round(percentile / 100 * len(sorted_times)) - 1))]
+                for percentile in percentiles]
+
+    @staticmethod
+    def get_histogram(times: List[float], bin_ms: float, bin_count: int) -> List[int]:
+        """
+        :param times: Times, e.g. from get_frame_times.
+        :param bin_ms: Width of a bin in milliseconds.
+        :param bin_count: Number of bins, longer times are counted in the last bin.
+        :return: Number of times in each bin.
+        """
+        histogram = [0] * bin_count
+        for frame_time in times:
+            histogram[min(bin_count - 1, int(frame_time / bin_ms))] += 1
+        return histogram
+
+    def export_csv(self, path: str) -> None:
+        """
+        Write the recorded frames as CSV, one row per frame with its start time and phase times.
+        :param path: Path of the CSV file, missing directories are created.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(("start_s",) + tuple(f"{phase}_ms" for phase in PHASES) + ("frame_ms",))
+            for frame in self.__frames:
+                writer.writerow((f"{frame[0]:.6f}",) + tuple(f"{value:.3f}" for value in frame[1:])
+                                + (f"{sum(frame[1:]):.3f}",))
+        print(f"[FrameProfiler] {len(self.__frames)} frames exported to {path}")
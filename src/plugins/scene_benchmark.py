@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import gc
+import math
+import random
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple, TYPE_CHECKING
+
+import pygame
+
+from src.mini_games.mini_game import MiniGame
+from src.plugins.frame_profiler import FrameProfiler, PHASES
+
+if TYPE_CHECKING:
+    from src.games.story_game import StoryGame
+
+# name, factory creating the scene or mini game, True to click and drag with the scripted pointer
+Scenario = Tuple[str, Callable[["StoryGame"], Any], bool]
+
+# keys pressed by the scripted input, keys finishing views (return, escape) or toggling tools (d, F9) are left out
+SCRIPTED_KEYS = (pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT, pygame.K_TAB)
+
+
+class SceneBenchmark:
+    """
+    Runs scenes and mini games with a scripted input stream and measures them, intended for a headless run
+    (SDL dummy drivers, see benchmark.py). every scenario runs twice with the same input: once to measure the load
+    time and the frame times (see FrameProfiler), once with tracemalloc to measure the allocations.
+    scenes are driven frame by frame (StarEngine.run_frame) with the input posted before each frame, mini games
+    by their own loop with the input posted at the beginning of every frame (StarEngine.on_frame_begin),
+    the scenario ends after the given frames.
+    """
+
+    def __init__(self, game: StoryGame, frames: int = 120, seed: int = 1):
+        """
+        :param game: The game the scenes are shown in, no scene may be active.
+        :param frames: Number of frames each scenario runs, unless it finishes earlier.
+        :param seed: Seed of the scripted input, the same seed gives the same input.
+        """
+        self.game: StoryGame = game
+        self.frames: int = frames
+        self.seed: int = seed
+        self.__random: random.Random = random.Random(seed)
+        self.__frame_index: int = 0
+        self.__is_button_down: bool = False
+
+    def run(self, scenarios: List[Scenario]) -> Dict[str, Dict[str, Any]]:
+        """
+        Run the scenarios one after another.
+        :param scenarios: The scenarios to run.
+        :return: Results by scenario name (see run_scenario).
+        """
+        results = {}
+        for name, create, with_clicks in scenarios:
+            print(f"[SceneBenchmark] {name}")
+            try:
+                results[name] = self.run_scenario(create, with_clicks)
+            except Exception as e:
+                # e.g. missing data, the remaining scenarios are still measured
+                print(f"[SceneBenchmark] {name} failed: {e}")
+                self.game.engine.clear_scenes()
+                results[name] = {"error": str(e)}
+        return results
+
+    def run_scenario(self, create: Callable[[StoryGame], Any], with_clicks: bool) -> Dict[str, Any]:
+        """
+        Run a scenario twice, to measure the timings and the allocations.
+        :param create: Creates the scene or mini game.
+        :param with_clicks: True to click and drag with the scripted pointer.
+        :return: Load time, frame time statistics and allocations.
+        """
+        frame_profiler, load_time = self.__run(create, with_clicks)
+        work_times = [frame - wait for frame, wait in
+                      zip(frame_profiler.get_frame_times(), frame_profiler.get_phase_times("wait"))]
+        p50, p95, p99 = FrameProfiler.get_percentiles(work_times)
+        result: Dict[str, Any] = {
+            "load_ms": round(load_time * 1000, 3),
+            "frames": len(work_times),
+            # frame times without waiting for the frame rate
+            "frame_mean_ms": round(sum(work_times) / len(work_times), 3) if work_times else 0.0,
+            "frame_p50_ms": round(p50, 3),
+            "frame_p95_ms": round(p95, 3),
+            "frame_p99_ms": round(p99, 3),
+            "frame_max_ms": round(max(work_times), 3) if work_times else 0.0,
+            "phase_mean_ms": {},
+        }
+        for phase in PHASES[1:]:
+            phase_times = frame_profiler.get_phase_times(phase)
+            result["phase_mean_ms"][phase] = round(sum(phase_times) / len(phase_times), 3) if phase_times else 0.0
+
+        gc.collect()
+        tracemalloc.start()
+        start_size, _ = tracemalloc.get_traced_memory()
+        self.__run(create, with_clicks)
+        end_size, peak_size = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result["allocated_peak_kb"] = round((peak_size - start_size) / 1024, 1)
+        result["retained_kb"] = round((end_size - start_size) / 1024, 1)
+        return result
+
+    ##### private methods #####
+    def __run(self, create: Callable[[StoryGame], Any], with_clicks: bool) -> Tuple[FrameProfiler, float]:
+        """
+        Create and run the scene or mini game for the configured frames with the scripted input.
+        :return: The profiler with the frame timings, the load time in seconds.
+        """
+        engine = self.game.engine
+        # the scenes and mini games use the global random generator, e.g. for backgrounds and layouts
+        random.seed(self.seed)
+        self.__random = random.Random(self.seed)
+        self.__frame_index = 0
+        self.__is_button_down = False
+        pygame.event.clear()
+
+        frame_profiler = FrameProfiler(self.frames)
+        engine.frame_profiler = frame_profiler
+        load_start = time.perf_counter()
+        scene = create(self.game)
+
+        if isinstance(scene, MiniGame):
+            # the mini game builds its ui when its loop starts, the load ends with the first frame
+            load_time = 0.0
+
+            def on_frame_begin():
+                nonlocal load_time
+                if self.__frame_index == 0:
+                    load_time = time.perf_counter() - load_start
+                self.__post_scripted_input(with_clicks)
+                if self.__frame_index >= self.frames:
+                    # this is the last frame of the loop
+                    scene.is_running = False
+
+            engine.on_frame_begin = on_frame_begin
+            try:
+                scene.run()
+            finally:
+                engine.on_frame_begin = None
+        else:
+            engine.push_scene(scene)
+            load_time = time.perf_counter() - load_start
+            while self.__frame_index < self.frames and engine.active_scene is scene:
+                self.__post_scripted_input(with_clicks)
+                engine.run_frame(self.game)
+            engine.clear_scenes()
+
+        return frame_profiler, load_time
+
+    def __post_scripted_input(self, with_clicks: bool) -> None:
+        """
+        Post the input of the next frame: the pointer moves over the whole window, a key is pressed now and then
+        and, with clicks, the pointer is pressed and dragged in regular intervals.
+        """
+        width, height = self.game.engine.width, self.game.engine.height
+        # the pointer follows a lissajous curve
+        angle = self.__frame_index / 30
+        position = (int(width / 2 + width * 0.45 * math.sin(angle * 1.3)),
+                    int(height / 2 + height * 0.45 * math.sin(angle * 1.7)))
+        buttons = (1, 0, 0) if self.__is_button_down else (0, 0, 0)
+        pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=position, rel=(0, 0), buttons=buttons,
+                                             touch=False))
+
+        if self.__frame_index % 20 == 10:
+            key = self.__random.choice(SCRIPTED_KEYS)
+            for event_type in (pygame.KEYDOWN, pygame.KEYUP):
+                pygame.event.post(pygame.event.Event(event_type, key=key, mod=0, unicode="", scancode=0))
+
+        if with_clicks and self.__frame_index % 15 in (0, 7):
+            self.__is_button_down = self.__frame_index % 15 == 0
+            event_type = pygame.MOUSEBUTTONDOWN if self.__is_button_down else pygame.MOUSEBUTTONUP
+            pygame.event.post(pygame.event.Event(event_type, pos=position, button=1, touch=False))
+
+        self.__frame_index += 1
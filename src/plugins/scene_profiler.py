@@ -0,0 +1,107 @@
+import cProfile
+import os
+import time
+from typing import List
+
+import pygame
+
+# key starting and stopping a capture of the active scene
+PROFILER_KEY = pygame.K_F9
+
+
+class SceneProfiler:
+    """
+    Captures cProfile profiles of single scenes, started and stopped with a hotkey or automatically for configured
+    scene names. a capture only covers the scene which was active when it started, it is stopped and written as
+    <scene name>_<timestamp>.prof as soon as another scene becomes active (open it with pstats or snakeviz).
+    the loops report their scene with set_scene, the game board is reported as StarEngine.run.
+    """
+
+    def __init__(self, output_directory: str, hotkey_enabled: bool, scene_names: List[str]):
+        """
+        :param output_directory: Directory the profiles are written to, created on the first capture.
+        :param hotkey_enabled: True to start and stop captures with PROFILER_KEY.
+        :param scene_names: Names of the scenes captured automatically whenever they become active.
+        """
+        self.output_directory: str = output_directory
+        self.hotkey_enabled: bool = hotkey_enabled
+        self.scene_names: List[str] = scene_names
+        self.__active_scene: object | None = None
+        self.__active_name: str = ""
+        self.__profile: cProfile.Profile | None = None
+        self.__captured_name: str = ""
+
+    @property
+    def is_capturing(self) -> bool:
+        return self.__profile is not None
+
+    def set_scene(self, scene: object, name: str | None = None) -> None:
+        """
+        Report the active scene, call it every frame. a capture of another scene is stopped.
+        :param scene: The active scene (or the loop owner, e.g. the engine for the game board).
+        :param name: Name used for the profile, the class name of the scene by default.
+        """
+        if scene is self.__active_scene:
+            return
+        self.stop()
+        self.__active_scene = scene
+        self.__active_name = name if name is not None else type(scene).__name__
+        if self.__active_name in self.scene_names:
+            self.start()
+
+    def end_scene(self, scene: object) -> None:
+        """
+        Report that the loop of a scene ended, e.g. at the end of a mini game, its capture is stopped.
+        """
+        if scene is self.__active_scene:
+            self.stop()
+            self.__active_scene = None
+
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """
+        Start or stop a capture of the active scene on the hotkey.
+        :return: True if the event was the hotkey and shouldn't be handled by the scene.
+        """
+        if self.hotkey_enabled and event.type == pygame.KEYDOWN and event.key == PROFILER_KEY:
+            if self.is_capturing:
+                self.stop()
+            else:
+                self.start()
+            return True
+        return False
+
+    def start(self) -> None:
+        """
+        Start capturing the active scene.
+        """
+        if self.is_capturing or self.__active_scene is None:
+            return
+        self.__captured_name = self.__active_name
+        self.__profile = cProfile.Profile()
+        try:
+            self.__profile.enable()
+        except ValueError as e:
+            # another profiler is active, e.g. the game runs under python -m cProfile
+            print(f"[SceneProfiler] capture of {self.__captured_name} could not be started: {e}")
+            self.__profile = None
+            return
+        print(f"[SceneProfiler] capturing {self.__captured_name}")
+
+    def stop(self) -> None:
+        """
+        Stop the capture and write the profile.
+        """
+        if not self.is_capturing:
+            return
+        profile = self.__profile
+        self.__profile = None
+        profile.disable()
+
+        file_name = f"{self.__captured_name}_{time.strftime('%Y%m%d_%H%M%S')}.prof"
+        path = os.path.join(self.output_directory, file_name)
+        try:
+            os.makedirs(self.output_directory, exist_ok=True)
+            profile.dump_stats(path)
+            print(f"[SceneProfiler] profile of {self.__captured_name} written to {path}")
+        except OSError as e:
+            print(f"[SceneProfiler] profile of {self.__captured_name} could not be written: {e}")
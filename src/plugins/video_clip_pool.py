@@ -0,0 +1,77 @@
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable
+
+from moviepy import VideoFileClip
+
+from src.plugins.audio_cache import AudioCache
+
+
+class VideoClipPool:
+    """
+    Keeps a few video clips opened ahead of time
+    opening a VideoFileClip starts the ffmpeg reader and probes the file, which delays the first frame.
+    the pool opens the retained clips on a worker thread (including the audio extraction)
+    and closes them once they aren't retained anymore.
+    """
+
+    def __init__(self, audio_cache: AudioCache, max_clips: int = 4):
+        """
+        :param audio_cache: Audio cache the audio of the opened clips is extracted to.
+        :param max_clips: Maximum number of clips kept open.
+        """
+        self.audio_cache: AudioCache = audio_cache
+        self.max_clips: int = max_clips
+        self.__executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="VideoClipPool")
+        self.__clips: Dict[str, Future[VideoFileClip]] = {}
+
+    def retain(self, video_paths: Iterable[str]) -> None:
+        """
+        Keep exactly the given videos opened, open the missing ones and close all others.
+        :param video_paths: Paths of the videos which will probably be played next.
+        """
+        wanted_paths = [os.path.normpath(path) for path in dict.fromkeys(video_paths) if os.path.isfile(path)]
+        wanted_paths = wanted_paths[:self.max_clips]
+
+        for path in list(self.__clips):
+            if path not in wanted_paths:
+                self.__close(self.__clips.pop(path))
+        for path in wanted_paths:
+            if path not in self.__clips:
+                self.__clips[path] = self.__executor.submit(self.__open, path)
+
+    def acquire(self, video_path: str) -> VideoFileClip | None:
+        """
+        Take the opened clip out of the pool, the caller is responsible for closing it.
+        waits if the clip is still being opened.
+        :param video_path: Path of the video.
+        :return: The opened clip or None if the video isn't pooled.
+        """
+        future = self.__clips.pop(os.path.normpath(video_path), None)
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except Exception as e:
+            print(f"[VideoClipPool] {video_path} could not be opened: {e}")
+            return None
+
+    def close(self) -> None:
+        """
+        Close all pooled clips.
+        """
+        for future in self.__clips.values():
+            self.__close(future)
+        self.__clips.clear()
+
+    ##### private methods #####
+    def __open(self, path: str) -> VideoFileClip:
+        clip = VideoFileClip(path)
+        # extract the audio now, so the playback can start right away
+        self.audio_cache.get_audio_path(path, clip)
+        return clip
+
+    @staticmethod
+    def __close(future: Future) -> None:
+        # the clip may still be opening, close it as soon as it is open
+        future.add_done_callback(lambda done: done.result().close() if done.exception() is None else None)
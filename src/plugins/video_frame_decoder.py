@@ -0,0 +1,128 @@
+import queue
+import threading
+import time
+from typing import List, Tuple
+
+import pygame
+from moviepy import VideoFileClip
+from pygame import Surface
+
+# marks the end of the video in the frame queue
+END_OF_VIDEO = None
+
+
+class VideoFrameDecoder:
+    """
+    Decodes the frames of a video clip on a producer thread
+    the frames are converted to surfaces of the target size ahead of time and buffered in a bounded queue,
+    so the render loop only has to blit them.
+    frames that are already late (behind the playback index set by the render loop) are not converted at all.
+    the frames are written into a fixed ring of surfaces, no surface is allocated while playing.
+    a returned frame surface stays valid until the next get_frame call.
+    """
+
+    def __init__(self, clip: VideoFileClip, target_size: Tuple[int, int], buffer_size: int = 8):
+        """
+        :param clip: The opened video clip, must not be used by anyone else until stop is called.
+        :param target_size: Size (width, height) the frames are scaled to.
+        :param buffer_size: Maximum number of decoded frames kept ahead.
+        """
+        self.clip: VideoFileClip = clip
+        self.target_size: Tuple[int, int] = target_size
+        self.frames_decoded: int = 0
+        # late frames which were decoded but not converted
+        self.frames_skipped: int = 0
+        # number of times the render loop had to wait for a frame
+        self.underruns: int = 0
+        # index of the frame due for presentation, written by the render loop
+        self.playback_index: int = 0
+        self.__frames: queue.Queue[Tuple[int, Surface] | None] = queue.Queue(maxsize=buffer_size)
+        # the queued frames, the one shown by the render loop and the one being written
+        self.__frame_surfaces: List[Surface] = [Surface(target_size) for _ in range(buffer_size + 2)]
+        # frames of another size are written here first and scaled into the frame surfaces
+        source_size = (int(clip.w), int(clip.h))
+        self.__source_surface: Surface | None = Surface(source_size) if source_size != target_size else None
+        self.__stop_event: threading.Event = threading.Event()
+        self.__is_finished: bool = False
+        self.__thread: threading.Thread = threading.Thread(target=self.__decode, name="VideoFrameDecoder",
+                                                           daemon=True)
+
+    def start(self) -> None:
+        """
+        Start decoding.
+        """
+        self.__thread.start()
+
+    def wait_until_buffered(self, timeout: float = 1.0) -> None:
+        """
+        Block until the frame buffer is filled, so playback doesn't start with an underrun.
+        :param timeout: Maximum time to wait in seconds.
+        """
+        end_time = time.monotonic() + timeout
+        while not self.__frames.full() and self.__thread.is_alive() and time.monotonic() < end_time:
+            time.sleep(0.005)
+
+    def get_frame(self) -> Tuple[int, Surface] | None:
+        """
+        Return the next frame, waits for the decoder if no frame is buffered (counted as underrun).
+        :return: The next frame (frame index, surface) or None at the end of the video.
+        """
+        if self.__is_finished:
+            return None
+        try:
+            frame = self.__frames.get_nowait()
+        except queue.Empty:
+            self.underruns += 1
+            frame = self.__frames.get()
+
+        if frame is END_OF_VIDEO:
+            self.__is_finished = True
+            return None
+        return frame
+
+    def stop(self) -> None:
+        """
+        Stop the decoder thread and wait for it, the clip can be closed afterwards.
+        """
+        self.__stop_event.set()
+        while self.__thread.is_alive():
+            # unblock the producer if it waits for a free slot
+            try:
+                self.__frames.get_nowait()
+            except queue.Empty:
+                pass
+            self.__thread.join(timeout=0.05)
+
+    ##### private methods #####
+    def __decode(self):
+        try:
+            for frame_index, frame in enumerate(self.clip.iter_frames(fps=self.clip.fps, dtype="uint8",
+                                                                      with_times=False)):
+                if self.__stop_event.is_set():
+                    return
+                if frame_index < self.playback_index:
+                    # the render loop is already past this frame, skip the conversion
+                    self.frames_skipped += 1
+                    continue
+                frame_surface = self.__frame_surfaces[self.frames_decoded % len(self.__frame_surfaces)]
+                if self.__source_surface is None:
+                    # already at the target size, copy the pixels straight into the frame surface
+                    pygame.surfarray.blit_array(frame_surface, frame.swapaxes(0, 1))
+                else:
+                    pygame.surfarray.blit_array(self.__source_surface, frame.swapaxes(0, 1))
+                    pygame.transform.scale(self.__source_surface, self.target_size, frame_surface)
+                self.frames_decoded += 1
+                if not self.__put((frame_index, frame_surface)):
+                    return
+        except Exception as e:
+            print(f"[VideoFrameDecoder] decoding failed: {e}")
+        self.__put(END_OF_VIDEO)
+
+    def __put(self, frame: Tuple[int, Surface] | None) -> bool:
+        while not self.__stop_event.is_set():
+            try:
+                self.__frames.put(frame, timeout=0.05)
+                return True
+            except queue.Full:
+                continue
+        return False
@@ -5,21 +5,45 @@ import pygame
 from moviepy import VideoFileClip
 from pygame import Surface
 
+from src.plugins.audio_cache import AudioCache
+from src.plugins.video_clip_pool import VideoClipPool
+from src.plugins.video_frame_decoder import VideoFrameDecoder
+
 
 class VideoPlayer:
     """
     Plays a video file (MP4) including audio
-    skips the video on a key pressed event
+    play runs its own loop and skips the video on a key pressed event,
+    start / update / draw / stop allow to drive the playback from another loop (see CutsceneScene)
     """
 
-    def __init__(self, screen: Surface | None):
+    def __init__(self, screen: Surface | None, clip_pool: VideoClipPool | None = None,
+                 audio_cache: AudioCache | None = None):
+        """
+        :param screen: Surface the video is drawn on, None for a standalone window (see enable_standalone).
+        :param clip_pool: Pool of clips opened ahead of time, the video is opened on start if it isn't pooled.
+        :param audio_cache: Audio cache of the engine, defaults to the one of the clip pool.
+        """
         self.screen = screen
+        self.clip_pool: VideoClipPool | None = clip_pool
         self.video_path: str | None = None
         self.temp_folder: str = "temp"
-        self.temp_audio_path: str = os.path.join(self.temp_folder, "temp_audio.mp3")
-
-        if not os.path.exists(self.temp_folder):
-            os.makedirs(self.temp_folder, exist_ok=True)
+        if audio_cache is None and clip_pool is not None:
+            audio_cache = clip_pool.audio_cache
+        if audio_cache is None:
+            audio_cache = AudioCache(os.path.join(self.temp_folder, "audio_cache"))
+        self.audio_cache: AudioCache = audio_cache
+        self.is_finished: bool = False
+
+        ##### playback state #####
+        self.__clip: VideoFileClip | None = None
+        self.__decoder: VideoFrameDecoder | None = None
+        self.__has_audio: bool = False
+        self.__start_time: int = 0
+        self.__frame_index: int = -1
+        self.__frame_surface: Surface | None = None
+        self.__frames_presented: int = 0
+        self.__frames_dropped: int = 0
 
     def enable_standalone(self, width: int, height: int, title: str, full_screen: bool):
         """
@@ -35,65 +59,154 @@ class VideoPlayer:
     def set_video(self, video_path: str):
         self.video_path = video_path
 
-    def __render(self, clip: VideoFileClip, has_audio: bool):
-        frame_duration = 1 / clip.fps
-        last_frame_time = pygame.time.get_ticks()
-
-        if has_audio:
-            pygame.mixer.music.play()
-
-        for frame in clip.iter_frames(fps=clip.fps, dtype="uint8", with_times=False):
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    clip.close()
-                    pygame.quit()
-                    sys.exit()
-                elif event.type == pygame.KEYDOWN:
-                    clip.close()
-                    pygame.mixer.music.stop()
-                    return
-
-            frame_surface = pygame.surfarray.make_surface(frame.swapaxes(0, 1))
-            frame_surface = pygame.transform.scale(frame_surface, self.screen.get_size())
-            self.screen.blit(frame_surface, (0, 0))
-            pygame.display.update()
-
-            while (pygame.time.get_ticks() - last_frame_time) < frame_duration * 1000:
-                pass
-            last_frame_time = pygame.time.get_ticks()
-
     def play(self):
-        if not self.video_path:
-            print("Kein Video angegeben!")
+        """
+        Play the video and block until it ended or was skipped.
+        """
+        if not self.start():
             return
 
-        clip = VideoFileClip(self.video_path)
+        try:
+            while not self.is_finished:
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        self.stop()
+                        pygame.quit()
+                        sys.exit()
+                    elif event.type == pygame.KEYDOWN:
+                        return
+
+                if self.update():
+                    self.draw(self.screen)
+                    pygame.display.update()
+                else:
+                    # the current frame is still shown, sleep until the next one is due
+                    pygame.time.wait(max(1, int(self.get_delay() * 1000)))
+        finally:
+            self.stop()
+
+    def start(self) -> bool:
+        """
+        Open the video, start decoding and start the audio.
+        :return: False if the video could not be opened.
+        """
+        if not self.video_path:
+            print("Kein Video angegeben!")
+            return False
+
+        try:
+            if self.clip_pool is not None:
+                self.__clip = self.clip_pool.acquire(self.video_path)
+            if self.__clip is None:
+                self.__clip = VideoFileClip(self.video_path)
+        except Exception as e:
+            print(f"[VideoPlayer] video {self.video_path} could not be opened: {e}")
+            self.is_finished = True
+            return False
 
         # check if video contains audio
-        has_audio = clip.audio is not None
+        self.__has_audio = self.__clip.audio is not None
 
-        if has_audio:
-            # extract the audio
+        if self.__has_audio:
+            # extract the audio (only on the first play of the video)
             try:
-                clip.audio.write_audiofile(self.temp_audio_path, fps=44100)
+                audio_path = self.audio_cache.get_audio_path(self.video_path, self.__clip)
                 pygame.mixer.init()
-                pygame.mixer.music.load(self.temp_audio_path)
+                pygame.mixer.music.load(audio_path)
             except Exception as e:
                 print(f"Fehler beim Laden der Audiodatei: {e}")
-                clip.close()
-                return
+                self.__clip.close()
+                self.__clip = None
+                self.is_finished = True
+                return False
+
+        self.is_finished = False
+        self.__frame_index = -1
+        self.__frame_surface = None
+        self.__frames_presented = 0
+        self.__frames_dropped = 0
+        self.__decoder = VideoFrameDecoder(self.__clip, self.screen.get_size())
+        self.__decoder.start()
+        self.__decoder.wait_until_buffered()
+
+        if self.__has_audio:
+            pygame.mixer.music.play()
+        self.__start_time = pygame.time.get_ticks()
+        return True
 
-        self.__render(clip, has_audio)
+    def update(self) -> bool:
+        """
+        Advance to the frame due at the current playback position.
+        :return: True if a new frame has to be drawn.
+        """
+        if self.is_finished or self.__decoder is None:
+            return False
+
+        ##### frame due at the current playback position #####
+        playback_index = int(self.__get_playback_time() * self.__clip.fps)
+        self.__decoder.playback_index = playback_index
+        if self.__frame_index >= playback_index:
+            return False
+
+        frame = self.__decoder.get_frame()
+        # drop frames which are already late instead of slowing down the playback
+        while frame is not None and frame[0] < playback_index:
+            self.__frames_dropped += 1
+            frame = self.__decoder.get_frame()
+        if frame is None:
+            self.is_finished = True
+            return False
+
+        self.__frame_index, self.__frame_surface = frame
+        self.__frames_presented += 1
+        return True
+
+    def draw(self, surface: Surface):
+        """
+        Draw the current frame.
+        :param surface: Target surface, usually the screen.
+        """
+        if self.__frame_surface is not None:
+            surface.blit(self.__frame_surface, (0, 0))
 
-        clip.close()
+    def get_delay(self) -> float:
+        """
+        :return: Time in seconds until the next frame is due.
+        """
+        if self.__clip is None:
+            return 0.0
+        return (self.__frame_index + 1) / self.__clip.fps - self.__get_playback_time()
 
-        if has_audio:
-            # stop the audio
+    def stop(self):
+        """
+        Stop the playback and release the video, the audio and the decoder.
+        """
+        if self.__decoder is not None:
+            self.__decoder.stop()
+            print(f"[VideoPlayer] {self.__frames_presented} frames presented, "
+                  f"{self.__frames_dropped + self.__decoder.frames_skipped} dropped, "
+                  f"{self.__decoder.underruns} underruns")
+            self.__decoder = None
+        self.__frame_surface = None
+
+        if self.__clip is not None:
+            self.__clip.close()
+            self.__clip = None
+
+        if self.__has_audio:
+            # stop the audio, the extracted file stays in the audio cache
             pygame.mixer.music.stop()
-            # delete the temporary audio file
-            if os.path.exists(self.temp_audio_path):
-                try:
-                    os.remove(self.temp_audio_path)
-                except Exception as e:
-                    print(f"Fehler beim Entfernen der temporären Audiodatei: {e}")
+            pygame.mixer.music.unload()
+            self.__has_audio = False
+        self.is_finished = True
 
+    def __get_playback_time(self) -> float:
+        """
+        Return the playback position in seconds, taken from the music playback if the video has audio,
+        so the video follows the audio track, otherwise from the time since the playback started.
+        """
+        if self.__has_audio:
+            audio_position = pygame.mixer.music.get_pos()
+            if audio_position >= 0:
+                return audio_position / 1000
+        return (pygame.time.get_ticks() - self.__start_time) / 1000
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pygame
+from pygame import Surface
+
+from src.enums.color import Color
+from src.plugins.asset_baker import VIDEO_EXTENSIONS
+from src.plugins.video_player import VideoPlayer
+from src.scenes.scene import Scene
+
+if TYPE_CHECKING:
+    from src.games.story_game import StoryGame
+
+
+class CutsceneScene(Scene):
+    """
+    Shows a cutscene, either a video or a still image.
+    videos finish at their end, both can be skipped with a key press or a click.
+    """
+
+    def __init__(self, game: StoryGame, media_path: str):
+        """
+        :param game: The StoryGame instance.
+        :param media_path: Path to the cutscene media (image or video).
+        """
+        self.game: StoryGame = game
+        self.media_path: str = media_path
+        self.is_video: bool = media_path.lower().endswith(VIDEO_EXTENSIONS)
+        self.finished: bool = False
+        self.video_player: VideoPlayer | None = None
+        self.image: Surface | None = None
+
+    def start(self):
+        if self.is_video:
+            self.video_player = VideoPlayer(self.game.window, self.game.prefetch_manager.video_clip_pool)
+            # transcoded by bake.py to the display resolution, if available
+            self.video_player.set_video(self.game.engine.asset_cache.resolve_path(self.media_path))
+            if not self.video_player.start():
+                self.finished = True
+            return
+
+        try:
+            self.image = self.game.engine.asset_cache.get_scaled_image(self.media_path, self.game.window.get_size())
+        except Exception as e:
+            print(f"[CutsceneScene] Cutscene could not be loaded {self.media_path}: {e}")
+            self.image = pygame.Surface(self.game.window.get_size())
+            self.image.fill(Color.BLACK.value)
+
+    def handle_event(self, event: pygame.event.Event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE and not self.is_video:
+                self.game.stop()
+            self.finished = True
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            self.finished = True
+
+    def update(self, delta_time: float):
+        if self.video_player is not None:
+            self.video_player.update()
+            if self.video_player.is_finished:
+                self.finished = True
+
+    def draw(self, window: Surface):
+        if self.video_player is not None:
+            self.video_player.draw(window)
+        elif self.image is not None:
+            window.blit(self.image, (0, 0))
+
+    def is_finished(self) -> bool:
+        return self.finished
+
+    def is_animating(self) -> bool:
+        # a video needs the active frame rate, a still image doesn't
+        return self.video_player is not None
+
+    def kill(self):
+        if self.video_player is not None:
+            self.video_player.stop()
+            self.video_player = None
@@ -0,0 +1,76 @@
+from abc import ABC, abstractmethod
+from typing import Any, Generator
+
+import pygame
+from pygame import Surface
+
+
+class Scene(ABC):
+    """
+    abstract base class for scenes.
+    a scene doesn't run its own loop, it is pushed onto the scene stack of the engine and driven by the engine loop
+    (see StarEngine.push_scene), so hardware polling and background work continue while it is shown.
+    """
+
+    def start(self):
+        """
+        Called once before the first update.
+        """
+        pass
+
+    @abstractmethod
+    def handle_event(self, event: pygame.event.Event):
+        """
+        Handle a single pygame event.
+        :param event: The event to process.
+        """
+        raise NotImplementedError("handle_event not implemented")
+
+    @abstractmethod
+    def update(self, delta_time: float):
+        """
+        Update the scene state.
+        :param delta_time: Time elapsed since the last update.
+        """
+        raise NotImplementedError("update not implemented")
+
+    @abstractmethod
+    def draw(self, window: Surface):
+        """
+        Draw the scene on the given surface.
+        :param window: The target surface.
+        """
+        raise NotImplementedError("draw not implemented")
+
+    @abstractmethod
+    def is_finished(self) -> bool:
+        """
+        Check if the scene is finished.
+        :return: True if finished, False otherwise.
+        """
+        raise NotImplementedError("is_finished not implemented")
+
+    def get_result(self) -> Any:
+        """
+        Return the result of the finished scene, e.g. the selected option, passed to the flow that showed it.
+        :return: None by default.
+        """
+        return None
+
+    def is_animating(self) -> bool:
+        """
+        Check if the scene changes without input, keeps the engine at the active frame rate (see FrameGovernor).
+        :return: True while animating, False by default.
+        """
+        return False
+
+    def kill(self):
+        """
+        Called once after the scene finished, releases its resources.
+        """
+        pass
+
+
+# a flow yields the scenes to show one after another and receives their results (see StarEngine.run_flow),
+# flows are combined with "yield from", the value returned by a flow is passed to the calling flow
+SceneFlow = Generator[Scene, Any, Any]
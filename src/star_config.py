@@ -18,7 +18,32 @@ class StarConfig:
         self.height: int = self._data.get("engine", {}).get("height", 720)
         self.fps: int = self._data.get("engine", {}).get("fps", 60)
         self.full_screen: bool = self._data.get("engine", {}).get("full_screen", False)
+        # game board and switches connected via GPIO, only on linux (raspberry pi)
+        self.hardware_input: bool = self._data.get("engine", {}).get("hardware_input", True)
         self.system_check_backgrounds: List[str] = self._data.get("engine", {}).get("system_check_backgrounds", [])
+        # 0 sizes the budget from the asset manifest
+        self.asset_cache_budget_mb: int = self._data.get("engine", {}).get("asset_cache_budget_mb", 256)
+        self.asset_manifest_path: str = self._data.get("engine", {}).get("asset_manifest", "data/asset_manifest.json")
+        self.baked_assets_directory: str = self._data.get("engine", {}).get("baked_assets_directory", "baked")
+        self.video_fps: int = self._data.get("engine", {}).get("video_fps", 24)
+        self.use_asset_pack: bool = self._data.get("engine", {}).get("use_asset_pack", True)
+        self.asset_prefetch_workers: int = self._data.get("engine", {}).get("asset_prefetch_workers", 2)
+        # rendered texts kept by the font cache (see FontCache)
+        self.text_cache_size: int = self._data.get("engine", {}).get("text_cache_size", 256)
+        # frame rate after idle_after_ms without input or animation (see FrameGovernor)
+        self.idle_fps: int = self._data.get("engine", {}).get("idle_fps", 10)
+        self.idle_after_ms: int = self._data.get("engine", {}).get("idle_after_ms", 3000)
+        # interval of the debug view refreshing the planet markers and the manager information
+        self.debug_refresh_ms: int = self._data.get("engine", {}).get("debug_refresh_ms", 500)
+        # per phase frame timings of the last frame_profiler_frames frames, exported on exit (see FrameProfiler)
+        self.frame_profiler: bool = self._data.get("engine", {}).get("frame_profiler", False)
+        self.frame_profiler_frames: int = self._data.get("engine", {}).get("frame_profiler_frames", 600)
+        self.frame_profiler_csv: str = self._data.get("engine", {}).get("frame_profiler_csv", "temp/frame_profile.csv")
+        # cProfile captures of single scenes, started with F9 or for the listed scene names (see SceneProfiler)
+        self.scene_profiler: bool = self._data.get("engine", {}).get("scene_profiler", False)
+        self.scene_profiler_scenes: List[str] = self._data.get("engine", {}).get("scene_profiler_scenes", [])
+        self.scene_profiler_directory: str = self._data.get("engine", {}).get("scene_profiler_directory",
+                                                                              "temp/profiles")
 
 
         ##### main menu #####
@@ -37,6 +62,16 @@ class StarConfig:
         self.portrait_agatha = self._data.get("portraits", {}).get("agatha", 0)
         self.portrait_victor = self._data.get("portraits", {}).get("victor", 0)
 
+        ##### hud #####
+        self.hud_topbar_background_path: str = self._data.get("hud", {}).get("topbar_background", "")
+        self.hud_sidebar_background_path: str = self._data.get("hud", {}).get("sidebar_background", "")
+        self.hud_corner_decoration_path: str = self._data.get("hud", {}).get("corner_decoration", "")
+        self.hud_fuel_icon_path: str = self._data.get("hud", {}).get("fuel_icon", "")
+        self.hud_hull_icon_path: str = self._data.get("hud", {}).get("hull_icon", "")
+
+        ##### debug #####
+        self.debug_solar_system_image_path: str = self._data.get("debug", {}).get("solar_system_image", "")
+
         ##### player settings #####
         self.player_settings_start_row: int = self._data.get("player_settings", {}).get("player_start_row", 0)
         self.player_settings_start_col: int = self._data.get("player_settings", {}).get("player_start_col", 0)
@@ -65,6 +100,12 @@ class StarConfig:
         self.change_probability_by: float = self._data.get("event_system", {}).get("change_probability_by", 0)
         self.event_panel_background_path: str = self._data.get("event_system", {}).get("panel_background", "")
         self.event_panel_background_path: str = self._data.get("event_system", {}).get("panel_background", "")
+        self.event_icon_path: str = self._data.get("event_system", {}).get("icon", "")
+        self.event_window_background_paths: List[str] = self._data.get("event_system", {}).get(
+            "window_backgrounds", [])
+
+        ##### decision system #####
+        self.final_decision_image_path: str = self._data.get("decision_system", {}).get("final_decision_image", "")
 
         ##### mini-game system #####
         self.mini_game_probability: float = self._data.get("mini_game_system", {}).get("mini_game_probability", 0)
@@ -74,11 +115,13 @@ class StarConfig:
         self.quiz_tolerance: float = self._data.get("quiz_system", {}).get("tolerance", 0)
         self.quiz_tolerance: float = self._data.get("quiz_system", {}).get("tolerance", 0)
         self.quiz_backgrounds: [] = self._data.get("quiz_system", {}).get("backgrounds", [])
+        self.quiz_error_background_path: str = self._data.get("quiz_system", {}).get("error_background", "")
 
         ##### inventory system #####
         self.inventory_background_paths: List[str] = self._data.get("inventory_system", {}).get("backgrounds", [])
         self.inventory_panel_background_path: str = self._data.get("inventory_system", {}).get("panel_background", "")
         self.inventory_empty_slot_path: str = self._data.get("inventory_system", {}).get("empty_slot", "")
+        self.inventory_icon_path: str = self._data.get("inventory_system", {}).get("icon", "")
 
         ##### game-over system #####
         self.game_over_story_quiz_max_attempts: int = self._data.get("game_over_system", {}).get(
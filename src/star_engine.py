@@ -1,15 +1,30 @@
 from __future__ import annotations
+import os
+import threading
+import time
+
 import pygame
 import sys
 
-from typing import TYPE_CHECKING
+from typing import Any, Callable, List, Tuple, TYPE_CHECKING
 
 from src.system_check import SystemCheck
 
 if TYPE_CHECKING:
     from src.games.story_game import StoryGame
+    from src.scenes.scene import Scene, SceneFlow
 
 from pygame_gui import UIManager
+from pygame_gui.core import IncrementalThreadedResourceLoader
+from src.plugins.asset_baker import BakedAssets, PACK_FILE_NAME
+from src.plugins.asset_cache import AssetCache
+from src.plugins.asset_manifest import AssetManifest
+from src.plugins.asset_pack import AssetPack
+from src.plugins.audio_cache import AudioCache
+from src.plugins.font_cache import FontCache
+from src.plugins.frame_governor import FrameGovernor
+from src.plugins.frame_profiler import FrameProfiler
+from src.plugins.scene_profiler import SceneProfiler
 from src.star_config import StarConfig
 from src.views.main_menu import MainMenu
 
@@ -22,10 +37,35 @@ class StarEngine:
         self.config: StarConfig = config
         self.__initialize_pygame()
         self.__setup_display()
-        self.pygame_gui_ui_manager: UIManager = UIManager((self.width, self.height), 'theme/theme.json')
-        self.pygame_gui_ui_manager.get_theme().get_font_dictionary().preload_font(16, "noto_sans", True, False, True,
+        self.asset_manifest: AssetManifest | None = AssetManifest.load(self.config.asset_manifest_path)
+        baked_assets = BakedAssets(self.config.baked_assets_directory, (self.width, self.height),
+                                   self.config.video_fps)
+        self.asset_cache: AssetCache = AssetCache(self.__get_asset_cache_budget(), baked_assets,
+                                                  self.__open_asset_pack(), self.config.asset_prefetch_workers)
+        # audio tracks of the videos, keyed by the source hashes of the bake
+        self.audio_cache: AudioCache = AudioCache(baked_assets=baked_assets)
+        self.font_cache: FontCache = FontCache(self.config.text_cache_size)
+        # the theme only queues its fonts and images, they are loaded in the background (see wait_for_theme)
+        self.__theme_loader: IncrementalThreadedResourceLoader = IncrementalThreadedResourceLoader()
+        self.pygame_gui_ui_manager: UIManager = UIManager((self.width, self.height), 'theme/theme.json',
+                                                          resource_loader=self.__theme_loader)
+        self.pygame_gui_ui_manager.get_theme().get_font_dictionary().preload_font(16, "noto_sans", True, False, False,
                                                                                   True)
-        self.main_menu: MainMenu = MainMenu(self.pygame_gui_ui_manager, self.config)
+        self.__theme_thread: threading.Thread = threading.Thread(target=self.__load_theme, name="ThemeWarmUp",
+                                                                 daemon=True)
+        self.__theme_thread.start()
+        # called at the beginning of every frame of the engine and the mini game loops (see begin_frame)
+        self.on_frame_begin: Callable[[], None] | None = None
+        # scenes shown over the game board, the last one is active, with the callback receiving its result
+        self.__scene_stack: List[Tuple[Scene, Callable[[Any], None] | None]] = []
+        self.main_menu: MainMenu = MainMenu(self.pygame_gui_ui_manager, self.config, self.asset_cache)
+
+    def wait_for_theme(self) -> None:
+        """
+        Block until every font and image referenced by the theme is loaded, call it before the first ui element
+        is created. the load starts with the engine and runs off the main thread, e.g. while the intro plays.
+        """
+        self.__theme_thread.join()
 
     def show_main_menu(self) -> int:
         """
@@ -34,23 +74,141 @@ class StarEngine:
         0 = Quit
         1 = StoryGame
         """
-        return self.main_menu.run(self.window, self.clock, self.fps)
+        self.wait_for_theme()
+        return self.main_menu.run(self.window, self.frame_governor)
+
+    @property
+    def active_scene(self) -> Scene | None:
+        """
+        The scene on top of the scene stack, None while the game board is shown.
+        """
+        return self.__scene_stack[-1][0] if self.__scene_stack else None
 
     def run(self, game: StoryGame) -> None:
         """
         Main game loop that handles events, updates, and rendering.
+        drives the active scene or, if there is none, the game board.
         :param game: The active game instance.
         """
         while self.is_running and game.is_running:
-            delta_time = self.clock.tick(self.fps) / 1000.0
-            game.handle_events()
-            game.update(delta_time)
-            game.draw()
-            pygame.display.flip()
+            self.run_frame(game)
 
+        self.quit()
+
+    def quit(self) -> None:
+        """
+        Write the running scene capture and the frame profile, shut down pygame and exit.
+        """
+        self.scene_profiler.stop()
+        if self.frame_profiler.enabled and len(self.frame_profiler) > 0:
+            try:
+                self.frame_profiler.export_csv(self.config.frame_profiler_csv)
+            except OSError as e:
+                print(f"[StarEngine] frame profile could not be exported: {e}")
         pygame.quit()
         sys.exit()
 
+    def run_frame(self, game: StoryGame) -> None:
+        """
+        One frame of the main game loop (see run), also used to drive the game from outside (see SceneBenchmark).
+        :param game: The active game instance.
+        """
+        self.begin_frame()
+        delta_time = self.frame_governor.tick()
+        self.frame_profiler.mark("wait")
+        if self.active_scene is not None:
+            self.scene_profiler.set_scene(self.active_scene)
+            self.__update_scene(self.active_scene, game, delta_time)
+            self.frame_profiler.end_frame()
+            return
+
+        self.scene_profiler.set_scene(self, "StarEngine.run")
+        game.handle_events()
+        self.frame_profiler.mark("events")
+        game.update(delta_time)
+        self.frame_profiler.mark("update")
+        game.draw()
+        self.frame_profiler.mark("draw")
+        pygame.display.flip()
+        self.frame_profiler.mark("present")
+        self.frame_profiler.end_frame()
+
+    def begin_frame(self) -> None:
+        """
+        Start a frame of the engine loop or of a mini game loop, calls on_frame_begin (e.g. the scripted input
+        of the SceneBenchmark) and starts measuring the frame.
+        """
+        if self.on_frame_begin is not None:
+            self.on_frame_begin()
+        self.frame_profiler.begin_frame()
+
+    def push_scene(self, scene: Scene, on_finished: Callable[[Any], None] | None = None) -> None:
+        """
+        Show a scene over the current one (or the game board) until it is finished.
+        :param scene: The scene to show, it is started right away.
+        :param on_finished: Called with the result of the scene once it is finished and removed.
+        """
+        self.__scene_stack.append((scene, on_finished))
+        scene.start()
+
+    def pop_scene(self) -> None:
+        """
+        Remove the active scene, release it and pass its result to its callback.
+        """
+        scene, on_finished = self.__scene_stack.pop()
+        scene.kill()
+        if on_finished is not None:
+            on_finished(scene.get_result())
+
+    def replace_scene(self, scene: Scene) -> None:
+        """
+        Replace the active scene, the new scene takes over the callback of the replaced one.
+        :param scene: The scene to show instead.
+        """
+        replaced_scene, on_finished = self.__scene_stack.pop()
+        replaced_scene.kill()
+        self.push_scene(scene, on_finished)
+
+    def clear_scenes(self) -> None:
+        """
+        Remove all scenes without resuming their flows, the game board is shown again.
+        """
+        while self.__scene_stack:
+            scene, _ = self.__scene_stack.pop()
+            scene.kill()
+
+    def run_flow(self, flow: SceneFlow) -> None:
+        """
+        Run a flow, every scene yielded by it is pushed and the flow is resumed with the result of the scene
+        once it is finished. the flow runs until it yields its first scene before this method returns.
+        :param flow: Generator yielding the scenes to show (see SceneFlow).
+        """
+
+        def resume(result: Any) -> None:
+            try:
+                scene = flow.send(result)
+            except StopIteration:
+                return
+            self.push_scene(scene, resume)
+
+        resume(None)
+
+    def validate_assets(self) -> bool:
+        """
+        check that all assets listed in the asset manifest exist and are intact (without decoding them),
+        so broken content is reported at boot and not when a view loads it mid-game.
+        assets changed since the last bake are only reported, they are loaded from the original file
+        :return: True if all assets can be loaded or there is no manifest
+        """
+        if self.asset_manifest is None:
+            print("[StarEngine] no asset manifest found, run bake.py to generate it")
+            return True
+
+        problems = self.asset_manifest.validate()
+        for problem in problems:
+            print(f"[StarEngine] asset error: {problem}")
+        return len(problems) == 0
+
     def run_system_check(self) -> bool:
         """
         check the GPIO I2C bus connection, if the connection can't be established,
@@ -58,6 +216,7 @@ class StarEngine:
         only executed on the raspberry itself (linux OS)
         """
 
+        self.wait_for_theme()
         system_check = SystemCheck(self)
         is_system_valid = system_check.is_system_valid()
         if not is_system_valid:
@@ -66,6 +225,43 @@ class StarEngine:
         return True
 
     ##### private methods #####
+    def __load_theme(self) -> None:
+        """
+        Load the fonts and images queued by the theme, runs in the ThemeWarmUp thread.
+        the files are loaded by the threads of the loader, this thread waits for them and finishes the load.
+        """
+        load_start = time.perf_counter()
+        self.__theme_loader.start()
+        while not self.__theme_loader.update()[0]:
+            time.sleep(0.005)
+        print(f"[StarEngine] theme loaded in {(time.perf_counter() - load_start) * 1000:.0f} ms")
+
+    def __update_scene(self, scene: Scene, game: StoryGame, delta_time: float) -> None:
+        """
+        One frame of the active scene, the game keeps polling the hardware and updating its managers
+        (HUD, prefetching) meanwhile, only the input events are passed to the scene.
+        """
+        if scene.is_animating():
+            self.frame_governor.notify_activity()
+        for event in pygame.event.get():
+            game.handle_scene_event(event)
+            scene.handle_event(event)
+        self.frame_profiler.mark("events")
+        game.update_background()
+        scene.update(delta_time)
+
+        # the scene may have shown another scene over it meanwhile (e.g. a HUD menu)
+        if self.active_scene is not scene or scene.is_finished():
+            while self.__scene_stack and self.active_scene.is_finished():
+                self.pop_scene()
+            self.frame_profiler.mark("update")
+            return
+        self.frame_profiler.mark("update")
+        scene.draw(self.window)
+        self.frame_profiler.mark("draw")
+        pygame.display.flip()
+        self.frame_profiler.mark("present")
+
     def __initialize_pygame(self):
         """
         Initialize pygame and set up general settings.
@@ -76,6 +272,42 @@ class StarEngine:
         self.fps = self.config.fps
         self.is_running = True
 
+    def __get_asset_cache_budget(self) -> int:
+        """
+        Return the asset cache budget in bytes, a configured budget of 0 is sized from the asset manifest
+        (large enough to keep every referenced image decoded).
+        """
+        if self.config.asset_cache_budget_mb > 0:
+            return self.config.asset_cache_budget_mb * 1024 * 1024
+        if self.asset_manifest is None:
+            print("[StarEngine] no asset manifest to size the asset cache from, using 256 MB")
+            return 256 * 1024 * 1024
+        budget = self.asset_manifest.get_decoded_bytes((self.width, self.height))
+        print(f"[StarEngine] asset cache budget sized to {budget // (1024 * 1024)} MB")
+        return budget
+
+    def __open_asset_pack(self) -> AssetPack | None:
+        """
+        Open the asset pack written by bake.py, if it exists and matches the engine resolution.
+        """
+        pack_path = os.path.join(self.config.baked_assets_directory, PACK_FILE_NAME)
+        if not self.config.use_asset_pack or not os.path.isfile(pack_path):
+            return None
+        try:
+            asset_pack = AssetPack(pack_path)
+        except (OSError, ValueError) as e:
+            print(f"[StarEngine] asset pack could not be opened: {e}")
+            return None
+        if asset_pack.resolution != (self.width, self.height):
+            print(f"[StarEngine] {pack_path} was baked for another resolution, run bake.py again")
+            asset_pack.close()
+            return None
+        stale_count = asset_pack.remove_stale_entries()
+        if stale_count > 0:
+            print(f"[StarEngine] {stale_count} images changed since the last bake, run bake.py again")
+        print(f"[StarEngine] asset pack with {len(asset_pack)} images opened")
+        return asset_pack
+
     def __setup_display(self):
         """
         Set up the display, window title, and clock.
@@ -88,3 +320,7 @@ class StarEngine:
 
         pygame.display.set_caption(self.title)
         self.clock = pygame.time.Clock()
+        self.frame_governor = FrameGovernor(self.clock, self.fps, self.config.idle_fps, self.config.idle_after_ms)
+        self.frame_profiler = FrameProfiler(self.config.frame_profiler_frames, self.config.frame_profiler)
+        self.scene_profiler = SceneProfiler(self.config.scene_profiler_directory, self.config.scene_profiler,
+                                            self.config.scene_profiler_scenes)
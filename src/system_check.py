@@ -32,7 +32,7 @@ class SystemCheck:
         """
         self.engine = engine
         background_path: str = random.choice(self.engine.config.system_check_backgrounds)
-        self.background_image = pygame.image.load(background_path).convert()
+        self.background_image = self.engine.asset_cache.get_image(background_path)
         self.bus_number = bus_number
         self.mcp_addresses = list(range(0x20, 0x28))  # Addresses from 0x20 to 0x27
         self.is_running: bool = False
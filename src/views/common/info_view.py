@@ -40,7 +40,7 @@ class InfoView(View):
 
     def __build_ui(self):
         # Load the background image
-        self.background_image = pygame.image.load(self.background_image_path).convert()
+        self.background_image = self.game.engine.asset_cache.get_image(self.background_image_path)
         # Create title label at the top
         title_rect = Rect(0, 60, 800, 100)
         self.title = UILabel(
@@ -65,7 +65,7 @@ class InfoView(View):
             anchors={"centerx": "centerx", "top": "top"},
             object_id="default_panel",
         )
-        image_surface = pygame.image.load(self.image_path)
+        image_surface = self.game.engine.asset_cache.get_image(self.image_path, alpha=True)
         self.image = UIImage(
             relative_rect=Rect(20, 30, 240, 255),
             image_surface=image_surface,
@@ -91,31 +91,16 @@ class InfoView(View):
         )
         self.confirm_button.bind(pygame_gui.UI_BUTTON_PRESSED, lambda: self.kill())
 
-    def run(self):
-        """Display the menu modally and return the selected option."""
+    def start(self):
+        super().start()
         self.__build_ui()
-        clock = pygame.time.Clock()
-        self.is_running = True
-        while self.is_running:
-            time_delta = clock.tick(self.game.engine.fps) / 1000.0
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.game.stop()
-                    self.is_running = False
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_d:
-                        self.game.debug_manager.toggle_debug_mode()
-                    if event.key == pygame.K_RETURN:
-                        self.kill()
-                self.pygame_gui_ui_manager.process_events(event)
-            self.pygame_gui_ui_manager.update(time_delta)
-            # Draw the background image covering the window
-            self.game.window.blit(self.background_image, (0, 0))
-            self.pygame_gui_ui_manager.draw_ui(self.game.window)
-            pygame.display.update()
-        self.kill()
 
-    def kill(self):
+    def handle_event(self, event: pygame.event.Event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
+            self.kill()
+        super().handle_event(event)
+
+    def _release(self):
         self.is_running = False
         if self.title:
             self.title.kill()
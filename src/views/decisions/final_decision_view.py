@@ -3,7 +3,6 @@ from __future__ import annotations
 import sys
 import time
 from typing import TYPE_CHECKING, Tuple
-import pygame
 import pygame_gui
 from pygame import Rect
 from pygame_gui.elements import UIImage
@@ -35,9 +34,11 @@ class FinalDecisionView(View):
         self.game = game
         self.is_running: bool = True
         self.selected_option: int = 0
+        # last time the switch was checked
+        self.last_switch_time: float = 0.0
 
         # Load the background image (from planet.background_image)
-        self.background_image = pygame.image.load(self.game.engine.config.main_menu_background_image).convert_alpha()
+        self.background_image = self.game.engine.asset_cache.get_image(self.game.engine.config.main_menu_background_image, alpha=True)
 
         ##### UI elements #####
         self.title: UILabel | None = None
@@ -80,7 +81,7 @@ class FinalDecisionView(View):
         )
 
         # Load and display the planet image
-        image_surface = pygame.image.load("assets/images/spaceship/cockpit/red_switch.png").convert_alpha()
+        image_surface = self.game.engine.asset_cache.get_image(self.game.engine.config.final_decision_image_path, alpha=True)
         self.planet_image = pygame_gui.elements.UIImage(
             relative_rect=Rect(20, 30, 240, 240),
             image_surface=image_surface,
@@ -130,40 +131,26 @@ class FinalDecisionView(View):
         self.selected_option = option
         self.kill()
 
-    def run(self) -> int:
-        """Display the menu modally and return the selected option."""
+    def start(self):
+        super().start()
         self.__build_ui()
-        clock = pygame.time.Clock()
-        self.is_running = True
-        last_time: float = 0.0
-        while self.is_running:
-            current_time = time.time()
-            time_delta = clock.tick(self.game.engine.fps) / 1000.0
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.game.stop()
-                    self.is_running = False
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_d:
-                        self.game.debug_manager.toggle_debug_mode()
-                self.pygame_gui_ui_manager.process_events(event)
-            self.pygame_gui_ui_manager.update(time_delta)
-            # Draw the background image covering the window
-            self.game.window.blit(self.background_image, (0, 0))
-            self.pygame_gui_ui_manager.draw_ui(self.game.window)
-            pygame.display.update()
-            # check switch state
-            if sys.platform.startswith("linux") and current_time - last_time >= 2.0:
-                last_time = current_time
-                if self.game.switch_input_manager:
-                    self.game.switch_input_manager.process_events()
-                    if self.game.switch_input_manager.is_button_pressed:
-                        self._set_option(2)
-
-        self.kill()
+        self.last_switch_time = 0.0
+
+    def update(self, delta_time: float):
+        super().update(delta_time)
+        # check switch state
+        current_time = time.time()
+        if sys.platform.startswith("linux") and current_time - self.last_switch_time >= 2.0:
+            self.last_switch_time = current_time
+            if self.game.switch_input_manager:
+                self.game.switch_input_manager.process_events()
+                if self.game.switch_input_manager.is_button_pressed:
+                    self._set_option(2)
+
+    def get_result(self) -> int:
         return self.selected_option
 
-    def kill(self):
+    def _release(self):
         """Clean up all UI elements."""
         self.is_running = False
         if self.title:
@@ -35,9 +35,11 @@ class StoryDecisionView(View):
         self.game = game
         self.is_running: bool = True
         self.selected_option: int = 0
+        # last time the switch was checked
+        self.last_switch_time: float = 0.0
 
         # Load the background image (from planet.background_image)
-        self.background_image = pygame.image.load("assets/images/galaxy/galaxy_01.png").convert_alpha()
+        self.background_image = self.game.engine.asset_cache.get_image("assets/images/galaxy/galaxy_01.png", alpha=True)
 
         ##### UI elements #####
         self.title: UILabel | None = None
@@ -131,41 +133,26 @@ class StoryDecisionView(View):
         self.selected_option = option
         self.kill()
 
-    def run(self) -> int:
-        """Display the menu modally and return the selected option."""
+    def start(self):
+        super().start()
         self.__build_ui()
-        clock = pygame.time.Clock()
-        self.is_running = True
-        last_time: float = 0.0
-
-        while self.is_running:
-            current_time = time.time()
-            time_delta = clock.tick(self.game.engine.fps) / 1000.0
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.game.stop()
-                    self.is_running = False
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_d:
-                        self.game.debug_manager.toggle_debug_mode()
-                self.pygame_gui_ui_manager.process_events(event)
-            self.pygame_gui_ui_manager.update(time_delta)
-            # Draw the background image covering the window
-            self.game.window.blit(self.background_image, (0, 0))
-            self.pygame_gui_ui_manager.draw_ui(self.game.window)
-            pygame.display.update()
-            # check switch state
-            if sys.platform.startswith("linux") and current_time - last_time >= 2.0:
-                last_time = current_time
-                if self.game.switch_input_manager:
-                    self.game.switch_input_manager.process_events()
-                    if self.game.switch_input_manager.is_button_pressed:
-                        self._set_option(2)
-
-        self.kill()
+        self.last_switch_time = 0.0
+
+    def update(self, delta_time: float):
+        super().update(delta_time)
+        # check switch state
+        current_time = time.time()
+        if sys.platform.startswith("linux") and current_time - self.last_switch_time >= 2.0:
+            self.last_switch_time = current_time
+            if self.game.switch_input_manager:
+                self.game.switch_input_manager.process_events()
+                if self.game.switch_input_manager.is_button_pressed:
+                    self._set_option(2)
+
+    def get_result(self) -> int:
         return self.selected_option
 
-    def kill(self):
+    def _release(self):
         """Clean up all UI elements."""
         self.is_running = False
         if self.title:
@@ -2,13 +2,11 @@ from __future__ import annotations
 
 from typing import List, TYPE_CHECKING, Optional
 
-import os
-
 import random
 
 import pygame
 import pygame_gui
-from pygame import Rect
+from pygame import Rect, Surface
 
 from src.components.ui.ui_button import UIButton
 from src.components.ui.ui_label import UILabel
@@ -42,15 +40,9 @@ class EventView(View):
         ##### spaceship window background #####
 
         # select a random spaceship window image
-        spaceship_folder = "assets/images/spaceship/window"
-        spaceship_images = [
-            filename for filename in os.listdir(spaceship_folder)
-            if filename.startswith("spaceship_window") and filename.endswith(".png")
-        ]
-        selected_bg = random.choice(spaceship_images) if spaceship_images else "spaceship_window_01.png"
-        bg_path = os.path.join(spaceship_folder, selected_bg)
-        bg_surface = pygame.image.load(bg_path).convert()
-        bg_surface = pygame.transform.scale(bg_surface, (self.game.engine.width, self.game.engine.height))
+        bg_path = random.choice(self.game.engine.config.event_window_background_paths)
+        bg_surface = self.game.engine.asset_cache.get_scaled_image(bg_path,
+                                                                   (self.game.engine.width, self.game.engine.height))
         self.background_image_ui = pygame_gui.elements.UIImage(
             relative_rect=Rect(0, 0, self.game.engine.width, self.game.engine.height),
             image_surface=bg_surface,
@@ -71,8 +63,8 @@ class EventView(View):
         )
 
         # Load the event card image and scale it preserving aspect ratio with some padding (20px)
-        event_img = pygame.image.load(self.event_card.image).convert_alpha()
-        event_img = self.scale_image_aspect(event_img, panel_width - 150, panel_height - 150)
+        event_img = self.game.engine.asset_cache.get_fitted_image(self.event_card.image,
+                                                                  (panel_width - 150, panel_height - 150), alpha=True)
 
         # Center the scaled event image within the panel
         img_width, img_height = event_img.get_size()
@@ -117,52 +109,21 @@ class EventView(View):
         )
         self.close_button.bind(pygame_gui.UI_BUTTON_PRESSED, lambda: self.kill())
 
-    def run(self):
-        """
-        Display the event overlay until the user clicks on the button
-        """
+    def start(self):
+        super().start()
+        self.event_dismissed = False
         self.__init()
 
-        # Modal loop: wait until the user clicks to dismiss the event overlay
-        clock = pygame.time.Clock()
-        self.event_dismissed = False
-        while not self.event_dismissed:
-            time_delta = clock.tick(self.game.engine.fps) / 1000.0
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.game.stop()
-                    self.event_dismissed = True
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_d:
-                        self.game.debug_manager.toggle_debug_mode()
-                self.pygame_gui_ui_manager.process_events(event)
-
-            self.pygame_gui_ui_manager.update(time_delta)
-            self.game.window.fill((0, 0, 0))
-            self.pygame_gui_ui_manager.draw_ui(self.game.window)
-            pygame.display.update()
-
-        # Clean up the UI elements
-        self.kill()
-
-    def kill(self):
+    def draw_background(self, window: Surface):
+        window.fill((0, 0, 0))
+
+    def is_finished(self) -> bool:
+        # wait until the user clicks to dismiss the event overlay
+        return self.event_dismissed
+
+    def _release(self):
         print("kill method")
         self.event_dismissed = True
         self.event_image_ui.kill()
         self.event_panel.kill()
         self.background_image_ui.kill()
-
-    def scale_image_aspect(self, image: pygame.Surface, max_width: int, max_height: int) -> pygame.Surface:
-        """
-        Scale an image while preserving its aspect ratio.
-
-        :param image: The original pygame.Surface to scale.
-        :param max_width: Maximum allowed width.
-        :param max_height: Maximum allowed height.
-        :return: A new scaled pygame.Surface.
-        """
-        orig_width, orig_height = image.get_size()
-        scale_factor = min(max_width / orig_width, max_height / orig_height)
-        new_width = int(orig_width * scale_factor)
-        new_height = int(orig_height * scale_factor)
-        return pygame.transform.smoothscale(image, (new_width, new_height))
@@ -24,7 +24,7 @@ class EventsActiveView(View):
 
         ##### background image #####
         self.background_image_path = background_image_path
-        self.background_image = pygame.image.load(self.background_image_path).convert()
+        self.background_image = self.game.engine.asset_cache.get_image(self.background_image_path)
 
         self.panel_background = background_panel_image_path
 
@@ -37,9 +37,10 @@ class EventsActiveView(View):
             starting_height=9998
         )
 
-        events_panel_background = pygame.image.load(self.panel_background).convert_alpha()
-        events_panel_background_image = pygame.transform.scale(events_panel_background,
-                                                               (self.game.engine.width, self.game.engine.height))
+        # pre-scaled to the panel size, so the UIImage doesn't have to scale it again on every opening
+        events_panel_background_image = self.game.engine.asset_cache.get_scaled_image(self.panel_background,
+                                                                                      (1300, 600), alpha=True,
+                                                                                      smooth=True)
         self.events_panel_background: UIImage = UIImage(
             relative_rect=Rect(0, 0, 1300, 600),
             manager=self.pygame_gui_ui_manager,
@@ -58,7 +59,7 @@ class EventsActiveView(View):
             container=self.events_panel,
             anchors={"centerx": "centerx", "top": "top"},
         )
-        event_icon = pygame.image.load("assets/icons/event_icon_original.png").convert_alpha()
+        event_icon = self.game.engine.asset_cache.get_image(self.game.engine.config.event_icon_path, alpha=True)
         self.event_icon: UIImage = UIImage(
             container=self.events_panel,
             relative_rect=Rect(-175, 3, 64, 64),
@@ -120,7 +121,7 @@ class EventsActiveView(View):
                 starting_height=9999
             )
 
-            event_icon_surface = pygame.image.load(event_card.icon).convert_alpha()
+            event_icon_surface = self.game.engine.asset_cache.get_image(event_card.icon, alpha=True)
             event_icon = UIImage(
                 relative_rect=Rect(10, 10, 100, 100),
                 image_surface=event_icon_surface,
@@ -175,29 +176,14 @@ class EventsActiveView(View):
         self.game.event_manager.is_open = False
         self.kill()
 
-    def run(self):
+    def start(self):
+        super().start()
         self.__build_ui()
-        clock = pygame.time.Clock()
-        self.is_running = True
-
-        while self.is_running and self.game.event_manager.is_open:
-            time_delta = clock.tick(self.game.engine.fps) / 1000.0
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.game.stop()
-                    self.is_running = False
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_d:
-                        self.game.debug_manager.toggle_debug_mode()
-                self.pygame_gui_ui_manager.process_events(event)
-            self.pygame_gui_ui_manager.update(time_delta)
-            # Draw the background image covering the window
-            self.game.window.blit(self.background_image, (0, 0))
-            self.pygame_gui_ui_manager.draw_ui(self.game.window)
-            pygame.display.update()
-        self.kill()
 
-    def kill(self):
+    def is_finished(self) -> bool:
+        return not self.is_running or not self.game.event_manager.is_open
+
+    def _release(self):
         if self.events_panel:
             self.events_panel.kill()
         if self.events_panel_background:
@@ -2,9 +2,8 @@ from __future__ import annotations
 
 import copy
 from typing import TYPE_CHECKING
-import pygame
 import pygame_gui
-from pygame import Rect
+from pygame import Rect, Surface
 from pygame_gui.elements import UIImage
 
 from src.components.ui.ui_button import UIButton
@@ -25,13 +24,13 @@ class InventoryView(View):
 
         ##### background image #####
         self.background_image_path = background_image_path
-        self.background_image = pygame.image.load(self.background_image_path).convert()
+        self.background_image = self.game.engine.asset_cache.get_image(self.background_image_path)
 
         self.panel_background = background_panel_image_path
 
         self.empty_slot_path = empty_place_path
-        self.inventory_empty_slot = pygame.image.load(self.empty_slot_path)
-        self.inventory_empty_slot = pygame.transform.scale(self.inventory_empty_slot, (100, 100))
+        self.inventory_empty_slot = self.game.engine.asset_cache.get_scaled_image(self.empty_slot_path, (100, 100),
+                                                                                  alpha=True)
 
     def __build_ui(self):
         self.inventory_panel: UIPanel = UIPanel(
@@ -41,9 +40,10 @@ class InventoryView(View):
             object_id="panel_invisible",
             starting_height=9999
         )
-        inventory_panel_background = pygame.image.load(self.panel_background).convert_alpha()
-        inventory_panel_background_image = pygame.transform.scale(inventory_panel_background,
-                                                                  (self.game.engine.width, self.game.engine.height))
+        # pre-scaled to the panel size, so the UIImage doesn't have to scale it again on every opening
+        inventory_panel_background_image = self.game.engine.asset_cache.get_scaled_image(self.panel_background,
+                                                                                         (700, 480), alpha=True,
+                                                                                         smooth=True)
         self.inventory_panel_background: UIImage = UIImage(
             relative_rect=Rect(0, 0, 700, 480),
             manager=self.pygame_gui_ui_manager,
@@ -63,7 +63,7 @@ class InventoryView(View):
             container=self.inventory_panel,
             anchors={"centerx": "centerx", "top": "top"},
         )
-        inventory_icon = pygame.image.load("assets/icons/inventory_icon_original.png").convert_alpha()
+        inventory_icon = self.game.engine.asset_cache.get_image(self.game.engine.config.inventory_icon_path, alpha=True)
 
         self.inventory_icon: UIImage = UIImage(
             container=self.inventory_panel,
@@ -113,8 +113,8 @@ class InventoryView(View):
                 y_pos = start_y + row * height_spacing
                 if len(game_objects) != 0:
                     if game_objects[0].image_path is not None:
-                        object_slot = pygame.image.load(game_objects[0].image_path)
-                        object_slot = pygame.transform.scale(object_slot, (100, 100))
+                        object_slot = self.game.engine.asset_cache.get_scaled_image(game_objects[0].image_path,
+                                                                                    (100, 100), alpha=True)
                         self.game.window.blit(object_slot , (x_pos, y_pos))
                         game_objects.pop(0)
                 else:
@@ -127,30 +127,18 @@ class InventoryView(View):
         self.game.inventory_manager.is_open = False
         self.kill()
 
-    def run(self):
+    def start(self):
+        super().start()
         self.__build_ui()
-        clock = pygame.time.Clock()
-        self.is_running = True
-
-        while self.is_running and self.game.inventory_manager.is_open:
-            time_delta = clock.tick(self.game.engine.fps) / 1000.0
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.game.stop()
-                    self.is_running = False
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_d:
-                        self.game.debug_manager.toggle_debug_mode()
-                self.pygame_gui_ui_manager.process_events(event)
-            self.pygame_gui_ui_manager.update(time_delta)
-            # Draw the background image covering the window
-            self.game.window.blit(self.background_image, (0, 0))
-            self.pygame_gui_ui_manager.draw_ui(self.game.window)
-            self.__draw_inventory_objects()
-            pygame.display.update()
-        self.kill()
 
-    def kill(self):
+    def draw(self, window: Surface):
+        super().draw(window)
+        self.__draw_inventory_objects()
+
+    def is_finished(self) -> bool:
+        return not self.is_running or not self.game.inventory_manager.is_open
+
+    def _release(self):
         if self.inventory_panel:
             self.inventory_panel.kill()
         if self.inventory_panel_background:
@@ -1,15 +1,17 @@
 import pygame
 import pygame_gui
-from pygame import Clock, Surface
+from pygame import Surface
 from pygame_gui.elements import UIButton
 
 from src.components.ui.ui_label import UILabel
+from src.plugins.asset_cache import AssetCache
+from src.plugins.frame_governor import FrameGovernor
 from src.star_config import StarConfig
 from src.views.view import View
 
 
 class MainMenu(View):
-    def __init__(self, pygame_gui_ui_manager: pygame_gui.UIManager, config: StarConfig):
+    def __init__(self, pygame_gui_ui_manager: pygame_gui.UIManager, config: StarConfig, asset_cache: AssetCache):
         super().__init__(pygame_gui_ui_manager)
         self.is_running = True
         self.start_story_game = False
@@ -17,7 +19,7 @@ class MainMenu(View):
         self.text: UILabel | None = None
         self.config: StarConfig = config
 
-        self.background_image = pygame.image.load(self.config.main_menu_background_image).convert()
+        self.background_image = asset_cache.get_image(self.config.main_menu_background_image)
 
     def __build_ui(self):
 
@@ -40,7 +42,7 @@ class MainMenu(View):
         )
         self.start_button.bind(pygame_gui.UI_BUTTON_PRESSED, lambda: self.start())
 
-    def kill(self):
+    def _release(self):
         self.is_running = False
         self.title.kill()
         self.start_button.kill()
@@ -48,10 +50,10 @@ class MainMenu(View):
     def start(self):
         self.start_story_game = True
 
-    def run(self, surface: Surface, clock: Clock, fps: int) -> int | None:
+    def run(self, surface: Surface, frame_governor: FrameGovernor) -> int | None:
         self.__build_ui()
         while self.is_running:
-            time_delta = clock.tick(fps) / 1000.0  # limit to 60 FPS (defined in star_config)
+            time_delta = frame_governor.tick()  # limit to 60 FPS (defined in star_config), lower while idle
             if self.start_story_game:
                 self.kill()
                 return 1
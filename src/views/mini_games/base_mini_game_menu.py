@@ -1,6 +1,5 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Tuple
-import pygame
 import pygame_gui
 from pygame import Rect, Surface
 from pygame_gui.elements import UIImage
@@ -22,7 +21,7 @@ class BaseMiniGameMenu(View):
         self.game: StoryGame = game
 
         # Load the background image (from star_config mini_game_system)
-        self.background_image: Surface = pygame.image.load(background_path).convert()
+        self.background_image: Surface = self.game.engine.asset_cache.get_image(background_path)
 
         self.title_text: str = title_text
         self.description_text: str = description_text
@@ -76,28 +75,11 @@ class BaseMiniGameMenu(View):
         )
         self.confirm_button.bind(pygame_gui.UI_BUTTON_PRESSED, lambda event: self.kill())
 
-    def run(self):
+    def start(self):
+        super().start()
         self.__build_ui()
-        clock = pygame.time.Clock()
-        self.is_running = True
-        while self.is_running:
-            time_delta = clock.tick(self.game.engine.fps) / 1000.0
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.game.stop()
-                    self.is_running = False
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_d:
-                        self.game.debug_manager.toggle_debug_mode()
-                self.pygame_gui_ui_manager.process_events(event)
-            self.pygame_gui_ui_manager.update(time_delta)
-            # Draw the background image covering the window
-            self.game.window.blit(self.background_image, (0, 0))
-            self.pygame_gui_ui_manager.draw_ui(self.game.window)
-            pygame.display.update()
-        self.kill()
 
-    def kill(self):
+    def _release(self):
         """Clean up all UI elements."""
         self.is_running = False
         if self.title:
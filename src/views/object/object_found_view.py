@@ -1,9 +1,8 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
-import pygame
 import pygame_gui
-from pygame import Rect
+from pygame import Rect, Surface
 
 from src.components.ui.ui_button import UIButton
 from src.components.ui.ui_label import UILabel
@@ -27,13 +26,13 @@ class ObjectFoundView(View):
         self.game_object: GameObject = game_object
 
         # get the object image
-        self.object_image_surface = pygame.image.load(self.game_object.image_path).convert_alpha()
+        self.object_image_surface = self.game.engine.asset_cache.get_image(self.game_object.image_path, alpha=True)
 
         # Load the background image (default from planet.background_image) override from object
         background_image_path = self.planet.background_image
         if self.game_object.background_image is not None:
             background_image_path = self.game_object.background_image
-        self.background_image_surface = pygame.image.load(background_image_path).convert()
+        self.background_image_surface = self.game.engine.asset_cache.get_image(background_image_path)
 
         self.title_text = f"{self.game_object.name} erhalten!"
 
@@ -107,29 +106,14 @@ class ObjectFoundView(View):
 
 
 
-    def run(self) -> int:
-        """Display the menu and return the selected option."""
+    def start(self):
+        super().start()
         self.__build_ui()
-        clock = pygame.time.Clock()
-        self.is_running = True
-        while self.is_running:
-            time_delta = clock.tick(self.game.engine.fps) / 1000.0
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.game.stop()
-                    self.is_running = False
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_d:
-                        self.game.debug_manager.toggle_debug_mode()
-                self.pygame_gui_ui_manager.process_events(event)
-            self.pygame_gui_ui_manager.update(time_delta)
-            # Draw the background image covering the window
-            self.game.window.blit(self.background_image_surface, (0, 0))
-            self.pygame_gui_ui_manager.draw_ui(self.game.window)
-            pygame.display.update()
-        self.kill()
-
-    def kill(self):
+
+    def draw_background(self, window: Surface):
+        window.blit(self.background_image_surface, (0, 0))
+
+    def _release(self):
         """Clean up all UI elements."""
         self.is_running = False
         if self.planet_title:
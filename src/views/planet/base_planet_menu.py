@@ -1,6 +1,5 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Tuple
-import pygame
 import pygame_gui
 from pygame import Rect
 from pygame_gui.elements import UIImage
@@ -37,7 +36,7 @@ class BasePlanetMenu(View):
         self.selected_option: int = 0
 
         # Load the background image (from planet.background_image)
-        self.background_image = pygame.image.load(self.planet.background_image).convert()
+        self.background_image = self.game.engine.asset_cache.get_image(self.planet.background_image)
 
         ##### UI elements #####
         self.title: UILabel | None = None
@@ -80,7 +79,7 @@ class BasePlanetMenu(View):
         )
 
         # Load and display the planet image
-        image_surface = pygame.image.load(self.planet.planet_image).convert()
+        image_surface = self.game.engine.asset_cache.get_image(self.planet.planet_image)
         self.planet_image = pygame_gui.elements.UIImage(
             relative_rect=Rect(20, 30, 240, 240),
             image_surface=image_surface,
@@ -129,30 +128,14 @@ class BasePlanetMenu(View):
         self.selected_option = option
         self.kill()
 
-    def run(self) -> int:
-        """Display the menu modally and return the selected option."""
+    def start(self):
+        super().start()
         self.__build_ui()
-        clock = pygame.time.Clock()
-        self.is_running = True
-        while self.is_running:
-            time_delta = clock.tick(self.game.engine.fps) / 1000.0
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.game.stop()
-                    self.is_running = False
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_d:
-                        self.game.debug_manager.toggle_debug_mode()
-                self.pygame_gui_ui_manager.process_events(event)
-            self.pygame_gui_ui_manager.update(time_delta)
-            # Draw the background image covering the window
-            self.game.window.blit(self.background_image, (0, 0))
-            self.pygame_gui_ui_manager.draw_ui(self.game.window)
-            pygame.display.update()
-        self.kill()
+
+    def get_result(self) -> int:
         return self.selected_option
 
-    def kill(self):
+    def _release(self):
         """Clean up all UI elements."""
         self.is_running = False
         if self.title:
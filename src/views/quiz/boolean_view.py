@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import random
 
-import pygame
 import pygame_gui
 from pygame import Rect
 
@@ -34,7 +33,7 @@ class BooleanView(View):
         # Load a background image
         backgrounds = self.game.engine.config.quiz_backgrounds
         chosen_image: str = random.choice(backgrounds)
-        self.background_image = pygame.image.load(chosen_image).convert()
+        self.background_image = self.game.engine.asset_cache.get_image(chosen_image)
 
         # UI element placeholders
         self.panel_bg: UIPanel | None = None
@@ -104,27 +103,9 @@ class BooleanView(View):
         )
         self.true_button.bind(pygame_gui.UI_BUTTON_PRESSED, lambda event: self.submit(True))
 
-    def run(self) -> None:
-        """
-        Display the view in its own game loop until the user confirms their answer.
-        """
+    def start(self):
+        super().start()
         self.build_ui()
-        clock = pygame.time.Clock()
-        self.is_running = True
-        while self.is_running:
-            time_delta = clock.tick(self.game.engine.fps) / 1000.0
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.game.stop()
-                    self.is_running = False
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_d:
-                    self.game.debug_manager.toggle_debug_mode()
-                self.pygame_gui_ui_manager.process_events(event)
-            self.pygame_gui_ui_manager.update(time_delta)
-            self.game.window.blit(self.background_image, (0, 0))
-            self.pygame_gui_ui_manager.draw_ui(self.game.window)
-            pygame.display.update()
-        self.kill()
 
     def submit(self, user_answer: bool) -> None:
         """
@@ -134,7 +115,7 @@ class BooleanView(View):
         self.pygame_gui_ui_manager.set_focus_set(None)
         self.is_running = False
 
-    def kill(self) -> None:
+    def _release(self) -> None:
         """
         Clean up and remove all UI elements.
         """
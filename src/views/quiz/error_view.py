@@ -24,7 +24,7 @@ class ErrorView(View):
         self.is_running: bool = True
 
         # Load a common background image (using the main menu background image)
-        self.background_image = pygame.image.load("assets/images/spaceship/classroom/spaceship_classroom_01.png").convert()
+        self.background_image = self.game.engine.asset_cache.get_image(self.game.engine.config.quiz_error_background_path)
 
         # title
         self.title_text = "Nachhilfeunterricht"
@@ -78,32 +78,16 @@ class ErrorView(View):
         self.confirm_button.bind(pygame_gui.UI_BUTTON_PRESSED, lambda event: self.kill())
 
 
-    def run(self) -> None:
-        """
-        Display the view in its own game loop until the user confirms their answer.
-        """
+    def start(self):
+        super().start()
         self.build_ui()
-        clock = pygame.time.Clock()
-        self.is_running = True
-        while self.is_running:
-            time_delta = clock.tick(self.game.engine.fps) / 1000.0
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.game.stop()
-                    self.is_running = False
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_d:
-                    self.game.debug_manager.toggle_debug_mode()
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
-                    self.kill()
-                self.pygame_gui_ui_manager.process_events(event)
-            self.pygame_gui_ui_manager.update(time_delta)
-            self.game.window.blit(self.background_image, (0, 0))
-            self.pygame_gui_ui_manager.draw_ui(self.game.window)
-            pygame.display.update()
-        self.kill()
-
-
-    def kill(self) -> None:
+
+    def handle_event(self, event: pygame.event.Event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
+            self.kill()
+        super().handle_event(event)
+
+    def _release(self) -> None:
         self.pygame_gui_ui_manager.set_focus_set(None)
         self.is_running = False
         if self.panel_bg:
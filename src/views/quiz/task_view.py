@@ -33,7 +33,7 @@ class TaskView(View):
         # Load a background image
         backgrounds = self.game.engine.config.quiz_backgrounds
         chosen_image: str = random.choice(backgrounds)
-        self.background_image = pygame.image.load(chosen_image).convert()
+        self.background_image = self.game.engine.asset_cache.get_image(chosen_image)
 
         # UI element placeholders
         self.panel_bg: UIPanel | None = None
@@ -122,30 +122,15 @@ class TaskView(View):
         )
         self.confirm_button.bind(pygame_gui.UI_BUTTON_PRESSED, lambda event: self.submit())
 
-    def run(self) -> None:
-        """
-        Display the view in its own game loop until the user confirms their answer.
-        """
+    def start(self):
+        super().start()
         self.build_ui()
         self.pygame_gui_ui_manager.set_focus_set(self.input_field)
-        clock = pygame.time.Clock()
-        self.is_running = True
-        while self.is_running:
-            time_delta = clock.tick(self.game.engine.fps) / 1000.0
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.game.stop()
-                    self.is_running = False
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_d:
-                    self.game.debug_manager.toggle_debug_mode()
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
-                    self.submit()
-                self.pygame_gui_ui_manager.process_events(event)
-            self.pygame_gui_ui_manager.update(time_delta)
-            self.game.window.blit(self.background_image, (0, 0))
-            self.pygame_gui_ui_manager.draw_ui(self.game.window)
-            pygame.display.update()
-        self.kill()
+
+    def handle_event(self, event: pygame.event.Event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
+            self.submit()
+        super().handle_event(event)
 
     def submit(self) -> None:
         """
@@ -158,7 +143,7 @@ class TaskView(View):
         self.pygame_gui_ui_manager.set_focus_set(None)
         self.is_running = False
 
-    def kill(self) -> None:
+    def _release(self) -> None:
         """
         Clean up and remove all UI elements.
         """
@@ -1,6 +1,5 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
-import pygame
 import pygame_gui
 from pygame import Rect
 
@@ -20,7 +19,7 @@ class BaseStateView(View):
         self.title_text = "game over!"
         
         # Load the background image
-        self.background_image = pygame.image.load(backround_image_path).convert()
+        self.background_image = self.game.engine.asset_cache.get_image(backround_image_path)
         
     
     def __build_ui(self):
@@ -40,27 +39,9 @@ class BaseStateView(View):
 
 
         
-    def run(self):
+    def start(self):
+        super().start()
         self.__build_ui()
-        clock = pygame.time.Clock()
-        self.is_running = True
-        while self.is_running:
-            time_delta = clock.tick(self.game.engine.fps) / 1000.0
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.game.stop()
-                    self.is_running = False
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_d:
-                        self.game.debug_manager.toggle_debug_mode()
-                        
-                self.pygame_gui_ui_manager.process_events(event)
-            self.pygame_gui_ui_manager.update(time_delta)
-            # Draw the background image covering the window
-            self.game.window.blit(self.background_image, (0, 0))
-            self.pygame_gui_ui_manager.draw_ui(self.game.window)
-            pygame.display.update()
-        self.kill()
 
     def _stop(self):
         self.is_running = False
@@ -70,7 +51,7 @@ class BaseStateView(View):
         self.is_running = False
         self.game.restart()
     
-    def kill(self):
+    def _release(self):
         self.confirm_button.kill()
         
         
@@ -1,6 +1,5 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
-import pygame
 import pygame_gui
 from pygame import Rect
 from src.components.ui.ui_label import UILabel
@@ -32,7 +31,7 @@ class StoryView(View):
         self.selected_option: int = 0
 
         # Load the background image (from planet.background_image)
-        self.background_image = pygame.image.load(self.planet.background_image).convert()
+        self.background_image = self.game.engine.asset_cache.get_image(self.planet.background_image)
 
         # UI element placeholders
         self.title: UILabel | None = None
@@ -90,7 +89,7 @@ class StoryView(View):
                 portrait_path = self.game.engine.config.portrait_victor
 
         if len(portrait_path) > 0:
-            image_surface = pygame.image.load(portrait_path).convert_alpha()
+            image_surface = self.game.engine.asset_cache.get_image(portrait_path, alpha=True)
             self.story_image = UILargeLeftImage(self.pygame_gui_ui_manager, self.panel, image_surface)
         # self.story_image = pygame_gui.elements.UIImage(
         ##     relative_rect=Rect(20, 30, 240, 255),
@@ -139,30 +138,14 @@ class StoryView(View):
         self.selected_option = option
         self.kill()
 
-    def run(self) -> int:
-        """Display the menu and return the selected option."""
+    def start(self):
+        super().start()
         self.__build_ui()
-        clock = pygame.time.Clock()
-        self.is_running = True
-        while self.is_running:
-            time_delta = clock.tick(self.game.engine.fps) / 1000.0
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.game.stop()
-                    self.is_running = False
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_d:
-                        self.game.debug_manager.toggle_debug_mode()
-                self.pygame_gui_ui_manager.process_events(event)
-            self.pygame_gui_ui_manager.update(time_delta)
-            # Draw the background image covering the window
-            self.game.window.blit(self.background_image, (0, 0))
-            self.pygame_gui_ui_manager.draw_ui(self.game.window)
-            pygame.display.update()
-        self.kill()
+
+    def get_result(self) -> int:
         return self.selected_option
 
-    def kill(self):
+    def _release(self):
         """Clean up all UI elements."""
         self.is_running = False
         if self.title:
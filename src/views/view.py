@@ -1,12 +1,61 @@
 from abc import ABC, abstractmethod
 
+import pygame
 import pygame_gui
+from pygame import Surface
 
+from src.scenes.scene import Scene
+
+
+class View(Scene, ABC):
+    """
+    base class for views, a view is a scene showing pygame_gui elements over a background image.
+    it is finished as soon as is_running is reset, usually by kill.
+    views kill themselves when an option is chosen and the engine kills them again when they are popped,
+    kill only releases the view once per start (see _release).
+    """
 
-class View(ABC):
     def __init__(self, ui_manager: pygame_gui.UIManager):
         self.pygame_gui_ui_manager = ui_manager
+        self.is_running: bool = False
+        self.is_killed: bool = False
+
+    def start(self):
+        self.is_running = True
+        self.is_killed = False
+
+    def handle_event(self, event: pygame.event.Event):
+        self.pygame_gui_ui_manager.process_events(event)
+
+    def update(self, delta_time: float):
+        self.pygame_gui_ui_manager.update(delta_time)
+
+    def draw(self, window: Surface):
+        self.draw_background(window)
+        self.pygame_gui_ui_manager.draw_ui(window)
+
+    def draw_background(self, window: Surface):
+        """
+        Draw the background image covering the window.
+        :param window: The target surface.
+        """
+        window.blit(self.background_image, (0, 0))
+
+    def is_finished(self) -> bool:
+        return not self.is_running
 
-    @abstractmethod
     def kill(self):
-        pass
\ No newline at end of file
+        """
+        Release the ui elements of the view, further calls are ignored until the view is started again.
+        """
+        if self.is_killed:
+            return
+        self.is_killed = True
+        self._release()
+
+    @abstractmethod
+    def _release(self):
+        """
+        Kill the ui elements of the view, called once by kill.
+        """
+        pass